@@ -2,9 +2,15 @@
 # =====================================================================
 # JetKVM Home Assistant API Setup
 # =====================================================================
-# Installs a lightweight nc-based HTTP server on the JetKVM device
-# that exposes system data (temperature, uptime, etc.) as JSON
-# endpoints for the Home Assistant JetKVM integration.
+# Installs a lightweight HTTP server on the JetKVM device that exposes
+# system data (temperature, uptime, etc.) as JSON endpoints for the
+# Home Assistant JetKVM integration.
+#
+# Server modes (picked automatically, override with --mode):
+#   tcpsvd         BusyBox tcpsvd keeps port 8800 open and forks the
+#                  handler per connection (concurrent, preferred)
+#   nc-persistent  nc -ll -e, same idea when tcpsvd is not available
+#   nc             legacy single-shot nc, respawned after every request
 #
 # The server is supervised by a watchdog that auto-restarts on crash
 # and uses setsid to survive SSH session disconnects.
@@ -24,13 +30,21 @@
 #   http://<jetkvm-ip>:8800/version
 #   http://<jetkvm-ip>:8800/temperature
 #   http://<jetkvm-ip>:8800/device_info
+#   http://<jetkvm-ip>:8800/metrics
+#   http://<jetkvm-ip>:8800/inventory
+#
+# Force a server mode:
+#   sh /tmp/api-setup.sh --mode tcpsvd|nc-persistent|nc
+#
+# Cache volatile /device_info fields for N seconds (default 10, 0 = off):
+#   sh /tmp/api-setup.sh --cache-ttl N
 #
 # To uninstall:
 #   sh /tmp/api-setup.sh --uninstall
 #   (or: sh /opt/ha-api/uninstall.sh)
 # =====================================================================
 
-API_VERSION="1.1.1"
+API_VERSION="1.7.0"
 API_PORT=8800
 BASE_DIR="/opt/ha-api"
 VERSION_FILE="${BASE_DIR}/version"
@@ -41,8 +55,47 @@ PID_FILE="${BASE_DIR}/watchdog.pid"
 UPDATER_PID_FILE="${BASE_DIR}/updater.pid"
 LOG_FILE="${BASE_DIR}/server.log"
 UNINSTALL_SCRIPT="${BASE_DIR}/uninstall.sh"
+BENCH_SCRIPT="${BASE_DIR}/bench.sh"
 SETUP_URL="https://raw.githubusercontent.com/Poshy163/HomeAssistant-JetKVM/main/api-setup.sh"
 UPDATE_INTERVAL=3600
+SERVER_MODE="${API_SERVER_MODE:-auto}"
+MAX_CONNECTIONS=16
+CACHE_TTL="${API_CACHE_TTL:-10}"
+CACHE_DIR="/tmp/ha-api"
+KEEPALIVE_TIMEOUT=75
+KEEPALIVE_MAX=100
+
+# =====================================================================
+# Arguments
+# =====================================================================
+DO_UNINSTALL=0
+while [ $# -gt 0 ]; do
+    case "$1" in
+        --uninstall) DO_UNINSTALL=1 ;;
+        --mode) shift; SERVER_MODE="$1" ;;
+        --mode=*) SERVER_MODE="${1#--mode=}" ;;
+        --cache-ttl) shift; CACHE_TTL="$1" ;;
+        --cache-ttl=*) CACHE_TTL="${1#--cache-ttl=}" ;;
+        *) echo "WARNING: ignoring unknown argument: $1" ;;
+    esac
+    shift
+done
+
+case "$SERVER_MODE" in
+    auto|tcpsvd|nc-persistent|nc) ;;
+    *)
+        echo "ERROR: unknown server mode '$SERVER_MODE' (expected auto, tcpsvd, nc-persistent or nc)"
+        exit 1
+        ;;
+esac
+# What was asked for, before "auto" is resolved; the updater passes it
+# back in so a forced mode survives auto-updates
+REQUESTED_MODE="$SERVER_MODE"
+
+# Validate /device_info cache TTL (seconds, 0 disables caching)
+case "$CACHE_TTL" in
+    ''|*[!0-9]*) CACHE_TTL=10 ;;
+esac
 
 # Validate updater interval (seconds)
 case "$UPDATE_INTERVAL" in
@@ -55,7 +108,7 @@ fi
 # =====================================================================
 # Uninstall
 # =====================================================================
-if [ "$1" = "--uninstall" ]; then
+if [ "$DO_UNINSTALL" = "1" ]; then
     echo "=== Uninstalling JetKVM HA API ==="
 
     # Stop updater
@@ -67,7 +120,7 @@ if [ "$1" = "--uninstall" ]; then
         rm -f "$UPDATER_PID_FILE"
     fi
 
-    # Stop watchdog (kills nc children too)
+    # Stop watchdog (kills server children too)
     if [ -f "$PID_FILE" ]; then
         WPID=$(cat "$PID_FILE")
         kill "$WPID" 2>/dev/null
@@ -82,7 +135,7 @@ if [ "$1" = "--uninstall" ]; then
     done
 
     # Remove files
-    rm -rf "$BASE_DIR"
+    rm -rf "$BASE_DIR" "$CACHE_DIR"
 
     # Remove from rc.local (current and legacy entries)
     if [ -f /etc/rc.local ]; then
@@ -128,6 +181,18 @@ rm -f "${BASE_DIR}/server.sh" "${BASE_DIR}/fifo" "${BASE_DIR}/server.pid"
 rm -rf "${BASE_DIR}/www" "${BASE_DIR}/config.sh"
 sleep 1
 
+# =====================================================================
+# Detect a persistent TCP server (BusyBox tcpsvd)
+# =====================================================================
+echo "Checking for tcpsvd..."
+TCPSVD_CMD=""
+if command -v tcpsvd >/dev/null 2>&1; then
+    TCPSVD_CMD="tcpsvd"
+elif busybox --list 2>/dev/null | grep -q "^tcpsvd$"; then
+    TCPSVD_CMD="busybox tcpsvd"
+fi
+echo "  Found: ${TCPSVD_CMD:-(none)}"
+
 # =====================================================================
 # Check that nc is available
 # =====================================================================
@@ -139,31 +204,82 @@ elif busybox nc --help >/dev/null 2>&1; then
     NC_CMD="busybox nc"
 fi
 
-if [ -z "$NC_CMD" ]; then
-    echo "ERROR: Cannot find nc (netcat) on this device."
+if [ -z "$NC_CMD" ] && [ -z "$TCPSVD_CMD" ]; then
+    echo "ERROR: Cannot find nc (netcat) or tcpsvd on this device."
     echo "  which nc: $(which nc 2>&1)"
     echo "  busybox --list | grep nc:"
     busybox --list 2>&1 | grep "^nc$" || echo "    (none)"
     exit 1
 fi
-echo "  Found: $NC_CMD"
+echo "  Found: ${NC_CMD:-(none)}"
 
-# Check if nc supports -e (execute) flag
-echo '#!/bin/sh' > /tmp/_nc_test_handler.sh
-echo 'echo test' >> /tmp/_nc_test_handler.sh
-chmod +x /tmp/_nc_test_handler.sh
-
-# Test nc -e support by trying to listen briefly
 NC_HAS_E=0
-$NC_CMD -l -p 18899 -e /tmp/_nc_test_handler.sh &
-NC_TEST_PID=$!
-sleep 1
-if kill -0 "$NC_TEST_PID" 2>/dev/null; then
-    NC_HAS_E=1
-    kill "$NC_TEST_PID" 2>/dev/null
+NC_HAS_LL=0
+if [ -n "$NC_CMD" ]; then
+    # Check if nc supports -e (execute) flag
+    echo '#!/bin/sh' > /tmp/_nc_test_handler.sh
+    echo 'echo test' >> /tmp/_nc_test_handler.sh
+    chmod +x /tmp/_nc_test_handler.sh
+
+    # Test nc -e support by trying to listen briefly
+    $NC_CMD -l -p 18899 -e /tmp/_nc_test_handler.sh &
+    NC_TEST_PID=$!
+    sleep 1
+    if kill -0 "$NC_TEST_PID" 2>/dev/null; then
+        NC_HAS_E=1
+        kill "$NC_TEST_PID" 2>/dev/null
+    fi
+
+    # Test nc -ll (keep listening after a connection). A single-shot
+    # listener exits once the probe connection below is served.
+    if [ "$NC_HAS_E" = "1" ]; then
+        $NC_CMD -ll -p 18899 -e /tmp/_nc_test_handler.sh >/dev/null 2>&1 &
+        NC_TEST_PID=$!
+        sleep 1
+        if kill -0 "$NC_TEST_PID" 2>/dev/null; then
+            $NC_CMD -w 2 127.0.0.1 18899 </dev/null >/dev/null 2>&1
+            sleep 1
+            if kill -0 "$NC_TEST_PID" 2>/dev/null; then
+                NC_HAS_LL=1
+            fi
+            kill "$NC_TEST_PID" 2>/dev/null
+        fi
+    fi
+    rm -f /tmp/_nc_test_handler.sh
+    echo "  nc -e support: $([ "$NC_HAS_E" = "1" ] && echo "yes" || echo "no (will use pipe mode)")"
+    echo "  nc -ll support: $([ "$NC_HAS_LL" = "1" ] && echo "yes" || echo "no")"
+fi
+
+# =====================================================================
+# Pick the server mode
+# =====================================================================
+if [ "$SERVER_MODE" = "auto" ]; then
+    if [ -n "$TCPSVD_CMD" ]; then
+        SERVER_MODE="tcpsvd"
+    elif [ "$NC_HAS_LL" = "1" ]; then
+        SERVER_MODE="nc-persistent"
+    else
+        SERVER_MODE="nc"
+    fi
+fi
+case "$SERVER_MODE" in
+    tcpsvd)
+        [ -z "$TCPSVD_CMD" ] && { echo "ERROR: --mode tcpsvd requested but tcpsvd is not available."; exit 1; }
+        ;;
+    nc-persistent)
+        [ "$NC_HAS_LL" != "1" ] && { echo "ERROR: --mode nc-persistent requested but nc does not support -ll -e."; exit 1; }
+        ;;
+    nc)
+        [ -z "$NC_CMD" ] && { echo "ERROR: --mode nc requested but nc is not available."; exit 1; }
+        ;;
+esac
+echo "  Server mode: $SERVER_MODE"
+
+# Single-shot nc cannot accept anyone else while a connection is open,
+# so HTTP keep-alive is only offered by the persistent modes.
+if [ "$SERVER_MODE" = "nc" ]; then
+    KEEPALIVE_TIMEOUT=0
 fi
-rm -f /tmp/_nc_test_handler.sh
-echo "  nc -e support: $([ "$NC_HAS_E" = "1" ] && echo "yes" || echo "no (will use pipe mode)")"
 
 # =====================================================================
 # Create directory
@@ -171,170 +287,513 @@ echo "  nc -e support: $([ "$NC_HAS_E" = "1" ] && echo "yes" || echo "no (will u
 mkdir -p "$BASE_DIR"
 echo "$API_VERSION" > "$VERSION_FILE"
 
+# Keep the handler being replaced so bench.sh can compare before/after
+if [ -f "$HANDLER_SCRIPT" ]; then
+    cp "$HANDLER_SCRIPT" "${BASE_DIR}/handler.prev.sh"
+fi
+
 # =====================================================================
 # Request handler script
 # =====================================================================
 cat << 'HANDLER' > "$HANDLER_SCRIPT"
 #!/bin/sh
+# Request handler. Kept fork-free where possible: the device SoC is
+# tiny, so every request uses shell builtins plus at most one awk.
+#
+# Responses are assembled from cached JSON fragments:
+#   static.json  identity, kernel and api_version — built once when the
+#                watchdog starts (handler.sh --refresh-static)
+#   cold.json    IP address and disk usage (runs df) — rebuilt at most
+#                every CACHE_TTL seconds
+#   hot.json     temperature, uptime, mem, load, link — rebuilt at most
+#                every CACHE_TTL seconds
+#
+#   /metrics      hot                  (polled every cycle)
+#   /inventory    static + cold        (polled every few cycles)
+#   /device_info  static + cold + hot  (everything, one request)
+#
+# The static and cold fragments carry a content hash; /inventory sends
+# them as an ETag and answers a matching If-None-Match with a bodyless
+# 304 Not Modified.  The hot fields (uptime, free memory) differ on every
+# rebuild, so /metrics and /device_info are always sent in full.
+
+# Byte-oriented string lengths (Content-Length) and awk string handling
+LC_ALL=C
+export LC_ALL
+
+CACHE_TTL=10
+CACHE_DIR="/tmp/ha-api"
+KEEPALIVE_TIMEOUT=0
+KEEPALIVE_MAX=100
+[ -f /opt/ha-api/config.sh ] && . /opt/ha-api/config.sh
+STATIC_CACHE="${CACHE_DIR}/static.json"
+COLD_CACHE="${CACHE_DIR}/cold.json"
+HOT_CACHE="${CACHE_DIR}/hot.json"
+
+# Helpers shared by the awk programs below. JSON escaping happens in
+# awk so no per-field sed/tr pipelines are needed.
+AWK_LIB='
+function esc(s) {
+    gsub(/\\/, "\\\\", s)
+    gsub(/"/, "\\\"", s)
+    gsub(/\t/, "\\t", s)
+    gsub(/[[:cntrl:]]/, "", s)
+    return s
+}
+function first_line(f,    line) {
+    line = ""
+    if ((getline line < f) <= 0) line = ""
+    close(f)
+    return line
+}
+function num(v) {
+    return (v ~ /^[0-9]+(\.[0-9]+)?$/) ? v : 0
+}
+function pct(used, total) {
+    if (total <= 0) return "0.0"
+    return sprintf("%.1f", int(used * 1000 / total) / 10)
+}
+function hex_ip(h,    i, d, out) {
+    # /proc/net/route stores addresses as little-endian hex
+    out = ""
+    for (i = 7; i >= 1; i -= 2) {
+        d = (index("0123456789ABCDEF", toupper(substr(h, i, 1))) - 1) * 16
+        d += index("0123456789ABCDEF", toupper(substr(h, i + 1, 1))) - 1
+        out = out (out == "" ? "" : ".") d
+    }
+    return out
+}
+function in_net(ip, net, mask,    a, n, m, i, block) {
+    split(ip, a, "."); split(net, n, "."); split(mask, m, ".")
+    for (i = 1; i <= 4; i++) {
+        if (m[i] == 0) continue
+        block = 256 - m[i]
+        if (int(a[i] / block) != int(n[i] / block)) return 0
+    }
+    return 1
+}
+function etag(s,    i, h) {
+    # Content hash used as the ETag: h = h * 31 + byte, modulo the
+    # largest 32-bit prime (stays exact in awk doubles)
+    if (!ord_ready) {
+        for (i = 32; i < 127; i++) ord[sprintf("%c", i)] = i
+        ord_ready = 1
+    }
+    h = 0
+    for (i = 1; i <= length(s); i++) h = (h * 31 + ord[substr(s, i, 1)]) % 4294967291
+    return sprintf("%04x%04x", int(h / 65536), h % 65536)
+}
+'
+
+# Fields that never change while the server is running.
+STATIC_AWK='
+BEGIN {
+    api = esc(first_line(version_file))
+    if (api == "") api = "unknown"
+    host = esc(first_line("/proc/sys/kernel/hostname"))
+    if (host == "") host = "jetkvm"
+    serial = esc(first_line("/sys/firmware/devicetree/base/serial-number"))
+    model = esc(first_line("/sys/firmware/devicetree/base/model"))
+    if (model == "") model = "JetKVM"
+    kver = esc(first_line("/proc/sys/kernel/osrelease"))
+    kbuild = esc(first_line("/proc/sys/kernel/version"))
+    mac = esc(first_line("/sys/class/net/eth0/address"))
+
+    out = sprintf("\"api_version\":\"%s\",\"deviceModel\":\"%s\",\"serial_number\":\"%s\",\"hostname\":\"%s\",", api, model, serial, host)
+    out = out sprintf("\"mac_address\":\"%s\",\"kernel_version\":\"%s\",\"kernel_build\":\"%s\"", mac, kver, kbuild)
+    print etag(out)
+    print out
+}
+'
+
+# Every program prints the fragment's ETag on its first line and the
+# JSON fragment on the second. The volatile programs prefix the ETag
+# with the uptime (whole seconds) used to age the cache; the hot one
+# prints an empty ETag after it.
+
+# Fast-changing fields, served by /metrics. Reads /proc and /sys only.
+HOT_AWK='
+BEGIN {
+    split(first_line("/proc/uptime"), f, " ")
+    uptime = num(f[1])
+    split(first_line("/proc/loadavg"), f, " ")
+    load = num(f[1])
+
+    t = first_line("/sys/class/thermal/thermal_zone0/temp") + 0
+    temp = sprintf("%.1f", int(t / 100) / 10)
+    link = esc(first_line("/sys/class/net/eth0/operstate"))
+
+    while ((getline line < "/proc/meminfo") > 0) {
+        split(line, f, " ")
+        if (f[1] == "MemTotal:") mem_total = f[2]
+        else if (f[1] == "MemAvailable:") mem_avail = f[2]
+    }
+    close("/proc/meminfo")
+    mem_total = num(mem_total)
+    mem_avail = num(mem_avail)
+
+    out = sprintf("\"network_state\":\"%s\",", link)
+    out = out sprintf("\"temperature\":%s,\"uptime_seconds\":%s,\"load_average\":%s,", temp, uptime, load)
+    out = out sprintf("\"mem_total_kb\":%s,\"mem_available_kb\":%s,\"mem_used_pct\":%s", mem_total, mem_avail, pct(mem_total - mem_avail, mem_total))
+    print int(uptime), ""
+    print out
+}
+'
+
+# Slow-changing fields, served by /inventory. df is the only child
+# spawned, because statfs() has no /proc equivalent.
+COLD_AWK='
+BEGIN {
+    split(first_line("/proc/uptime"), f, " ")
+    uptime = num(f[1])
+
+    # IPv4 address of eth0: the local address that sits inside one of
+    # the eth0 routes (avoids running ip/ifconfig)
+    nroutes = 0
+    while ((getline line < "/proc/net/route") > 0) {
+        split(line, f, " ")
+        if (f[1] == "eth0" && f[8] != "00000000") {
+            nroutes++
+            rnet[nroutes] = hex_ip(f[2])
+            rmask[nroutes] = hex_ip(f[8])
+        }
+    }
+    close("/proc/net/route")
+    ip = ""
+    last = ""
+    while (ip == "" && (getline line < "/proc/net/fib_trie") > 0) {
+        if (line ~ /-- [0-9]+\.[0-9]+\.[0-9]+\.[0-9]+$/) {
+            n = split(line, f, " ")
+            last = f[n]
+        } else if (line ~ /\/32 host LOCAL/) {
+            for (i = 1; i <= nroutes; i++) {
+                if (in_net(last, rnet[i], rmask[i])) { ip = last; break }
+            }
+        }
+    }
+    close("/proc/net/fib_trie")
+    if (ip == "") {
+        cmd = "ip -4 addr show eth0 2>/dev/null"
+        while ((cmd | getline line) > 0) {
+            if (ip == "" && line ~ /inet /) {
+                split(line, f, " ")
+                split(f[2], a, "/")
+                ip = a[1]
+            }
+        }
+        close(cmd)
+    }
+    if (ip == "") ip = "unknown"
+    ip = esc(ip)
+
+    # Root filesystem. BusyBox df may wrap long device names onto their
+    # own line, so collect every field after the header.
+    cmd = "df / 2>/dev/null"
+    nl = 0
+    nd = 0
+    while ((cmd | getline line) > 0) {
+        if (++nl == 1) continue
+        c = split(line, f, " ")
+        for (i = 1; i <= c; i++) d[++nd] = f[i]
+    }
+    close(cmd)
+    disk_total = num(d[2])
+    disk_used = num(d[3])
+    disk_avail = num(d[4])
+
+    out = sprintf("\"ip_address\":\"%s\",", ip)
+    out = out sprintf("\"disk_total_kb\":%s,\"disk_used_kb\":%s,\"disk_available_kb\":%s,\"disk_used_pct\":%s", disk_total, disk_used, disk_avail, pct(disk_used, disk_total))
+    print int(uptime), etag(out)
+    print out
+}
+'
 
-# Escape a string for safe embedding inside a JSON string value.
-# Handles backslash, double-quote, and control characters.
-json_escape() {
-    printf '%s' "$1" | sed -e 's/\\/\\\\/g' -e 's/"/\\"/g' -e 's/	/\\t/g' | tr -d '\n\r'
+# Write a cache file atomically (readers never see a partial file).
+write_cache() {
+    { printf '%s\n' "$2" > "$1.$$"; } 2>/dev/null && mv -f "$1.$$" "$1" 2>/dev/null
 }
 
-# Read the HTTP request line (with a timeout via TMOUT or read -t)
-# BusyBox ash supports read -t
-read -t 5 -r REQUEST_LINE 2>/dev/null || REQUEST_LINE=""
+build_static() {
+    FRESH=$(awk -v version_file=/opt/ha-api/version "${AWK_LIB}${STATIC_AWK}" 2>/dev/null)
+    STATIC_TAG=${FRESH%%
+*}
+    STATIC=${FRESH#*
+}
+    [ -n "$STATIC" ] && write_cache "$STATIC_CACHE" "$FRESH"
+}
 
-if [ -z "$REQUEST_LINE" ]; then
-    printf "HTTP/1.0 408 Timeout\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+# Sets STATIC (and STATIC_TAG) to the cached identity fragment,
+# building it if missing.
+load_static() {
+    STATIC_TAG=""
+    STATIC=""
+    { { read -r STATIC_TAG; read -r STATIC; } < "$STATIC_CACHE"; } 2>/dev/null
+    [ -z "$STATIC" ] && build_static
+}
+
+# load_fragment CACHE_FILE AWK_PROGRAM
+# Sets FRAGMENT (and FRAGMENT_TAG) to the program's JSON fragment,
+# reusing CACHE_FILE while it is younger than CACHE_TTL seconds.
+load_fragment() {
+    NOW=""
+    STAMP=""
+    FRAGMENT_TAG=""
+    FRAGMENT=""
+    { read -r NOW _rest < /proc/uptime; } 2>/dev/null
+    NOW=${NOW%.*}
+    { { read -r STAMP FRAGMENT_TAG; read -r FRAGMENT; } < "$1"; } 2>/dev/null
+    case "$NOW$STAMP" in
+        ''|*[!0-9]*) ;;
+        *)
+            # NOW < STAMP means a stale file from before a reboot
+            if [ -n "$FRAGMENT" ] && [ "$NOW" -ge "$STAMP" ] \
+                && [ $((NOW - STAMP)) -lt "$CACHE_TTL" ]; then
+                return
+            fi
+            ;;
+    esac
+    FRESH=$(awk "${AWK_LIB}$2" 2>/dev/null)
+    FRAGMENT_TAG=${FRESH%%
+*}
+    FRAGMENT_TAG=${FRAGMENT_TAG#* }
+    FRAGMENT=${FRESH#*
+}
+    [ -n "$FRAGMENT" ] && write_cache "$1" "$FRESH"
+}
+
+# Called by the watchdog on startup: snapshot the static fields once.
+if [ "$1" = "--refresh-static" ]; then
+    mkdir -p "$CACHE_DIR"
+    rm -f "$STATIC_CACHE" "$COLD_CACHE" "$HOT_CACHE"
+    build_static
     exit 0
 fi
 
-# Extract path
-REQUEST_PATH=$(echo "$REQUEST_LINE" | awk '{print $2}')
-# Ignore query string (BusyBox-friendly parameter expansion)
-REQUEST_PATH=${REQUEST_PATH%%\?*}
+# Serve requests on this connection until the client closes it, sends
+# "Connection: close", stays idle for KEEPALIVE_TIMEOUT seconds or has
+# made KEEPALIVE_MAX requests. KEEPALIVE_TIMEOUT=0 (legacy single-shot
+# nc mode) answers exactly one request per connection.
+SERVED=0
+READ_TIMEOUT=5
+while :; do
+    # BusyBox ash supports read -t
+    read -t "$READ_TIMEOUT" -r REQUEST_LINE 2>/dev/null || REQUEST_LINE=""
+    REQUEST_LINE=${REQUEST_LINE%[[:cntrl:]]}
+
+    if [ -z "$REQUEST_LINE" ]; then
+        # Idle keep-alive connections are closed silently
+        if [ "$SERVED" -eq 0 ]; then
+            printf "HTTP/1.1 408 Request Timeout\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+        fi
+        exit 0
+    fi
+    SERVED=$((SERVED + 1))
+
+    # Extract path and protocol ("GET /path HTTP/1.1") with parameter
+    # expansion only
+    REQUEST_PATH=${REQUEST_LINE#* }
+    REQUEST_PATH=${REQUEST_PATH%% *}
+    # Ignore query string (BusyBox-friendly parameter expansion)
+    REQUEST_PATH=${REQUEST_PATH%%\?*}
+    case "$REQUEST_LINE" in
+        *" HTTP/1.0") KEEP_ALIVE=0 ;;
+        *) KEEP_ALIVE=1 ;;
+    esac
+
+    STATUS_CODE=200
+    STATUS_TEXT="OK"
+    ETAG=""
+    IF_NONE_MATCH=""
+
+    # Consume remaining headers (read until blank line, with timeout).
+    # A blank line is empty or a lone CR.
+    while read -t 2 -r header 2>/dev/null; do
+        [ ${#header} -le 1 ] && break
+        case "$header" in
+            [Cc]onnection:*[Cc]lose*) KEEP_ALIVE=0 ;;
+            [Cc]onnection:*[Kk]eep-[Aa]live*) KEEP_ALIVE=1 ;;
+            [Ii]f-[Nn]one-[Mm]atch:*)
+                IF_NONE_MATCH=${header#*:}
+                IF_NONE_MATCH=${IF_NONE_MATCH%[[:cntrl:]]}
+                ;;
+        esac
+    done
+
+    if [ "$KEEPALIVE_TIMEOUT" -le 0 ] || [ "$SERVED" -ge "$KEEPALIVE_MAX" ]; then
+        KEEP_ALIVE=0
+    fi
 
-STATUS_CODE=200
-STATUS_TEXT="OK"
+    # --- Route ---
+    case "$REQUEST_PATH" in
+        /health)
+            BODY='{"status":"ok"}'
+            ;;
+        /temperature)
+            TEMP_RAW=""
+            { read -r TEMP_RAW < /sys/class/thermal/thermal_zone0/temp; } 2>/dev/null
+            if [ -z "$TEMP_RAW" ]; then
+                BODY='{"error":"cannot read temperature"}'
+            else
+                TEMP_INT=$((TEMP_RAW / 1000))
+                TEMP_FRAC=$(( (TEMP_RAW % 1000) / 100 ))
+                BODY="{\"temperature\":${TEMP_INT}.${TEMP_FRAC}}"
+            fi
+            ;;
+        /version)
+            API_VER=""
+            { read -r API_VER < /opt/ha-api/version; } 2>/dev/null
+            # Installer-written semver, safe to embed without escaping
+            case "$API_VER" in ''|*[!0-9A-Za-z.+-]*) API_VER="unknown" ;; esac
+            BODY="{\"api_version\":\"${API_VER}\"}"
+            ;;
+        /metrics)
+            load_fragment "$HOT_CACHE" "$HOT_AWK"
+            if [ -n "$FRAGMENT" ]; then
+                BODY="{${FRAGMENT}}"
+            else
+                BODY='{"error":"cannot read metrics"}'
+            fi
+            ;;
+        /inventory)
+            load_static
+            load_fragment "$COLD_CACHE" "$COLD_AWK"
+            if [ -n "$STATIC" ] && [ -n "$FRAGMENT" ]; then
+                BODY="{${STATIC},${FRAGMENT}}"
+                [ -n "$STATIC_TAG" ] && [ -n "$FRAGMENT_TAG" ] \
+                    && ETAG="\"${STATIC_TAG}${FRAGMENT_TAG}\""
+            else
+                BODY='{"error":"cannot read inventory"}'
+            fi
+            ;;
+        /device_info)
+            load_static
+            load_fragment "$COLD_CACHE" "$COLD_AWK"
+            COLD=$FRAGMENT
+            load_fragment "$HOT_CACHE" "$HOT_AWK"
+            if [ -n "$STATIC" ] && [ -n "$COLD" ] && [ -n "$FRAGMENT" ]; then
+                BODY="{${STATIC},${COLD},${FRAGMENT}}"
+            else
+                BODY='{"error":"cannot read device info"}'
+            fi
+            ;;
+        *)
+            STATUS_CODE=404
+            STATUS_TEXT="Not Found"
+            BODY='{"error":"not found"}'
+            ;;
+    esac
+
+    if [ "$KEEP_ALIVE" = "1" ]; then
+        CONNECTION="keep-alive\r\nKeep-Alive: timeout=${KEEPALIVE_TIMEOUT}, max=$((KEEPALIVE_MAX - SERVED))"
+    else
+        CONNECTION="close"
+    fi
+    if [ -z "$ETAG" ]; then
+        printf "HTTP/1.1 %s %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\nAccess-Control-Allow-Origin: *\r\nConnection: ${CONNECTION}\r\n\r\n%s" \
+            "$STATUS_CODE" "$STATUS_TEXT" "${#BODY}" "$BODY"
+    else
+        # Unchanged content: headers only, the client reuses its copy
+        case "$IF_NONE_MATCH" in
+            *"$ETAG"*|*"*"*)
+                printf "HTTP/1.1 304 Not Modified\r\nETag: %s\r\nAccess-Control-Allow-Origin: *\r\nConnection: ${CONNECTION}\r\n\r\n" \
+                    "$ETAG"
+                ;;
+            *)
+                printf "HTTP/1.1 %s %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\nETag: %s\r\nAccess-Control-Allow-Origin: *\r\nConnection: ${CONNECTION}\r\n\r\n%s" \
+                    "$STATUS_CODE" "$STATUS_TEXT" "${#BODY}" "$ETAG" "$BODY"
+                ;;
+        esac
+    fi
 
-# Consume remaining headers (read until blank line, with timeout)
-while read -t 2 -r header 2>/dev/null; do
-    header=$(echo "$header" | tr -d '\r')
-    [ -z "$header" ] && break
+    [ "$KEEP_ALIVE" = "1" ] || exit 0
+    READ_TIMEOUT=$KEEPALIVE_TIMEOUT
 done
+HANDLER
+chmod +x "$HANDLER_SCRIPT"
 
-# --- Route ---
-case "$REQUEST_PATH" in
-    /health)
-        BODY='{"status":"ok"}'
-        ;;
-    /temperature)
-        TEMP_RAW=$(cat /sys/class/thermal/thermal_zone0/temp 2>/dev/null)
-        if [ -z "$TEMP_RAW" ]; then
-            BODY='{"error":"cannot read temperature"}'
-        else
-            TEMP_INT=$((TEMP_RAW / 1000))
-            TEMP_FRAC=$(( (TEMP_RAW % 1000) / 100 ))
-            BODY="{\"temperature\":${TEMP_INT}.${TEMP_FRAC}}"
-        fi
-        ;;
-    /version)
-        API_VER=$(cat /opt/ha-api/version 2>/dev/null)
-        [ -z "$API_VER" ] && API_VER="unknown"
-        J_APIVER=$(json_escape "$API_VER")
-        BODY="{\"api_version\":\"${J_APIVER}\"}"
-        ;;
-    /device_info)
-        # API version
-        API_VER=$(cat /opt/ha-api/version 2>/dev/null)
-        [ -z "$API_VER" ] && API_VER="unknown"
-
-        # Temperature
-        TEMP_RAW=$(cat /sys/class/thermal/thermal_zone0/temp 2>/dev/null)
-        TEMP_INT=$((TEMP_RAW / 1000))
-        TEMP_FRAC=$(( (TEMP_RAW % 1000) / 100 ))
-
-        # Identity
-        DEV_HOSTNAME=$(hostname 2>/dev/null || echo "jetkvm")
-        SERIAL=$(cat /sys/firmware/devicetree/base/serial-number 2>/dev/null | tr -d '\0')
-        MODEL=$(cat /sys/firmware/devicetree/base/model 2>/dev/null | tr -d '\0')
-        [ -z "$MODEL" ] && MODEL="JetKVM"
-
-        # Firmware / kernel
-        KERNEL_VERSION=$(uname -r 2>/dev/null)
-        KERNEL_BUILD=$(uname -v 2>/dev/null)
-
-        # Network
-        IP=$(ip -4 addr show eth0 2>/dev/null | awk '/inet / {split($2,a,"/"); print a[1]; exit}')
-        [ -z "$IP" ] && IP=$(ifconfig eth0 2>/dev/null | awk '/inet addr/{split($2,a,":"); print a[2]; exit}')
-        [ -z "$IP" ] && IP="unknown"
-        MAC=$(cat /sys/class/net/eth0/address 2>/dev/null)
-        LINK_STATE=$(cat /sys/class/net/eth0/operstate 2>/dev/null)
-
-        # Uptime
-        UPTIME=$(awk '{print $1}' /proc/uptime 2>/dev/null)
-        [ -z "$UPTIME" ] && UPTIME=0
-
-        # Memory (kB)
-        MEM_TOTAL=$(awk '/MemTotal/ {print $2}' /proc/meminfo 2>/dev/null)
-        MEM_AVAIL=$(awk '/MemAvailable/ {print $2}' /proc/meminfo 2>/dev/null)
-        case "$MEM_TOTAL" in ''|*[!0-9]*) MEM_TOTAL=0 ;; esac
-        case "$MEM_AVAIL" in ''|*[!0-9]*) MEM_AVAIL=0 ;; esac
-        if [ "$MEM_TOTAL" -gt 0 ] 2>/dev/null; then
-            MEM_USED=$((MEM_TOTAL - MEM_AVAIL))
-            # percentage * 10 for one decimal place using integer math
-            MEM_PCT_X10=$(( MEM_USED * 1000 / MEM_TOTAL ))
-            MEM_PCT_INT=$((MEM_PCT_X10 / 10))
-            MEM_PCT_FRAC=$((MEM_PCT_X10 % 10))
-        else
-            MEM_PCT_INT=0
-            MEM_PCT_FRAC=0
-        fi
+# =====================================================================
+# Benchmark helper — request latency and CPU time of the handler
+# =====================================================================
+cat << 'BENCH' > "$BENCH_SCRIPT"
+#!/bin/sh
+# Benchmark the request handler on the device.
+#
+# Usage: sh /opt/ha-api/bench.sh [path] [iterations] [handler ...]
+#
+# Feeds each handler a canned "GET <path>" request ITERATIONS times and
+# prints the average wall-clock latency and CPU time (user + sys of the
+# handler and everything it spawns) per request. Without a handler
+# argument it compares handler.prev.sh (the handler replaced by the
+# last install, i.e. "before") with handler.sh ("after").
 
-        # Storage — root filesystem
-        # Use awk to skip the header (NR>1) and grab the first data line.
-        # BusyBox df may output differently, so try multiple approaches.
-        DISK_TOTAL_KB=$(df / 2>/dev/null | awk 'NR==2 {print $2}')
-        DISK_USED_KB=$(df / 2>/dev/null | awk 'NR==2 {print $3}')
-        DISK_AVAIL_KB=$(df / 2>/dev/null | awk 'NR==2 {print $4}')
-
-        # Validate values are numeric — fallback to 0 if not
-        case "$DISK_TOTAL_KB" in ''|*[!0-9]*) DISK_TOTAL_KB=0 ;; esac
-        case "$DISK_USED_KB" in ''|*[!0-9]*) DISK_USED_KB=0 ;; esac
-        case "$DISK_AVAIL_KB" in ''|*[!0-9]*) DISK_AVAIL_KB=0 ;; esac
-
-        if [ "$DISK_TOTAL_KB" -gt 0 ] 2>/dev/null; then
-            DISK_PCT_X10=$(( DISK_USED_KB * 1000 / DISK_TOTAL_KB ))
-            DISK_PCT_INT=$((DISK_PCT_X10 / 10))
-            DISK_PCT_FRAC=$((DISK_PCT_X10 % 10))
-        else
-            DISK_PCT_INT=0
-            DISK_PCT_FRAC=0
-        fi
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+REQ_PATH="${1:-/device_info}"
+ITERATIONS="${2:-50}"
+case "$ITERATIONS" in ''|*[!0-9]*|0) ITERATIONS=50 ;; esac
+if [ $# -ge 2 ]; then shift 2; else shift $#; fi
+if [ $# -eq 0 ]; then
+    [ -f "${SCRIPT_DIR}/handler.prev.sh" ] && set -- "${SCRIPT_DIR}/handler.prev.sh"
+    set -- "$@" "${SCRIPT_DIR}/handler.sh"
+fi
 
-        # CPU load (1 min avg)
-        LOAD_AVG=$(awk '{print $1}' /proc/loadavg 2>/dev/null)
-        [ -z "$LOAD_AVG" ] && LOAD_AVG=0
-
-        # Build JSON with properly escaped strings
-        J_MODEL=$(json_escape "$MODEL")
-        J_SERIAL=$(json_escape "$SERIAL")
-        J_HOSTNAME=$(json_escape "$DEV_HOSTNAME")
-        J_IP=$(json_escape "$IP")
-        J_MAC=$(json_escape "$MAC")
-        J_LINK=$(json_escape "$LINK_STATE")
-        J_KVER=$(json_escape "$KERNEL_VERSION")
-        J_KBUILD=$(json_escape "$KERNEL_BUILD")
-        J_APIVER=$(json_escape "$API_VER")
-
-        BODY="{\"api_version\":\"${J_APIVER}\",\"deviceModel\":\"${J_MODEL}\",\"serial_number\":\"${J_SERIAL}\",\"hostname\":\"${J_HOSTNAME}\",\"ip_address\":\"${J_IP}\",\"mac_address\":\"${J_MAC}\",\"network_state\":\"${J_LINK}\",\"kernel_version\":\"${J_KVER}\",\"kernel_build\":\"${J_KBUILD}\",\"temperature\":${TEMP_INT}.${TEMP_FRAC},\"uptime_seconds\":${UPTIME:-0},\"load_average\":${LOAD_AVG:-0},\"mem_total_kb\":${MEM_TOTAL:-0},\"mem_available_kb\":${MEM_AVAIL:-0},\"mem_used_pct\":${MEM_PCT_INT}.${MEM_PCT_FRAC},\"disk_total_kb\":${DISK_TOTAL_KB:-0},\"disk_used_kb\":${DISK_USED_KB:-0},\"disk_available_kb\":${DISK_AVAIL_KB:-0},\"disk_used_pct\":${DISK_PCT_INT}.${DISK_PCT_FRAC}}"
-        ;;
-    *)
-        STATUS_CODE=404
-        STATUS_TEXT="Not Found"
-        BODY='{"error":"not found"}'
-        ;;
-esac
+CLK_TCK=100
+REQ_FILE="/tmp/_ha_api_bench_req"
+printf 'GET %s HTTP/1.1\r\nHost: localhost\r\n\r\n' "$REQ_PATH" > "$REQ_FILE"
 
-CONTENT_LENGTH=$(echo -n "$BODY" | wc -c)
+# Both probes use builtins only so they do not show up in the numbers.
+uptime_cs() {
+    read -r _up _rest < /proc/uptime
+    UPTIME_CS=${_up%.*}${_up#*.}
+    while case "$UPTIME_CS" in 0?*) true ;; *) false ;; esac; do
+        UPTIME_CS=${UPTIME_CS#0}
+    done
+}
+child_ticks() {
+    read -r _stat < "/proc/$$/stat"
+    set -f
+    # shellcheck disable=SC2086
+    set -- $_stat
+    set +f
+    # Fields 16/17: cutime/cstime of waited-for children
+    CHILD_TICKS=$(( ${16} + ${17} ))
+}
 
-printf "HTTP/1.0 %s %s\r\n" "$STATUS_CODE" "$STATUS_TEXT"
-printf "Content-Type: application/json\r\n"
-printf "Content-Length: %d\r\n" "$CONTENT_LENGTH"
-printf "Access-Control-Allow-Origin: *\r\n"
-printf "Connection: close\r\n"
-printf "\r\n"
-printf "%s" "$BODY"
-HANDLER
-chmod +x "$HANDLER_SCRIPT"
+echo "Benchmarking GET ${REQ_PATH} x ${ITERATIONS}"
+for handler in "$@"; do
+    if [ ! -f "$handler" ]; then
+        echo "  skip: $handler not found"
+        continue
+    fi
+    uptime_cs; T0=$UPTIME_CS
+    child_ticks; C0=$CHILD_TICKS
+    i=0
+    while [ "$i" -lt "$ITERATIONS" ]; do
+        sh "$handler" < "$REQ_FILE" > /dev/null 2>&1
+        i=$((i + 1))
+    done
+    uptime_cs; child_ticks
+    WALL_X10=$(( (UPTIME_CS - T0) * 100 / ITERATIONS ))
+    CPU_X10=$(( (CHILD_TICKS - C0) * 10000 / CLK_TCK / ITERATIONS ))
+    printf '  %-32s latency %d.%d ms/req  cpu %d.%d ms/req\n' \
+        "$(basename "$handler")" \
+        $((WALL_X10 / 10)) $((WALL_X10 % 10)) $((CPU_X10 / 10)) $((CPU_X10 % 10))
+done
+rm -f "$REQ_FILE"
+BENCH
+chmod +x "$BENCH_SCRIPT"
 
 # =====================================================================
 # Write config file (values expanded at install time)
 # =====================================================================
 cat > "${BASE_DIR}/config.sh" << CONF
+SERVER_MODE="${SERVER_MODE}"
+REQUESTED_MODE="${REQUESTED_MODE}"
+TCPSVD_CMD="${TCPSVD_CMD}"
+MAX_CONNECTIONS=${MAX_CONNECTIONS}
+CACHE_TTL=${CACHE_TTL}
+CACHE_DIR="${CACHE_DIR}"
+KEEPALIVE_TIMEOUT=${KEEPALIVE_TIMEOUT}
+KEEPALIVE_MAX=${KEEPALIVE_MAX}
 NC_CMD="${NC_CMD}"
 NC_HAS_E=${NC_HAS_E}
 API_PORT=${API_PORT}
@@ -349,12 +808,12 @@ UPDATE_INTERVAL=${UPDATE_INTERVAL}
 CONF
 
 # =====================================================================
-# Watchdog script — runs nc in a loop, restarts on exit.
+# Watchdog script — runs the server in a loop, restarts on exit.
 # Fully detached from terminal via setsid.
 # =====================================================================
 cat << 'WATCHDOG' > "$WATCHDOG_SCRIPT"
 #!/bin/sh
-# Watchdog for nc-based HTTP server
+# Watchdog for the HTTP server (tcpsvd or nc)
 
 # Load config
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
@@ -385,7 +844,10 @@ cleanup() {
 }
 trap cleanup INT TERM HUP
 
-log "Watchdog starting (PID $$) — nc=$NC_CMD nc_e=$NC_HAS_E"
+log "Watchdog starting (PID $$) — mode=$SERVER_MODE nc=$NC_CMD nc_e=$NC_HAS_E cache_ttl=${CACHE_TTL}s"
+
+# Snapshot the static /device_info fields once per server start
+"$HANDLER_SCRIPT" --refresh-static
 
 RESTART_COUNT=0
 MAX_FAST_RESTARTS=50
@@ -393,17 +855,35 @@ FAST_RESTART_WINDOW=10
 LAST_RESTART_TIME=0
 
 while true; do
-    if [ "$NC_HAS_E" = "1" ]; then
-        # nc -e mode: nc hands off each connection to the handler script
-        $NC_CMD -l -p "$API_PORT" -e "$HANDLER_SCRIPT" 2>/dev/null
-    else
-        # Pipe mode: use a named pipe (FIFO) for bidirectional I/O
-        FIFO="${BASE_DIR}/fifo"
-        [ ! -p "$FIFO" ] && { rm -f "$FIFO"; mkfifo "$FIFO"; }
-        cat "$FIFO" | $NC_CMD -l -p "$API_PORT" | "$HANDLER_SCRIPT" > "$FIFO" 2>/dev/null
-    fi
+    case "$SERVER_MODE" in
+        tcpsvd)
+            # Long-lived: keeps the port open and forks the handler per
+            # connection, up to MAX_CONNECTIONS at once. -E skips the
+            # per-connection environment setup we do not use.
+            $TCPSVD_CMD -E -c "$MAX_CONNECTIONS" 0.0.0.0 "$API_PORT" "$HANDLER_SCRIPT" 2>/dev/null
+            log "tcpsvd exited unexpectedly — restarting"
+            sleep 1
+            ;;
+        nc-persistent)
+            # nc -ll keeps listening and forks the handler per connection
+            $NC_CMD -ll -p "$API_PORT" -e "$HANDLER_SCRIPT" 2>/dev/null
+            log "nc -ll exited unexpectedly — restarting"
+            sleep 1
+            ;;
+        *)
+            if [ "$NC_HAS_E" = "1" ]; then
+                # nc -e mode: nc hands off each connection to the handler script
+                $NC_CMD -l -p "$API_PORT" -e "$HANDLER_SCRIPT" 2>/dev/null
+            else
+                # Pipe mode: use a named pipe (FIFO) for bidirectional I/O
+                FIFO="${BASE_DIR}/fifo"
+                [ ! -p "$FIFO" ] && { rm -f "$FIFO"; mkfifo "$FIFO"; }
+                cat "$FIFO" | $NC_CMD -l -p "$API_PORT" | "$HANDLER_SCRIPT" > "$FIFO" 2>/dev/null
+            fi
+            # nc exits after each connection — this is normal.
+            ;;
+    esac
 
-    # nc exits after each connection — this is normal.
     # Track rapid restarts only to detect real problems.
     NOW=$(date +%s 2>/dev/null || awk '{printf "%d", $1}' /proc/uptime)
     ELAPSED=$((NOW - LAST_RESTART_TIME))
@@ -415,7 +895,7 @@ while true; do
     LAST_RESTART_TIME=$NOW
 
     if [ "$RESTART_COUNT" -ge "$MAX_FAST_RESTARTS" ]; then
-        log "ERROR: nc restarted $RESTART_COUNT times in <${FAST_RESTART_WINDOW}s — backing off 30s"
+        log "ERROR: server restarted $RESTART_COUNT times in <${FAST_RESTART_WINDOW}s — backing off 30s"
         sleep 30
         RESTART_COUNT=0
     fi
@@ -448,7 +928,7 @@ fi
 for p in $(netstat -tlnp 2>/dev/null | grep ":${API_PORT} " | awk '{print $NF}' | cut -d/ -f1); do
     kill "$p" 2>/dev/null
 done
-rm -rf "$BASE_DIR"
+rm -rf "$BASE_DIR" /tmp/ha-api
 if [ -f /etc/rc.local ]; then
     sed -i "\|${WATCHDOG_SCRIPT}|d" /etc/rc.local
     sed -i "\|${UPDATER_SCRIPT}|d" /etc/rc.local
@@ -552,7 +1032,8 @@ while true; do
     log "Update found! local=$LOCAL_VER remote=$REMOTE_VER — applying..."
 
     # Run the new setup script (it will stop existing watchdog/updater, reinstall, and restart everything)
-    sh "$TMP_SCRIPT" 2>&1 | while IFS= read -r line; do log "  $line"; done
+    # with the options of this install; the installer rewrites config.sh
+    sh "$TMP_SCRIPT" --mode "${REQUESTED_MODE:-auto}" --cache-ttl "${CACHE_TTL:-10}" 2>&1 | while IFS= read -r line; do log "  $line"; done
     rm -f "$TMP_SCRIPT"
 
     log "Update applied — exiting old updater (new one should be running)"
@@ -622,16 +1103,24 @@ if [ "$RUNNING" = "1" ]; then
     echo "  http://${IP}:${API_PORT}/version"
     echo "  http://${IP}:${API_PORT}/temperature"
     echo "  http://${IP}:${API_PORT}/device_info"
+    echo "  http://${IP}:${API_PORT}/metrics"
+    echo "  http://${IP}:${API_PORT}/inventory"
     echo ""
     echo "The server will:"
-    echo "  - Automatically restart after each request (nc is single-shot)"
+    if [ "$SERVER_MODE" = "nc" ]; then
+        echo "  - Automatically restart after each request (nc is single-shot)"
+    else
+        echo "  - Keep port ${API_PORT} listening and serve requests concurrently ($SERVER_MODE)"
+        echo "  - Keep HTTP/1.1 connections open for ${KEEPALIVE_TIMEOUT}s between requests"
+    fi
     echo "  - Survive SSH session disconnect"
     echo "  - Start automatically on boot"
-    echo "  - Timeout idle connections after 5 seconds"
+    echo "  - Timeout connections that send no request within 5 seconds"
     echo "  - Auto-update from GitHub every ${UPDATE_INTERVAL} seconds"
     echo ""
     echo "To uninstall:  sh ${UNINSTALL_SCRIPT}"
     echo "To view logs:  cat ${LOG_FILE}"
+    echo "To benchmark:  sh ${BENCH_SCRIPT} /device_info 50"
     echo ""
     echo "In Home Assistant, add the JetKVM integration with host: ${IP}"
     echo ""
@@ -640,6 +1129,8 @@ else
     echo "WARNING: Server may not have started correctly."
     echo ""
     echo "Debug info:"
+    echo "  server mode:   $SERVER_MODE"
+    echo "  tcpsvd:        ${TCPSVD_CMD:-(none)}"
     echo "  nc command:    $NC_CMD"
     echo "  nc -e support: $([ "$NC_HAS_E" = "1" ] && echo "yes" || echo "no")"
     echo "  Log file:      cat ${LOG_FILE}"
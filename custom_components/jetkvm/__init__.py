@@ -1,17 +1,186 @@
 """The JetKVM integration."""
+import hashlib
 import logging
+from datetime import datetime, timedelta
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
-from .const import PLATFORMS, DOMAIN
-from .client import JetKVMClient
+from .const import (
+    PLATFORMS,
+    DOMAIN,
+    DATA_API_SESSION,
+    DATA_FLEET,
+    AUTH_REFRESH_MARGIN,
+    AUTH_REFRESH_RETRY,
+    AUTH_STORAGE_KEY,
+    AUTH_STORAGE_VERSION,
+    CONF_ADAPTIVE_POLLING,
+    CONF_ICE_LAN_ONLY,
+    CONF_ICE_SUBNETS,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_PUSH_TELEMETRY,
+    CONF_RACE_SIGNALING,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_ICE_LAN_ONLY,
+    DEFAULT_ICE_SUBNETS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_PUSH_TELEMETRY,
+    DEFAULT_RACE_SIGNALING,
+    DEFAULT_SCAN_INTERVAL,
+)
+from .client import (
+    JetKVMAuthError,
+    JetKVMCandidatePolicy,
+    JetKVMClient,
+    JetKVMError,
+    create_api_session,
+)
 from .coordinator import JetKVMCoordinator
+from .fleet import JetKVMFleetScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@callback
+def _async_get_api_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the port-8800 API session shared by all JetKVM entries.
+
+    One bounded connection pool serves every device instead of one
+    session (connector, resolver, sockets) per config entry.  It is
+    closed when the last entry unloads or Home Assistant shuts down.
+    """
+    shared: tuple[aiohttp.ClientSession, CALLBACK_TYPE] | None = hass.data.get(
+        DATA_API_SESSION
+    )
+    if shared is not None:
+        if not shared[0].closed:
+            return shared[0]
+        shared[1]()
+
+    session = create_api_session()
+
+    async def _async_close_session(_event: Event) -> None:
+        # The listener is spent; unload must not remove it again
+        if hass.data.get(DATA_API_SESSION, (None,))[0] is session:
+            del hass.data[DATA_API_SESSION]
+        await session.close()
+
+    hass.data[DATA_API_SESSION] = (
+        session,
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session),
+    )
+    return session
+
+
+@callback
+def _async_get_fleet(hass: HomeAssistant) -> JetKVMFleetScheduler:
+    """Return the scheduler that polls every JetKVM entry.
+
+    One staggered schedule with a concurrency limit replaces a timer per
+    entry, so many devices do not poll in bursts.  It is stopped when the
+    last entry unloads.
+    """
+    fleet: JetKVMFleetScheduler | None = hass.data.get(DATA_FLEET)
+    if fleet is None:
+        fleet = hass.data[DATA_FLEET] = JetKVMFleetScheduler()
+    return fleet
+
+
+def _auth_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the .storage file holding this entry's native session cookie."""
+    return Store(
+        hass, AUTH_STORAGE_VERSION, f"{AUTH_STORAGE_KEY}.{entry.entry_id}", private=True
+    )
+
+
+async def _async_setup_auth_persistence(
+    hass: HomeAssistant, entry: ConfigEntry, client: JetKVMClient, password: str
+) -> None:
+    """Reuse the native session cookie across restarts and renew it early.
+
+    The cookie is only restored for the password it was issued for, and is
+    refreshed in the background AUTH_REFRESH_MARGIN before it expires so
+    opening the camera never waits for /auth/login-local.
+    """
+    store = _auth_store(hass, entry)
+    fingerprint = hashlib.sha256(password.encode()).hexdigest()
+
+    stored = await store.async_load()
+    if (
+        isinstance(stored, dict)
+        and stored.get("password_sha256") == fingerprint
+        and await client.async_restore_auth(stored.get("auth") or {})
+    ):
+        _LOGGER.debug("JetKVM %s: reusing stored session cookie", client.host)
+
+    cancel_refresh = None
+
+    async def _async_refresh(_now: datetime) -> None:
+        nonlocal cancel_refresh
+        cancel_refresh = None
+        try:
+            await client.async_refresh_auth()
+        except JetKVMAuthError as err:
+            # A rejected password will not be accepted on the next try
+            _LOGGER.debug("JetKVM %s: session refresh failed: %s", client.host, err)
+        except JetKVMError as err:
+            _LOGGER.debug(
+                "JetKVM %s: session refresh failed, retrying in %ss: %s",
+                client.host, AUTH_REFRESH_RETRY.total_seconds(), err,
+            )
+            if cancel_refresh is None:
+                cancel_refresh = async_track_point_in_utc_time(
+                    hass, _async_refresh, dt_util.utcnow() + AUTH_REFRESH_RETRY
+                )
+
+    @callback
+    def _schedule_refresh() -> None:
+        nonlocal cancel_refresh
+        if cancel_refresh is not None:
+            cancel_refresh()
+            cancel_refresh = None
+        expires = client.auth_expires
+        if expires is None:
+            return
+        when = max(
+            dt_util.utc_from_timestamp(expires) - AUTH_REFRESH_MARGIN,
+            dt_util.utcnow() + timedelta(seconds=1),
+        )
+        cancel_refresh = async_track_point_in_utc_time(hass, _async_refresh, when)
+
+    @callback
+    def _on_auth_change(state: dict[str, Any] | None) -> None:
+        if state is None:
+            hass.async_create_task(store.async_remove())
+        else:
+            store.async_delay_save(
+                lambda: {"password_sha256": fingerprint, "auth": state}, 1
+            )
+        _schedule_refresh()
+
+    @callback
+    def _cancel() -> None:
+        client.set_auth_listener(None)
+        if cancel_refresh is not None:
+            cancel_refresh()
+
+    client.set_auth_listener(_on_auth_change)
+    _schedule_refresh()
+    entry.async_on_unload(_cancel)
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update by reloading the config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -70,9 +239,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     host = entry.data["host"]
     password = entry.options.get("password", entry.data.get("password", ""))
 
-    client = JetKVMClient(host=host, password=password)
-    coordinator = JetKVMCoordinator(hass, client=client)
+    options = entry.options
+    try:
+        candidate_policy = JetKVMCandidatePolicy.from_options(
+            options.get(CONF_ICE_LAN_ONLY, DEFAULT_ICE_LAN_ONLY),
+            options.get(CONF_ICE_SUBNETS, DEFAULT_ICE_SUBNETS),
+        )
+    except ValueError as err:
+        _LOGGER.warning("JetKVM %s: ignoring ICE subnets: %s", host, err)
+        candidate_policy = None
+    client = JetKVMClient(
+        host=host,
+        password=password,
+        session=_async_get_api_session(hass),
+        race_signaling=options.get(CONF_RACE_SIGNALING, DEFAULT_RACE_SIGNALING),
+        candidate_policy=candidate_policy,
+    )
+    coordinator = JetKVMCoordinator(
+        hass,
+        client=client,
+        scan_interval=timedelta(
+            seconds=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        ),
+        adaptive=options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING),
+        min_interval=timedelta(
+            seconds=options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)
+        ),
+        max_interval=timedelta(
+            seconds=options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)
+        ),
+        fleet_scheduled=True,
+    )
     await coordinator.async_config_entry_first_refresh()
+    entry.async_on_unload(_async_get_fleet(hass).async_add(coordinator))
+
+    if password:
+        await _async_setup_auth_persistence(hass, entry, client, password)
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         "coordinator": coordinator,
@@ -86,23 +288,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     device_info = _build_device_info(entry, coordinator.device_info)
     device_reg.async_get_or_create(config_entry_id=entry.entry_id, **device_info)
 
-    # Update device info whenever coordinator refreshes (firmware, api_version, etc.)
+    # Update device info when identity or firmware fields change
+    last_device_info = device_info
+
+    @callback
     def _update_device_on_refresh() -> None:
         """Update device registry with latest data from the coordinator."""
+        nonlocal last_device_info
         live = coordinator.device_info or {}
         if not live:
             return
         updated = _build_device_info(entry, live)
+        if updated == last_device_info:
+            return
+        last_device_info = updated
         device_reg.async_get_or_create(config_entry_id=entry.entry_id, **updated)
 
     entry.async_on_unload(
         coordinator.async_add_listener(_update_device_on_refresh)
     )
 
+    # Push telemetry authenticates against the native API
+    if password and options.get(CONF_PUSH_TELEMETRY, DEFAULT_PUSH_TELEMETRY):
+        coordinator.async_start_push(entry)
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored session cookie of a removed entry."""
+    await _auth_store(hass, entry).async_remove()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a JetKVM config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -112,5 +330,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         client: JetKVMClient = data["client"]
         await client.close()
 
+        if not hass.data[DOMAIN]:
+            fleet: JetKVMFleetScheduler | None = hass.data.pop(DATA_FLEET, None)
+            if fleet is not None:
+                await fleet.async_close()
+            shared = hass.data.pop(DATA_API_SESSION, None)
+            if shared is not None:
+                session, remove_close_listener = shared
+                remove_close_listener()
+                await session.close()
+
     return unload_ok
 
@@ -18,6 +18,10 @@ SDP answer, so browser trickle ICE candidates are silently accepted.
 Authentication is done via a session cookie obtained from
 ``POST /auth/login-local``.  A password **must** be configured in the
 integration to enable the camera entity.
+
+With the relay option (and aiortc installed) viewers are served from a
+single device session instead; see ``relay.py``.  The snapshot option
+decodes still images from the stream; see ``snapshot.py``.
 """
 from __future__ import annotations
 
@@ -31,7 +35,15 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .client import JetKVMClient, JetKVMAuthError, JetKVMError
-from .const import DOMAIN
+from .const import (
+    CONF_SNAPSHOTS,
+    CONF_WEBRTC_RELAY,
+    DEFAULT_SNAPSHOTS,
+    DEFAULT_WEBRTC_RELAY,
+    DOMAIN,
+)
+from .relay import JetKVMRelay, relay_available
+from .snapshot import JetKVMSnapshotter, snapshots_available
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -71,7 +83,29 @@ async def async_setup_entry(
         )
         return
 
-    async_add_entities([JetKVMCamera(entry, client)])
+    relay = None
+    if entry.options.get(CONF_WEBRTC_RELAY, DEFAULT_WEBRTC_RELAY):
+        if relay_available():
+            relay = JetKVMRelay(client)
+        else:
+            _LOGGER.warning(
+                "JetKVM camera: WebRTC relay is enabled but aiortc is not "
+                "installed — every viewer gets its own device session."
+            )
+
+    snapshotter = None
+    if entry.options.get(CONF_SNAPSHOTS, DEFAULT_SNAPSHOTS):
+        if snapshots_available():
+            # Share the viewers' relay when there is one, so a snapshot
+            # never costs an extra device session
+            snapshotter = JetKVMSnapshotter(relay or JetKVMRelay(client))
+        else:
+            _LOGGER.warning(
+                "JetKVM camera: snapshots are enabled but aiortc or Pillow "
+                "is not installed — the camera has no still image."
+            )
+
+    async_add_entities([JetKVMCamera(entry, client, relay, snapshotter)])
 
 
 class JetKVMCamera(Camera):
@@ -97,11 +131,19 @@ class JetKVMCamera(Camera):
         def to_dict(self) -> dict[str, Any]:
             return self._data
 
-    def __init__(self, entry: ConfigEntry, client: JetKVMClient) -> None:
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        client: JetKVMClient,
+        relay: JetKVMRelay | None = None,
+        snapshotter: JetKVMSnapshotter | None = None,
+    ) -> None:
         """Initialize the camera."""
         super().__init__()
         self._entry = entry
         self._client = client
+        self._relay = relay
+        self._snapshotter = snapshotter
         self._attr_unique_id = f"{entry.entry_id}_camera"
         self._attr_is_streaming = True
 
@@ -117,6 +159,20 @@ class JetKVMCamera(Camera):
             identifiers.add((DOMAIN, self._entry.entry_id))
         return DeviceInfo(identifiers=identifiers)
 
+    async def async_added_to_hass(self) -> None:
+        """Pre-warm the signaling socket so the first offer goes out at once."""
+        await super().async_added_to_hass()
+        self._client.async_start_prewarm()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Close the pre-warmed signaling socket and the relay."""
+        await self._client.async_stop_prewarm()
+        if self._relay is not None:
+            await self._relay.async_close()
+        elif self._snapshotter is not None:
+            await self._snapshotter.async_close()
+        await super().async_will_remove_from_hass()
+
     # -- Native WebRTC implementation ----------------------------------------
 
     async def async_handle_async_webrtc_offer(
@@ -130,6 +186,16 @@ class JetKVMCamera(Camera):
         By overriding this, HA marks us as ``_supports_native_async_webrtc``
         which adds ONLY ``StreamType.WEB_RTC`` (no HLS) to capabilities.
         """
+        if self._relay is not None:
+            try:
+                answer_sdp = await self._relay.async_add_viewer(session_id, offer_sdp)
+                send_message(WebRTCAnswer(answer=answer_sdp))
+            except Exception as err:
+                _LOGGER.error("JetKVM camera: WebRTC relay error: %s", err)
+                if WebRTCError is not None:
+                    send_message(WebRTCError("webrtc_offer_failed", str(err)))
+            return
+
         try:
             async def _on_remote_candidate(candidate_data: dict[str, Any]) -> None:
                 if WebRTCCandidate is None:
@@ -176,15 +242,31 @@ class JetKVMCamera(Camera):
         trickle ICE candidates as ``new-ice-candidate`` messages.
         Older firmware can ignore them safely.
         """
+        if self._relay is not None:
+            await self._relay.async_add_viewer_candidate(session_id, candidate)
+            return
         await self._client.async_webrtc_candidate(session_id, candidate)
 
     @callback
     def close_webrtc_session(self, session_id: str) -> None:
         """Close a WebRTC session."""
+        if self._relay is not None:
+            self.hass.async_create_task(self._relay.async_remove_viewer(session_id))
+            return
         self.hass.async_create_task(self._client.async_close_webrtc_session(session_id))
 
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
-        """The JetKVM has no screenshot endpoint."""
-        return None
+        """Return a still image decoded from the video stream.
+
+        The JetKVM has no screenshot endpoint; without the snapshot option
+        there is no image.
+        """
+        if self._snapshotter is None:
+            return None
+        try:
+            return await self._snapshotter.async_snapshot(width, height)
+        except Exception as err:
+            _LOGGER.debug("JetKVM camera: snapshot failed: %s", err)
+            return None
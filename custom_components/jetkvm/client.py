@@ -1,8 +1,8 @@
 """API client for JetKVM devices.
 
 Communicates with:
-1. The nc-based HTTP server installed on the JetKVM via api-setup.sh
-   (port 8800) for sensor data.
+1. The helper HTTP server installed on the JetKVM via api-setup.sh
+   (port 8800, tcpsvd or nc) for sensor data.
 2. The native JetKVM Go application (port 80) for WebRTC video
    streaming (requires authentication).
 
@@ -10,20 +10,29 @@ Sensor endpoints (port 8800):
     GET /health       -> {"status": "ok"}
     GET /temperature  -> {"temperature": 45.2}
     GET /device_info  -> full device info JSON
+    GET /metrics      -> fast-changing fields (temperature, load, mem, link)
+    GET /inventory    -> slow-changing fields (identity, kernel, IP, disk)
 
 WebRTC endpoints (port 80, authenticated):
     POST /auth/login-local  -> session cookie
     POST /webrtc/session    -> SDP answer (base64)
+    WS   /webrtc/signaling/client -> signaling, JSON-RPC telemetry (push mode)
 """
 import asyncio
 import base64
 import contextlib
+import functools
+import ipaddress
 import json
 import logging
-from dataclasses import dataclass
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
 from typing import Any, Awaitable, Callable
 
 import aiohttp
+from yarl import URL
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,16 +40,44 @@ DEFAULT_PORT = 8800
 HEALTH_PATH = "/health"
 TEMPERATURE_PATH = "/temperature"
 DEVICE_INFO_PATH = "/device_info"
+METRICS_PATH = "/metrics"
+INVENTORY_PATH = "/inventory"
 
 NATIVE_PORT = 80
 AUTH_PATH = "/auth/login-local"
 WEBRTC_SESSION_PATH = "/webrtc/session"
 WEBRTC_SIGNALING_PATH = "/webrtc/signaling/client"
 
-# nc serves one request at a time, so we need delays between retries
+# JSON-RPC methods re-issued over the signaling WebSocket in push mode,
+# and the notifications that carry the same state unsolicited
+TELEMETRY_RPC_METHODS = ("getNetworkState",)
+_TELEMETRY_NOTIFICATIONS = {"networkState": "getNetworkState"}
+
+# Legacy single-shot nc needs a moment to re-listen, so delay between retries
 _REQUEST_DELAY = 1.0
 _MAX_RETRIES = 3
 
+# Adaptive read timeouts: p95 over the last N successful requests of an
+# endpoint, once at least the minimum number have been seen
+_LATENCY_SAMPLES = 50
+_LATENCY_MIN_SAMPLES = 5
+# Not worth starting another attempt with less of the budget left
+_MIN_ATTEMPT_TIME = 0.5
+
+# Per-endpoint statistics: upper bounds (seconds) of the latency histogram
+# buckets, and names for the WebSocket steps that have no HTTP path
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+ENDPOINT_WS_CONNECT = "ws_connect"
+ENDPOINT_WS_OFFER = "ws_offer"
+
+# Connection pooling for the port-8800 API. The device keeps idle
+# keep-alive connections for 75s; close ours first so a poll never
+# lands on a socket the device is about to drop.
+API_CONNECTION_LIMIT = 64
+_CONNECTOR_LIMIT_PER_HOST = 2
+_DNS_CACHE_TTL = 300
+_KEEPALIVE_TIMEOUT = 70
+
 
 class JetKVMError(Exception):
     """Base exception for JetKVM API errors."""
@@ -54,7 +91,576 @@ class JetKVMAuthError(JetKVMError):
     """Authentication with the native JetKVM API failed."""
 
 
+class JetKVMNotFoundError(JetKVMError):
+    """The API server does not provide the requested endpoint."""
+
+
+class JetKVMRPCError(JetKVMError):
+    """The device answered a JSON-RPC call with an error."""
+
+
+class JetKVMNotSupportedError(JetKVMError):
+    """The firmware does not support the requested feature."""
+
+
 RemoteCandidateCallback = Callable[[dict[str, Any]], Awaitable[None] | None]
+TelemetryCallback = Callable[[dict[str, Any]], None]
+RPCNotificationCallback = Callable[[str, Any], None]
+AuthStateCallback = Callable[[dict[str, Any] | None], None]
+
+_RPC_TIMEOUT = 10.0
+
+# Native session cookie: assumed lifetime when the device sends neither
+# Max-Age nor Expires, and how close to expiry it counts as expired
+_AUTH_DEFAULT_LIFETIME = 24 * 3600
+_AUTH_EXPIRY_MARGIN = 300
+
+# Pre-warmed signaling socket: application-level ping period (the device
+# answers "ping" with "pong") and the wait before reconnecting after a
+# failed connect, or a socket the device closed within one ping period
+_SIGNALING_PING_INTERVAL = 20.0
+_SIGNALING_PREWARM_RETRY = 30.0
+_SIGNALING_PREWARM_ATTEMPTS = 3
+
+# Signaling paths, cached per device once one has produced an answer
+SIGNALING_WS = "ws"
+SIGNALING_HTTP = "http"
+# When racing, WS signaling gets this long before legacy HTTP starts
+_SIGNALING_HEAD_START = 1.5
+
+# Open signaling sessions: at most this many (ended ones, then the least
+# recently active evicted first).  Each is pinged this often and closed
+# when the device has not sent anything, pongs included, for this long.
+_WEBRTC_MAX_SESSIONS = 16
+_WEBRTC_SESSION_IDLE_TIMEOUT = 180.0
+_WEBRTC_REAP_INTERVAL = 60.0
+
+# Trickled ICE candidates are collected this long, then sent together
+_CANDIDATE_BATCH_DELAY = 0.02
+
+# Helper API circuit breaker: once a request has failed on every attempt
+# the device counts as down and requests fail at once; a TCP connect probe
+# is tried after the open delay, which doubles on each failed probe
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+_BREAKER_OPEN_DELAY = 15.0
+_BREAKER_MAX_OPEN_DELAY = 300.0
+_PROBE_TIMEOUT = 2.0
+# Probe only once this many attempts of a request have failed; a single
+# refused connection is usually nc re-listening
+_PROBE_AFTER_FAILURES = 2
+
+
+def create_api_session(limit: int = API_CONNECTION_LIMIT) -> aiohttp.ClientSession:
+    """Create a pooled keep-alive session for the port-8800 API.
+
+    One session can be shared by the clients of many devices; ``limit``
+    bounds the total number of sockets it keeps open.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=_CONNECTOR_LIMIT_PER_HOST,
+        ttl_dns_cache=_DNS_CACHE_TTL,
+        keepalive_timeout=_KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+def _map_telemetry(method: str, result: Any) -> dict[str, Any]:
+    """Translate a native JSON-RPC result into /device_info field names."""
+    if not isinstance(result, dict):
+        return {}
+    fields: dict[str, Any] = {}
+    if method == "getNetworkState":
+        for src, dst in (
+            ("hostname", "hostname"),
+            ("mac_address", "mac_address"),
+            ("ipv4", "ip_address"),
+        ):
+            value = result.get(src)
+            if isinstance(value, str) and value:
+                fields[dst] = value
+        state = result.get("state")
+        if isinstance(state, str) and state:
+            fields["network_state"] = state
+        elif "ipv4" in result:
+            fields["network_state"] = "up" if result.get("ipv4") else "down"
+    return fields
+
+
+class _JSONRPCChannel:
+    """JSON-RPC 2.0 over one WebSocket.
+
+    Calls are pipelined: each gets its own id and future, and a single
+    reader task resolves them as replies arrive, in any order.  Batch
+    arrays are sent as one message.  Messages with a ``method`` but no
+    ``id`` are notifications and go to ``on_notification``.
+    """
+
+    def __init__(
+        self,
+        ws: aiohttp.ClientWebSocketResponse,
+        on_notification: RPCNotificationCallback | None = None,
+    ) -> None:
+        self.ws = ws
+        # None until the first batch tells us whether arrays are accepted
+        self.batch_supported: bool | None = None
+        self._on_notification = on_notification
+        self._next_id = 0
+        self._pending: dict[int, asyncio.Future[Any]] = {}
+        self._reader = asyncio.create_task(self._async_read(), name="jetkvm-jsonrpc")
+
+    @property
+    def closed(self) -> bool:
+        """Return True once the socket or its reader is gone."""
+        return self.ws.closed or self._reader.done()
+
+    async def wait_closed(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for the channel to close."""
+        await asyncio.wait((self._reader,), timeout=timeout)
+        return self._reader.done()
+
+    def _request(self, method: str, params: dict | None) -> dict[str, Any]:
+        self._next_id += 1
+        self._pending[self._next_id] = asyncio.get_running_loop().create_future()
+        return {"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params or {}}
+
+    async def call(self, method: str, params: dict | None = None, timeout: float = _RPC_TIMEOUT) -> Any:
+        """Send one call and return its result.
+
+        Raises JetKVMRPCError on an error reply and TimeoutError when no
+        reply arrives in time.
+        """
+        request = self._request(method, params)
+        future = self._pending[request["id"]]
+        try:
+            await self.ws.send_json(request)
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(request["id"], None)
+
+    async def batch(
+        self, calls: list[tuple[str, dict | None]], timeout: float = _RPC_TIMEOUT
+    ) -> list[Any]:
+        """Send ``calls`` as one batch array and return results in call order.
+
+        A call answered with an error yields its JetKVMRPCError in place of
+        a result.  Raises TimeoutError when the replies do not all arrive.
+        """
+        requests = [self._request(method, params) for method, params in calls]
+        futures = [self._pending[request["id"]] for request in requests]
+        try:
+            await self.ws.send_json(requests)
+            results = await asyncio.wait_for(
+                asyncio.gather(*futures, return_exceptions=True), timeout
+            )
+        finally:
+            for request in requests:
+                self._pending.pop(request["id"], None)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, JetKVMRPCError):
+                raise result
+        return results
+
+    async def close(self) -> None:
+        """Close the socket and fail outstanding calls."""
+        self._reader.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await self._reader
+        with contextlib.suppress(Exception):
+            await self.ws.close()
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        if "id" not in message:
+            method = message.get("method")
+            if isinstance(method, str) and self._on_notification is not None:
+                self._on_notification(method, message.get("params"))
+            return
+        reply_id = message["id"]
+        future = self._pending.get(reply_id) if isinstance(reply_id, int) else None
+        if future is None or future.done():
+            return
+        if "error" in message:
+            future.set_exception(JetKVMRPCError(f"JSON-RPC error: {message['error']}"))
+        else:
+            future.set_result(message.get("result"))
+
+    async def _async_read(self) -> None:
+        try:
+            async for msg in self.ws:
+                if msg.type == aiohttp.WSMsgType.ERROR:
+                    break
+                if msg.type != aiohttp.WSMsgType.TEXT or msg.data == "pong":
+                    continue
+                try:
+                    payload = json.loads(msg.data)
+                except ValueError:
+                    continue
+                for message in payload if isinstance(payload, list) else (payload,):
+                    if isinstance(message, dict):
+                        self._dispatch(message)
+        except Exception as err:
+            _LOGGER.debug("JetKVM JSON-RPC reader stopped: %s", err)
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(
+                        JetKVMConnectionError("JetKVM JSON-RPC WebSocket closed")
+                    )
+            self._pending.clear()
+
+
+def _cookie_expiry(morsel: Any, now: float) -> float | None:
+    """Return a cookie's expiry as a Unix timestamp, if it has one."""
+    max_age = str(morsel["max-age"] or "")
+    if max_age.isdigit():
+        return now + int(max_age)
+    if morsel["expires"]:
+        try:
+            return parsedate_to_datetime(morsel["expires"]).timestamp()
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+# Forwarding order within a batch: host candidates first
+_CANDIDATE_TYPE_RANK = {"host": 0, "srflx": 1, "prflx": 2, "relay": 3}
+
+
+def _candidate_fields(data: dict[str, Any]) -> list[str] | None:
+    """Split an ICE candidate string; None for end-of-candidates or garbage."""
+    sdp = data.get("candidate")
+    if not isinstance(sdp, str):
+        return None
+    parts = sdp.removeprefix("candidate:").split()
+    if len(parts) < 8 or parts[6] != "typ":
+        return None
+    return parts
+
+
+def _candidate_key(data: dict[str, Any]) -> tuple | None:
+    """Return the transport address a candidate describes, or None.
+
+    The candidate type is left out: a server-reflexive candidate with the
+    same address as a host candidate (host with a public IP) is redundant.
+    End-of-candidates and unparsable strings have no key.
+    """
+    parts = _candidate_fields(data)
+    if parts is None:
+        return None
+    _foundation, component, protocol, _priority, address, port = parts[:6]
+    return (
+        data.get("sdpMid"),
+        data.get("sdpMLineIndex"),
+        component,
+        protocol.lower(),
+        address.lower(),
+        port,
+    )
+
+
+def _candidate_priority(data: dict[str, Any]) -> int:
+    parts = _candidate_fields(data)
+    try:
+        return int(parts[3]) if parts else 0
+    except ValueError:
+        return 0
+
+
+def _candidate_rank(data: dict[str, Any]) -> int:
+    parts = _candidate_fields(data)
+    # End-of-candidates stays last
+    return _CANDIDATE_TYPE_RANK.get(parts[7], 4) if parts else 5
+
+
+@dataclass(frozen=True)
+class JetKVMCandidatePolicy:
+    """Which trickled ICE candidates are forwarded, in either direction.
+
+    ``lan_only`` drops relay, mDNS (``.local``) and link-local candidates.
+    With ``networks``, only candidates with an address inside one of them
+    are forwarded.  Dropping the browser's candidates does not stop it from
+    connecting: its checks still reach the device, which learns the address
+    as a peer-reflexive candidate.
+    """
+
+    lan_only: bool = False
+    networks: tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...] = ()
+
+    @classmethod
+    def from_options(cls, lan_only: bool, subnets: str) -> "JetKVMCandidatePolicy":
+        """Build a policy from option values; raises ValueError on a bad subnet."""
+        networks = tuple(
+            ipaddress.ip_network(subnet.strip(), strict=False)
+            for subnet in subnets.split(",")
+            if subnet.strip()
+        )
+        return cls(lan_only=lan_only, networks=networks)
+
+    def allows(self, data: dict[str, Any]) -> bool:
+        """Return True if the candidate should be forwarded."""
+        parts = _candidate_fields(data)
+        if parts is None:
+            return True
+        address, candidate_type = parts[4], parts[7]
+        if self.lan_only and candidate_type == "relay":
+            return False
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            # mDNS hostname: cannot be matched against a subnet
+            return not (self.lan_only or self.networks)
+        if self.lan_only and ip.is_link_local:
+            return False
+        if self.networks:
+            return any(ip in network for network in self.networks)
+        return True
+
+
+class _CandidateBatch:
+    """Collect trickled ICE candidates briefly and hand them on together.
+
+    Candidates the policy rejects or for a transport address already sent
+    are dropped; of two in the same window the higher-priority one is
+    kept.  Host candidates are handed on first.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[dict[str, Any]]], Awaitable[None]],
+        policy: JetKVMCandidatePolicy | None = None,
+        delay: float = _CANDIDATE_BATCH_DELAY,
+    ) -> None:
+        self._flush = flush
+        self._policy = policy
+        self._delay = delay
+        self._pending: list[dict[str, Any]] = []
+        self._pending_keys: dict[tuple, int] = {}
+        self._sent_keys: set[tuple] = set()
+        self._task: asyncio.Task[None] | None = None
+        self.dropped = 0
+        self.filtered = 0
+
+    def add(self, candidate: dict[str, Any]) -> None:
+        if self._policy is not None and not self._policy.allows(candidate):
+            self.filtered += 1
+            return
+        key = _candidate_key(candidate)
+        if key is not None:
+            index = self._pending_keys.get(key)
+            if index is not None:
+                if _candidate_priority(candidate) > _candidate_priority(self._pending[index]):
+                    self._pending[index] = candidate
+                self.dropped += 1
+                return
+            if key in self._sent_keys:
+                self.dropped += 1
+                return
+            self._pending_keys[key] = len(self._pending)
+        self._pending.append(candidate)
+        if self._task is None:
+            self._task = asyncio.create_task(self._async_flush())
+
+    async def _async_flush(self) -> None:
+        await asyncio.sleep(self._delay)
+        batch, self._pending = self._pending, []
+        batch.sort(key=_candidate_rank)
+        self._sent_keys.update(self._pending_keys)
+        self._pending_keys = {}
+        self._task = None
+        try:
+            await self._flush(batch)
+        except Exception as err:
+            _LOGGER.debug("JetKVM WebRTC signaling: failed to forward candidates: %s", err)
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._pending = []
+        self._pending_keys = {}
+
+
+@dataclass(frozen=True)
+class JetKVMRetryPolicy:
+    """Attempts, timeouts and time budget for one kind of request.
+
+    The read timeout of an attempt is ``latency_factor`` times the
+    endpoint's observed p95 latency, kept between ``min_read_timeout``
+    and ``max_read_timeout`` (``read_timeout`` until there are enough
+    samples), and doubles on each retry after a timeout.  No attempt
+    starts or runs past ``budget`` seconds after the call began.
+    """
+
+    attempts: int = _MAX_RETRIES
+    delay: float = _REQUEST_DELAY
+    budget: float = 30.0
+    connect_timeout: float = 5.0
+    read_timeout: float = 10.0
+    min_read_timeout: float = 2.0
+    max_read_timeout: float = 30.0
+    latency_factor: float = 3.0
+
+    def adaptive_read_timeout(self, p95: float | None) -> float:
+        """Return the first attempt's read timeout for an observed p95."""
+        if p95 is None:
+            return self.read_timeout
+        return min(max(p95 * self.latency_factor, self.min_read_timeout), self.max_read_timeout)
+
+    def attempt_timeout(self, read_timeout: float, deadline: float) -> aiohttp.ClientTimeout | None:
+        """Return the timeouts of the next attempt, or None once the budget is spent."""
+        remaining = deadline - time.monotonic()
+        if remaining < _MIN_ATTEMPT_TIME:
+            return None
+        return aiohttp.ClientTimeout(
+            total=min(remaining, self.connect_timeout + read_timeout),
+            sock_connect=self.connect_timeout,
+            sock_read=read_timeout,
+        )
+
+
+# Helper API (port 8800) polls, and legacy HTTP WebRTC signaling, where the
+# device gathers ICE candidates before it answers
+API_RETRY_POLICY = JetKVMRetryPolicy()
+WEBRTC_RETRY_POLICY = JetKVMRetryPolicy(
+    budget=45.0, read_timeout=15.0, min_read_timeout=5.0, latency_factor=2.0
+)
+
+
+def _is_read_timeout(err: BaseException) -> bool:
+    """Return True for a timeout waiting on the device, not on connecting."""
+    # aiohttp < 3.10 has no separate connect timeout error
+    connect_timeout = getattr(aiohttp, "ConnectionTimeoutError", ())
+    return isinstance(err, TimeoutError) and not isinstance(err, connect_timeout)
+
+
+@dataclass
+class JetKVMEndpointStats:
+    """Calls, errors and latencies of one endpoint."""
+
+    requests: int = 0       # calls made
+    failures: int = 0       # calls that raised
+    rejected: int = 0       # calls failed at once by the open circuit breaker
+    retries: int = 0        # attempts after the first
+    json_errors: int = 0    # responses that were not valid JSON
+    bytes_received: int = 0  # response bodies
+    last_latency: float | None = None
+    # Successful latencies per LATENCY_BUCKETS bucket, plus one overflow bucket
+    histogram: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    # Recent latencies (and timeouts) the p95 and adaptive timeouts use
+    _recent: deque[float] = field(
+        default_factory=lambda: deque(maxlen=_LATENCY_SAMPLES), repr=False
+    )
+
+    def observe(self, seconds: float) -> None:
+        """Record the latency of a successful request."""
+        self.last_latency = seconds
+        self._recent.append(seconds)
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.histogram[index] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+
+    def observe_timeout(self, seconds: float) -> None:
+        """Count a timed-out attempt towards the p95 only."""
+        self._recent.append(seconds)
+
+    @property
+    def p95(self) -> float | None:
+        if len(self._recent) < _LATENCY_MIN_SAMPLES:
+            return None
+        ordered = sorted(self._recent)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics in a JSON-friendly form (times in ms)."""
+        p95 = self.p95
+        buckets = [f"le_{bound:g}s" for bound in LATENCY_BUCKETS] + ["inf"]
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "retries": self.retries,
+            "json_errors": self.json_errors,
+            "bytes_received": self.bytes_received,
+            "last_latency_ms": (
+                round(self.last_latency * 1000, 1) if self.last_latency is not None else None
+            ),
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "histogram": dict(zip(buckets, self.histogram)),
+        }
+
+
+def _instrumented(endpoint: str | None = None, timed: bool = False):
+    """Count the calls and failures of a client method in its endpoint stats.
+
+    Without ``endpoint`` the method's first argument (a path) names it.
+    With ``timed`` the duration of a successful call is recorded too;
+    otherwise the method records latencies per attempt itself.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            stats = self._endpoint_stats(endpoint or args[0])
+            stats.requests += 1
+            started = time.monotonic()
+            try:
+                result = await func(self, *args, **kwargs)
+            except Exception:
+                stats.failures += 1
+                raise
+            if timed:
+                stats.observe(time.monotonic() - started)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+class _CircuitBreaker:
+    """Closed / open / half-open state of one device's helper API."""
+
+    def __init__(self) -> None:
+        self.state = BREAKER_CLOSED
+        self.delay = _BREAKER_OPEN_DELAY
+        self._retry_at = 0.0
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe is allowed."""
+        return max(self._retry_at - time.monotonic(), 0.0)
+
+    def allow(self) -> bool:
+        """Return False while open; turns half-open once the delay is up."""
+        if self.state == BREAKER_OPEN:
+            if time.monotonic() < self._retry_at:
+                return False
+            self.state = BREAKER_HALF_OPEN
+        return True
+
+    def record_success(self) -> None:
+        self.state = BREAKER_CLOSED
+        self.delay = _BREAKER_OPEN_DELAY
+
+    def record_failure(self) -> None:
+        if self.state == BREAKER_HALF_OPEN:
+            self.delay = min(self.delay * 2, _BREAKER_MAX_OPEN_DELAY)
+        self.state = BREAKER_OPEN
+        self._retry_at = time.monotonic() + self.delay
+
+
+@dataclass
+class JetKVMAuthStats:
+    """Counters for logins against the native API."""
+
+    logins: int = 0       # POSTs to /auth/login-local
+    coalesced: int = 0    # callers that waited on an in-flight login instead
+    failures: int = 0     # logins that raised
 
 
 @dataclass
@@ -62,26 +668,113 @@ class _WebRTCWSSession:
     ws: aiohttp.ClientWebSocketResponse
     reader_task: asyncio.Task[None] | None
     on_remote_candidate: RemoteCandidateCallback | None
+    # Monotonic time the answer arrived
+    created: float = field(default_factory=time.monotonic)
+    # Monotonic time of the last message from the device or candidate sent
+    last_activity: float = field(default_factory=time.monotonic)
+    # Candidates to the device and from it, batched and deduplicated
+    outbound: _CandidateBatch | None = None
+    inbound: _CandidateBatch | None = None
+
+    @property
+    def alive(self) -> bool:
+        """Return True while the socket is open and its reader running."""
+        return not self.ws.closed and (
+            self.reader_task is None or not self.reader_task.done()
+        )
 
 
 class JetKVMClient:
     """Client for the JetKVM BusyBox httpd API (port 8800) and native API (port 80)."""
 
-    def __init__(self, host: str, port: int = DEFAULT_PORT, password: str = "") -> None:
+    def __init__(
+        self,
+        host: str,
+        port: int = DEFAULT_PORT,
+        password: str = "",
+        session: aiohttp.ClientSession | None = None,
+        race_signaling: bool = False,
+        candidate_policy: JetKVMCandidatePolicy | None = None,
+        api_retry: JetKVMRetryPolicy = API_RETRY_POLICY,
+        webrtc_retry: JetKVMRetryPolicy = WEBRTC_RETRY_POLICY,
+    ) -> None:
+        """Initialize the client.
+
+        ``session`` is an optional shared session (see
+        :func:`create_api_session`) for the port-8800 API.  It is not
+        closed by :meth:`close`; without it the client creates its own.
+
+        ``race_signaling`` starts legacy HTTP signaling alongside WS
+        signaling (after a short head start) until the device's
+        signaling path is known, instead of trying them one after the other.
+
+        ``candidate_policy`` filters trickled ICE candidates in both
+        directions; by default all are forwarded.
+
+        ``api_retry`` and ``webrtc_retry`` set attempts, timeouts and the
+        time budget of helper API requests and legacy HTTP offers.
+        """
         self._host = host.rstrip("/")
         self._port = port
         self._password = password
         self._base_url = f"http://{self._host}:{self._port}"
         self._native_url = f"http://{self._host}:{NATIVE_PORT}"
-        self._session: aiohttp.ClientSession | None = None
+        self._session: aiohttp.ClientSession | None = session
+        self._owns_session = session is None
+        # path -> (ETag, parsed body) of the last conditional GET
+        self._etag_cache: dict[str, tuple[str, dict]] = {}
+        self._breaker = _CircuitBreaker()
+        # Device answered "Connection: close": legacy single-shot nc, where
+        # a probe would take the one connection it accepts
+        self._single_shot = False
+        self._api_retry = api_retry
+        self._webrtc_retry = webrtc_retry
+        # Endpoint (path or ENDPOINT_*) -> call statistics and latencies
+        self._stats: dict[str, JetKVMEndpointStats] = {}
         self._native_session: aiohttp.ClientSession | None = None
         self._authenticated = False
+        # Unix time the session cookie expires, and who to tell when it changes
+        self._auth_expires: float | None = None
+        self._auth_listener: AuthStateCallback | None = None
+        self._auth_task: asyncio.Task[None] | None = None
+        self.auth_stats = JetKVMAuthStats()
         self._webrtc_ws_sessions: dict[str, _WebRTCWSSession] = {}
+        self._reaper_task: asyncio.Task[None] | None = None
+        self._rpc: _JSONRPCChannel | None = None
+        self._rpc_lock = asyncio.Lock()
+        self._rpc_listeners: list[RPCNotificationCallback] = []
+        # Idle, authenticated signaling socket kept ready for the next offer
+        self._warm_ws: aiohttp.ClientWebSocketResponse | None = None
+        self._prewarm_task: asyncio.Task[None] | None = None
+        self._prewarm = False
+        self._race_signaling = race_signaling
+        self._signaling_mode: str | None = None
+        self._candidate_policy = candidate_policy or JetKVMCandidatePolicy()
 
     @property
     def host(self) -> str:
         return self._host
 
+    @property
+    def signaling_mode(self) -> str | None:
+        """Return the signaling path that last worked (SIGNALING_WS/HTTP)."""
+        return self._signaling_mode
+
+    @property
+    def breaker_state(self) -> str:
+        """Return the helper API circuit breaker state (BREAKER_*)."""
+        return self._breaker.state
+
+    @property
+    def candidate_policy(self) -> JetKVMCandidatePolicy:
+        """Return the ICE candidate policy."""
+        return self._candidate_policy
+
+    @property
+    def webrtc_session_count(self) -> int:
+        """Return the number of open signaling sessions."""
+        return len(self._webrtc_ws_sessions)
+
     @property
     def has_password(self) -> bool:
         """Return True if a password is configured for native API access."""
@@ -90,8 +783,10 @@ class JetKVMClient:
     # -- session management --------------------------------------------------
 
     async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the pooled keep-alive session for the port-8800 API."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = create_api_session()
+            self._owns_session = True
         return self._session
 
     async def _get_native_session(self) -> aiohttp.ClientSession:
@@ -107,9 +802,18 @@ class JetKVMClient:
         return self._native_session
 
     async def close(self) -> None:
+        await self.async_stop_prewarm()
+        if self._auth_task is not None and not self._auth_task.done():
+            self._auth_task.cancel()
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+            self._reaper_task = None
         for session_id in list(self._webrtc_ws_sessions):
             await self.async_close_webrtc_session(session_id)
-        if self._session and not self._session.closed:
+        if self._rpc is not None:
+            await self._rpc.close()
+            self._rpc = None
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
         if self._native_session and not self._native_session.closed:
             await self._native_session.close()
@@ -120,27 +824,156 @@ class JetKVMClient:
 
     # -- low-level GET -------------------------------------------------------
 
-    async def _get_json(self, path: str) -> dict:
+    async def _async_probe(self) -> bool:
+        """Return True if the helper API port accepts a TCP connection."""
+        try:
+            _reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self._host, self._port), _PROBE_TIMEOUT
+            )
+        except (OSError, TimeoutError) as err:
+            _LOGGER.debug("JetKVM API probe of %s failed: %s", self._base_url, err)
+            return False
+        writer.close()
+        with contextlib.suppress(Exception):
+            await writer.wait_closed()
+        return True
+
+    def _endpoint_stats(self, endpoint: str) -> JetKVMEndpointStats:
+        stats = self._stats.get(endpoint)
+        if stats is None:
+            stats = self._stats[endpoint] = JetKVMEndpointStats()
+        return stats
+
+    @property
+    def endpoint_stats(self) -> dict[str, JetKVMEndpointStats]:
+        """Return the statistics of every endpoint used so far."""
+        return self._stats
+
+    def latency_p95(self, endpoint: str) -> float | None:
+        """Return the observed p95 latency of an endpoint, in seconds."""
+        stats = self._stats.get(endpoint)
+        return stats.p95 if stats is not None else None
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return counters and state for the diagnostics download."""
+        return {
+            "endpoints": {
+                endpoint: stats.as_dict() for endpoint, stats in self._stats.items()
+            },
+            "auth": {
+                "logins": self.auth_stats.logins,
+                "coalesced": self.auth_stats.coalesced,
+                "failures": self.auth_stats.failures,
+                "expires_in": (
+                    round(self._auth_expires - time.time())
+                    if self._auth_expires is not None
+                    else None
+                ),
+            },
+            "breaker": self._breaker.state,
+            "signaling_mode": self._signaling_mode,
+            "webrtc_sessions": self._webrtc_session_table(),
+        }
+
+    def _webrtc_session_table(self) -> list[dict[str, Any]]:
+        """Describe the open signaling sessions, oldest first."""
+        now = time.monotonic()
+        table = []
+        for session_id, ws_session in sorted(
+            self._webrtc_ws_sessions.items(), key=lambda item: item[1].created
+        ):
+            batches = [b for b in (ws_session.outbound, ws_session.inbound) if b is not None]
+            table.append(
+                {
+                    "session_id": session_id,
+                    "age_s": round(now - ws_session.created, 1),
+                    "idle_s": round(now - ws_session.last_activity, 1),
+                    "socket_open": not ws_session.ws.closed,
+                    "candidates_dropped": sum(b.dropped for b in batches),
+                    "candidates_filtered": sum(b.filtered for b in batches),
+                }
+            )
+        return table
+
+    @_instrumented()
+    async def _get_json(self, path: str, conditional: bool = False) -> dict:
         """HTTP GET and parse JSON response.
 
-        Retries up to _MAX_RETRIES times with a small delay between attempts.
+        Retries as set by the API retry policy.  From the second failed
+        attempt on, a TCP probe after the retry delay stops the retries
+        early if the device is gone (not in single-shot nc mode, where the
+        probe would use up the one connection nc accepts).  When every
+        attempt fails the circuit breaker opens and later calls fail at once
+        until a probe gets through again.
+
+        With ``conditional`` the ETag of the last response is sent as
+        ``If-None-Match``.  On ``304 Not Modified`` the cached dict from the
+        last response is returned, so callers must not mutate it.
         """
-        session = await self._get_session()
         url = f"{self._base_url}{path}"
-        last_err = None
+        stats = self._endpoint_stats(path)
+        breaker = self._breaker
+        if not breaker.allow():
+            stats.rejected += 1
+            raise JetKVMConnectionError(
+                f"JetKVM API at {self._base_url} is unreachable "
+                f"(next check in {breaker.retry_in:.0f}s)"
+            )
+        if (
+            breaker.state == BREAKER_HALF_OPEN
+            and not self._single_shot
+            and not await self._async_probe()
+        ):
+            breaker.record_failure()
+            raise JetKVMConnectionError(
+                f"JetKVM API at {self._base_url} is still unreachable "
+                f"(next check in {breaker.delay:.0f}s)"
+            )
 
-        for attempt in range(1, _MAX_RETRIES + 1):
-            _LOGGER.debug("JetKVM API request: GET %s (attempt %d)", url, attempt)
+        session = await self._get_session()
+        last_err = None
+        responded = False
+        cached = self._etag_cache.get(path) if conditional else None
+        headers = {"If-None-Match": cached[0]} if cached else None
+        policy = self._api_retry
+        read_timeout = policy.adaptive_read_timeout(stats.p95)
+        deadline = time.monotonic() + policy.budget
+
+        attempt = 0
+        while attempt < policy.attempts:
+            timeout = policy.attempt_timeout(read_timeout, deadline)
+            if timeout is None:
+                break
+            attempt += 1
+            if attempt > 1:
+                stats.retries += 1
+            _LOGGER.debug(
+                "JetKVM API request: GET %s (attempt %d, read timeout %.1fs)",
+                url, attempt, read_timeout,
+            )
+            started = time.monotonic()
             try:
-                async with session.get(
-                    url, timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
+                async with session.get(url, headers=headers, timeout=timeout) as resp:
                     _LOGGER.debug("JetKVM API response: %s %s", resp.status, url)
+                    responded = True
+                    self._single_shot = (
+                        resp.headers.get("Connection", "").lower() == "close"
+                    )
+                    if breaker.state != BREAKER_CLOSED:
+                        _LOGGER.info("JetKVM %s: API reachable again", self._host)
+                    breaker.record_success()
+                    if resp.status == 304 and cached:
+                        stats.observe(time.monotonic() - started)
+                        return cached[1]
+                    if resp.status == 404:
+                        raise JetKVMNotFoundError(f"HTTP 404 from {url}")
                     if resp.status != 200:
                         raise JetKVMError(
                             f"HTTP {resp.status} from {url}"
                         )
                     raw_text = await resp.text()
+                    stats.observe(time.monotonic() - started)
+                    stats.bytes_received += len(raw_text.encode())
                     _LOGGER.debug("JetKVM API raw response: %s", raw_text[:500])
                     try:
                         data = json.loads(raw_text)
@@ -150,25 +983,61 @@ class JetKVMClient:
                             url, attempt, json_err, raw_text[:200],
                         )
                         last_err = json_err
-                        if attempt < _MAX_RETRIES:
-                            await asyncio.sleep(_REQUEST_DELAY)
+                        stats.json_errors += 1
+                        if attempt < policy.attempts:
+                            await self._async_retry_delay(policy, deadline)
                         continue
                     _LOGGER.debug("JetKVM API data: %s", data)
+                    if conditional:
+                        etag = resp.headers.get("ETag")
+                        if etag and isinstance(data, dict):
+                            self._etag_cache[path] = (etag, data)
+                        else:
+                            self._etag_cache.pop(path, None)
                     return data
+            except aiohttp.ServerDisconnectedError as err:
+                # A pooled keep-alive connection was closed by the device
+                # (idle timeout, server restart); retry on a fresh one.
+                last_err = err
+                _LOGGER.debug(
+                    "JetKVM API attempt %d: connection closed by %s: %s", attempt, url, err
+                )
             except (aiohttp.ClientConnectorError, aiohttp.ClientError, TimeoutError, OSError) as err:
                 last_err = err
                 _LOGGER.debug(
                     "JetKVM API attempt %d failed for %s: %s", attempt, url, err
                 )
-                if attempt < _MAX_RETRIES:
-                    await asyncio.sleep(_REQUEST_DELAY)
+                if _is_read_timeout(err):
+                    # Slower than the device used to be: give it longer
+                    stats.observe_timeout(read_timeout)
+                    read_timeout = min(read_timeout * 2, policy.max_read_timeout)
+                if attempt < policy.attempts:
+                    await self._async_retry_delay(policy, deadline)
+                    if (
+                        attempt >= _PROBE_AFTER_FAILURES
+                        and not self._single_shot
+                        and not await self._async_probe()
+                    ):
+                        break
 
-        # All retries exhausted
+        # All retries exhausted, or the device stopped accepting connections
+        if not responded:
+            if breaker.state == BREAKER_CLOSED:
+                _LOGGER.info(
+                    "JetKVM %s: API unreachable, failing fast for %.0fs",
+                    self._host, breaker.delay,
+                )
+            breaker.record_failure()
         raise JetKVMConnectionError(
-            f"Cannot connect to JetKVM API at {url} after {_MAX_RETRIES} attempts – "
+            f"Cannot connect to JetKVM API at {url} after {attempt} attempts – "
             f"have you run api-setup.sh on the device? ({last_err})"
         )
 
+    @staticmethod
+    async def _async_retry_delay(policy: JetKVMRetryPolicy, deadline: float) -> None:
+        """Wait between attempts, without running past the deadline."""
+        await asyncio.sleep(max(min(policy.delay, deadline - time.monotonic()), 0))
+
     # -- public API (port 8800) ----------------------------------------------
 
     async def check_health(self) -> bool:
@@ -195,6 +1064,18 @@ class JetKVMClient:
         """Return device info dict from /device_info."""
         return await self._get_json(DEVICE_INFO_PATH)
 
+    async def get_metrics(self) -> dict:
+        """Return the fast-changing fields from /metrics."""
+        return await self._get_json(METRICS_PATH)
+
+    async def get_inventory(self) -> dict:
+        """Return the slow-changing fields from /inventory.
+
+        The only conditional request: the hot fields change between any
+        two polls, so /metrics and /device_info never answer 304.
+        """
+        return await self._get_json(INVENTORY_PATH, conditional=True)
+
     async def get_all_data(self) -> dict:
         """Fetch all data needed by the coordinator."""
         return await self.get_device_info()
@@ -212,7 +1093,31 @@ class JetKVMClient:
     # -- native API (port 80) — auth + WebRTC --------------------------------
 
     async def _authenticate(self) -> None:
-        """Authenticate with the JetKVM native API and store session cookie."""
+        """Authenticate with the JetKVM native API and store session cookie.
+
+        Single-flight: callers arriving while a login is in progress wait
+        for that login instead of POSTing their own.
+        """
+        task = self._auth_task
+        if task is not None and not task.done():
+            self.auth_stats.coalesced += 1
+            _LOGGER.debug("JetKVM native auth: waiting for in-flight login")
+        else:
+            self.auth_stats.logins += 1
+            task = self._auth_task = asyncio.create_task(
+                self._async_login(), name=f"jetkvm-login-{self._host}"
+            )
+            task.add_done_callback(self._async_login_done)
+        # Shielded: one caller giving up must not abort everyone's login
+        await asyncio.shield(task)
+
+    def _async_login_done(self, task: asyncio.Task[None]) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            self.auth_stats.failures += 1
+
+    @_instrumented(AUTH_PATH, timed=True)
+    async def _async_login(self) -> None:
+        """POST the password to /auth/login-local."""
         if not self._password:
             raise JetKVMAuthError(
                 "No password configured — video stream requires the JetKVM device password."
@@ -242,17 +1147,96 @@ class JetKVMClient:
                     "JetKVM native auth: success (status %s, cookies: %s)",
                     resp.status, cookie_names,
                 )
+                now = time.time()
+                expiries = [
+                    expiry
+                    for morsel in resp.cookies.values()
+                    if (expiry := _cookie_expiry(morsel, now)) is not None
+                ]
+                self._auth_expires = min(expiries, default=now + _AUTH_DEFAULT_LIFETIME)
                 self._authenticated = True
         except (aiohttp.ClientConnectorError, aiohttp.ClientError, TimeoutError, OSError) as err:
             raise JetKVMConnectionError(
                 f"Cannot connect to JetKVM native API at {url}: {err}"
             ) from err
 
+        self._notify_auth_listener()
+
     async def _ensure_authenticated(self) -> None:
         """Ensure we have a valid session cookie, re-authenticating if needed."""
+        if (
+            self._authenticated
+            and self._auth_expires is not None
+            and time.time() >= self._auth_expires - _AUTH_EXPIRY_MARGIN
+        ):
+            _LOGGER.debug("JetKVM native auth: session cookie about to expire")
+            self._authenticated = False
         if not self._authenticated:
             await self._authenticate()
 
+    def _invalidate_auth(self) -> None:
+        """Forget a session cookie the device no longer accepts."""
+        self._authenticated = False
+        self._auth_expires = None
+        if self._native_session is not None:
+            self._native_session.cookie_jar.clear()
+        self._notify_auth_listener()
+
+    @property
+    def auth_expires(self) -> float | None:
+        """Return when the native session cookie expires (Unix time)."""
+        return self._auth_expires if self._authenticated else None
+
+    def set_auth_listener(self, listener: AuthStateCallback | None) -> None:
+        """Call ``listener`` with export_auth() whenever the session changes."""
+        self._auth_listener = listener
+
+    def _notify_auth_listener(self) -> None:
+        if self._auth_listener is not None:
+            self._auth_listener(self.export_auth())
+
+    def export_auth(self) -> dict[str, Any] | None:
+        """Return the native session cookie in a JSON-serialisable form.
+
+        Returns None when there is no valid session.
+        """
+        if not self._authenticated or self._native_session is None:
+            return None
+        jar = self._native_session.cookie_jar
+        cookies = {
+            morsel.key: morsel.value
+            for morsel in jar.filter_cookies(URL(self._native_url)).values()
+        }
+        if not cookies:
+            return None
+        return {"cookies": cookies, "expires": self._auth_expires}
+
+    async def async_restore_auth(self, state: dict[str, Any]) -> bool:
+        """Reuse a session cookie saved by export_auth().
+
+        Returns False (and leaves the client unauthenticated) when the
+        cookie is missing or about to expire.
+        """
+        cookies = state.get("cookies")
+        expires = state.get("expires")
+        if (
+            not isinstance(cookies, dict)
+            or not cookies
+            or not isinstance(expires, (int, float))
+            or time.time() >= expires - _AUTH_EXPIRY_MARGIN
+        ):
+            return False
+        session = await self._get_native_session()
+        session.cookie_jar.update_cookies(cookies, URL(self._native_url))
+        self._auth_expires = float(expires)
+        self._authenticated = True
+        _LOGGER.debug("JetKVM native auth: restored session cookie (%s)", list(cookies))
+        return True
+
+    async def async_refresh_auth(self) -> None:
+        """Log in again now, replacing the current session cookie."""
+        await self._authenticate()
+
     async def async_check_password(self) -> bool:
         """Test if the configured password is valid. Returns True on success."""
         try:
@@ -261,6 +1245,7 @@ class JetKVMClient:
         except JetKVMAuthError:
             return False
 
+    @_instrumented(WEBRTC_SESSION_PATH)
     async def _async_webrtc_offer_http(self, offer_sdp: str) -> str:
         """Exchange a WebRTC offer through legacy HTTP signaling."""
         url = f"{self._native_url}{WEBRTC_SESSION_PATH}"
@@ -271,27 +1256,39 @@ class JetKVMClient:
         payload = {"sd": sd_b64}
 
         last_err: Exception | None = None
+        policy = self._webrtc_retry
+        stats = self._endpoint_stats(WEBRTC_SESSION_PATH)
+        read_timeout = policy.adaptive_read_timeout(stats.p95)
+        deadline = time.monotonic() + policy.budget
 
-        for attempt in range(1, 4):
+        attempt = 0
+        while attempt < policy.attempts:
             # (Re-)authenticate before each attempt if needed
             await self._ensure_authenticated()
             session = await self._get_native_session()
+            timeout = policy.attempt_timeout(read_timeout, deadline)
+            if timeout is None:
+                break
+            attempt += 1
+            if attempt > 1:
+                stats.retries += 1
 
             _LOGGER.debug(
                 "JetKVM WebRTC session: POST %s (attempt %d)", url, attempt
             )
+            started = time.monotonic()
             try:
                 async with session.post(
                     url,
                     json=payload,
-                    timeout=aiohttp.ClientTimeout(total=15),
+                    timeout=timeout,
                 ) as resp:
                     if resp.status == 401:
                         _LOGGER.debug(
                             "JetKVM WebRTC session: 401 on attempt %d, will re-authenticate",
                             attempt,
                         )
-                        self._authenticated = False
+                        self._invalidate_auth()
                         last_err = JetKVMAuthError(
                             f"HTTP 401 from {url} on attempt {attempt}"
                         )
@@ -304,6 +1301,7 @@ class JetKVMClient:
                         )
 
                     data = await resp.json(content_type=None)
+                    stats.observe(time.monotonic() - started)
                     _LOGGER.debug("JetKVM WebRTC session: response data keys: %s", list(data.keys()))
 
                     answer_b64 = data.get("sd", "")
@@ -333,18 +1331,166 @@ class JetKVMClient:
                 )
                 last_err = err
                 self._authenticated = False
-                if attempt < 3:
-                    await asyncio.sleep(1)
+                if _is_read_timeout(err):
+                    stats.observe_timeout(read_timeout)
+                    read_timeout = min(read_timeout * 2, policy.max_read_timeout)
+                if attempt < policy.attempts:
+                    await self._async_retry_delay(policy, deadline)
+
+        if isinstance(last_err, JetKVMAuthError):
+            raise JetKVMAuthError(
+                f"Failed to authenticate for WebRTC session after {attempt} attempts. "
+                f"Last error: {last_err}"
+            )
+        if last_err is None:
+            # The budget ran out before a request could be sent
+            raise JetKVMConnectionError(
+                f"WebRTC session at {url} timed out after {attempt} attempts "
+                f"({policy.budget:.0f}s budget)"
+            )
+        raise JetKVMConnectionError(
+            f"Cannot connect to JetKVM native API at {url}: {last_err}"
+        ) from last_err
+
+    @_instrumented(ENDPOINT_WS_CONNECT, timed=True)
+    async def _async_connect_signaling(
+        self, heartbeat: float | None = None
+    ) -> aiohttp.ClientWebSocketResponse:
+        """Authenticate and open a signaling WebSocket.
+
+        A rejected (e.g. restored but revoked) session cookie is replaced
+        by a fresh login once.
+        """
+        ws_url = self._native_ws_url()
+        for attempt in (1, 2):
+            await self._ensure_authenticated()
+            session = await self._get_native_session()
+
+            _LOGGER.debug("JetKVM WebRTC signaling: connecting to %s", ws_url)
+            try:
+                return await session.ws_connect(ws_url, timeout=10, heartbeat=heartbeat)
+            except aiohttp.WSServerHandshakeError as err:
+                if err.status == 401 and attempt == 1:
+                    _LOGGER.debug("JetKVM WebRTC signaling: 401, re-authenticating")
+                    self._invalidate_auth()
                     continue
                 raise JetKVMConnectionError(
-                    f"Cannot connect to JetKVM native API at {url}: {err}"
+                    f"Cannot connect to JetKVM signaling WebSocket at {ws_url}: {err}"
                 ) from err
+            except (aiohttp.ClientConnectorError, aiohttp.ClientError, TimeoutError, OSError) as err:
+                raise JetKVMConnectionError(
+                    f"Cannot connect to JetKVM signaling WebSocket at {ws_url}: {err}"
+                ) from err
+        raise JetKVMAuthError("JetKVM signaling WebSocket rejected the session cookie")
 
-        raise JetKVMAuthError(
-            f"Failed to authenticate for WebRTC session after 3 attempts. "
-            f"Last error: {last_err}"
-        )
+    def async_start_prewarm(self) -> None:
+        """Keep one authenticated signaling WebSocket connected and idle.
 
+        The next offer is sent on it straight away instead of waiting for
+        the auth POST and WebSocket handshake.  The socket is kept alive
+        with pings and replaced after it is used or dropped.
+        """
+        self._prewarm = True
+        if self._prewarm_task is None or self._prewarm_task.done():
+            self._prewarm_task = asyncio.create_task(
+                self._async_prewarm_loop(), name=f"jetkvm-prewarm-{self._host}"
+            )
+
+    async def async_stop_prewarm(self) -> None:
+        """Stop pre-warming and close the idle signaling socket."""
+        self._prewarm = False
+        await self._async_pause_prewarm()
+        ws, self._warm_ws = self._warm_ws, None
+        if ws is not None:
+            with contextlib.suppress(Exception):
+                await ws.close()
+
+    async def _async_pause_prewarm(self) -> None:
+        """Stop the keeper task so the warm socket can be read by someone else."""
+        task, self._prewarm_task = self._prewarm_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _async_prewarm_loop(self) -> None:
+        """Connect the warm socket and ping it until cancelled."""
+        loop = asyncio.get_running_loop()
+        failures = 0
+        connected_at = 0.0
+
+        async def _failed(err: Exception | str) -> bool:
+            """Count a failure; back off, or return False to give up."""
+            nonlocal failures
+            failures += 1
+            if failures >= _SIGNALING_PREWARM_ATTEMPTS:
+                _LOGGER.debug("JetKVM WebRTC signaling: giving up pre-warming: %s", err)
+                return False
+            _LOGGER.debug(
+                "JetKVM WebRTC signaling: pre-warm failed, retrying in %ss: %s",
+                _SIGNALING_PREWARM_RETRY, err,
+            )
+            await asyncio.sleep(_SIGNALING_PREWARM_RETRY)
+            return True
+
+        while self._signaling_mode != SIGNALING_HTTP:
+            if self._warm_ws is None or self._warm_ws.closed:
+                try:
+                    self._warm_ws = await self._async_connect_signaling()
+                except JetKVMAuthError as err:
+                    _LOGGER.debug("JetKVM WebRTC signaling: not pre-warming: %s", err)
+                    return
+                except JetKVMError as err:
+                    # Legacy firmware has no signaling WebSocket at all
+                    if not await _failed(err):
+                        return
+                    continue
+                connected_at = loop.time()
+                _LOGGER.debug("JetKVM WebRTC signaling: pre-warmed socket ready")
+
+            ws = self._warm_ws
+            try:
+                await ws.send_str("ping")
+                # Drain pongs and unsolicited messages until the next ping
+                deadline = loop.time() + _SIGNALING_PING_INTERVAL
+                while (remaining := deadline - loop.time()) > 0:
+                    msg = await ws.receive(timeout=remaining)
+                    if msg.type in (
+                        aiohttp.WSMsgType.CLOSED,
+                        aiohttp.WSMsgType.CLOSE,
+                        aiohttp.WSMsgType.ERROR,
+                    ):
+                        break
+            except TimeoutError:
+                continue
+            except (aiohttp.ClientError, ConnectionError, RuntimeError) as err:
+                _LOGGER.debug("JetKVM WebRTC signaling: pre-warmed socket lost: %s", err)
+            if not ws.closed:
+                continue
+            self._warm_ws = None
+            if loop.time() - connected_at < _SIGNALING_PING_INTERVAL:
+                # Accepted, then closed straight away: reconnecting at once
+                # would loop on connect and login
+                if not await _failed("device closed the socket"):
+                    return
+            else:
+                failures = 0
+
+    def _async_resume_prewarm(self) -> None:
+        """Warm a replacement socket once an offer is done with the last one."""
+        if self._prewarm:
+            self.async_start_prewarm()
+
+    async def _async_take_signaling_ws(self) -> aiohttp.ClientWebSocketResponse:
+        """Return the pre-warmed signaling socket, or open a new one."""
+        await self._async_pause_prewarm()
+        ws, self._warm_ws = self._warm_ws, None
+        if ws is not None and not ws.closed:
+            _LOGGER.debug("JetKVM WebRTC signaling: using pre-warmed socket")
+            return ws
+        return await self._async_connect_signaling()
+
+    @_instrumented(ENDPOINT_WS_OFFER)
     async def _async_webrtc_offer_ws(
         self,
         offer_sdp: str,
@@ -352,24 +1498,32 @@ class JetKVMClient:
         on_remote_candidate: RemoteCandidateCallback | None = None,
     ) -> str:
         """Exchange a WebRTC offer through new WebSocket signaling."""
-        await self._ensure_authenticated()
-        session = await self._get_native_session()
-        ws_url = self._native_ws_url()
+        offer_obj = {"type": "offer", "sdp": offer_sdp}
+        offer_b64 = base64.b64encode(json.dumps(offer_obj).encode()).decode()
+        offer = {"type": "offer", "data": {"sd": offer_b64}}
 
-        _LOGGER.debug("JetKVM WebRTC signaling: connecting to %s", ws_url)
         try:
-            ws = await session.ws_connect(ws_url, timeout=10)
-        except (aiohttp.ClientConnectorError, aiohttp.ClientError, TimeoutError, OSError) as err:
-            raise JetKVMConnectionError(
-                f"Cannot connect to JetKVM signaling WebSocket at {ws_url}: {err}"
-            ) from err
+            ws = await self._async_take_signaling_ws()
+            sent = time.monotonic()
+            try:
+                await ws.send_json(offer)
+            except (aiohttp.ClientError, ConnectionError) as err:
+                # The warm socket died since its last ping
+                _LOGGER.debug("JetKVM WebRTC signaling: reconnecting: %s", err)
+                with contextlib.suppress(Exception):
+                    await ws.close()
+                ws = await self._async_connect_signaling()
+                sent = time.monotonic()
+                await ws.send_json(offer)
+        except (aiohttp.ClientError, ConnectionError) as err:
+            self._async_resume_prewarm()
+            raise JetKVMConnectionError(f"Cannot send WebRTC offer: {err}") from err
+        except BaseException:
+            self._async_resume_prewarm()
+            raise
 
         keep_open = False
         try:
-            offer_obj = {"type": "offer", "sdp": offer_sdp}
-            offer_b64 = base64.b64encode(json.dumps(offer_obj).encode()).decode()
-            await ws.send_json({"type": "offer", "data": {"sd": offer_b64}})
-
             for _ in range(50):
                 msg = await ws.receive(timeout=10)
                 if msg.type == aiohttp.WSMsgType.TEXT:
@@ -387,16 +1541,11 @@ class JetKVMClient:
                     answer_sdp = answer_obj.get("sdp", "")
                     if not answer_sdp:
                         raise JetKVMError(f"WebRTC answer has no SDP: {answer_obj}")
+                    self._endpoint_stats(ENDPOINT_WS_OFFER).observe(time.monotonic() - sent)
 
                     if session_id:
-                        reader_task = asyncio.create_task(
-                            self._async_ws_reader(session_id),
-                            name=f"jetkvm-webrtc-{session_id}",
-                        )
-                        self._webrtc_ws_sessions[session_id] = _WebRTCWSSession(
-                            ws=ws,
-                            reader_task=reader_task,
-                            on_remote_candidate=on_remote_candidate,
+                        await self._async_add_webrtc_session(
+                            session_id, ws, on_remote_candidate
                         )
                         keep_open = True
 
@@ -416,6 +1565,219 @@ class JetKVMClient:
             if not keep_open:
                 with contextlib.suppress(Exception):
                     await ws.close()
+            self._async_resume_prewarm()
+
+    # -- native API (port 80) — JSON-RPC -------------------------------------
+
+    async def _get_rpc_channel(self) -> _JSONRPCChannel:
+        """Return the shared JSON-RPC channel, connecting if needed."""
+        async with self._rpc_lock:
+            if self._rpc is not None and not self._rpc.closed:
+                return self._rpc
+            if self._rpc is not None:
+                await self._rpc.close()
+                self._rpc = None
+
+            ws = await self._async_connect_signaling(heartbeat=30)
+            self._rpc = _JSONRPCChannel(ws, self._async_rpc_notification)
+            return self._rpc
+
+    def _async_rpc_notification(self, method: str, params: Any) -> None:
+        for listener in list(self._rpc_listeners):
+            try:
+                listener(method, params)
+            except Exception:
+                _LOGGER.exception("JetKVM JSON-RPC: notification listener failed")
+
+    def add_rpc_listener(self, listener: RPCNotificationCallback) -> Callable[[], None]:
+        """Call ``listener(method, params)`` for JSON-RPC notifications.
+
+        Returns a function that removes the listener again.
+        """
+        self._rpc_listeners.append(listener)
+
+        def _remove() -> None:
+            with contextlib.suppress(ValueError):
+                self._rpc_listeners.remove(listener)
+
+        return _remove
+
+    async def async_rpc(self, method: str, params: dict | None = None) -> Any:
+        """Call one JSON-RPC method on the device and return its result."""
+        channel = await self._get_rpc_channel()
+        try:
+            return await channel.call(method, params)
+        except TimeoutError as err:
+            raise JetKVMConnectionError(f"JSON-RPC {method} timed out") from err
+
+    async def async_rpc_batch(self, calls: list[tuple[str, dict | None]]) -> list[Any]:
+        """Run several JSON-RPC calls in one round trip.
+
+        Sends a batch array; if the firmware ignores arrays, the calls are
+        pipelined individually on the same socket from then on.  Results
+        come back in call order, with a JetKVMRPCError in place of each
+        call the device rejected.
+        """
+        channel = await self._get_rpc_channel()
+        if channel.batch_supported is not False:
+            try:
+                results = await channel.batch(calls)
+            except TimeoutError as err:
+                if channel.batch_supported:
+                    raise JetKVMConnectionError("JSON-RPC batch timed out") from err
+                _LOGGER.debug("JetKVM JSON-RPC: no reply to batch, pipelining calls instead")
+                channel.batch_supported = False
+            else:
+                channel.batch_supported = True
+                return results
+
+        results = await asyncio.gather(
+            *(channel.call(method, params) for method, params in calls),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, TimeoutError):
+                raise JetKVMConnectionError("JSON-RPC call timed out") from result
+            if isinstance(result, BaseException) and not isinstance(result, JetKVMRPCError):
+                raise result
+        return results
+
+    async def async_run_telemetry(
+        self, on_update: TelemetryCallback, interval: float = 10.0
+    ) -> None:
+        """Stream native telemetry over the JSON-RPC WebSocket.
+
+        Re-issues TELEMETRY_RPC_METHODS as one batch every ``interval``
+        seconds and applies matching notifications as they arrive;
+        ``on_update`` is called with all fields seen so far whenever one
+        of them changes.  Runs until cancelled.  Raises
+        JetKVMNotSupportedError when the firmware answers none of the
+        calls on an open socket, and JetKVMConnectionError when the socket
+        closes.
+        """
+        state: dict[str, Any] = {}
+        answered = False
+
+        def _apply(method: str, result: Any) -> None:
+            nonlocal answered
+            answered = True
+            fields = _map_telemetry(method, result)
+            if any(state.get(key) != value for key, value in fields.items()):
+                state.update(fields)
+                on_update(dict(state))
+
+        def _on_notification(method: str, params: Any) -> None:
+            rpc_method = _TELEMETRY_NOTIFICATIONS.get(method)
+            if rpc_method is not None:
+                _apply(rpc_method, params)
+
+        remove_listener = self.add_rpc_listener(_on_notification)
+        try:
+            while True:
+                channel = await self._get_rpc_channel()
+                try:
+                    results = await self.async_rpc_batch(
+                        [(method, None) for method in TELEMETRY_RPC_METHODS]
+                    )
+                except JetKVMConnectionError as err:
+                    # No reply at all on a socket that is still open
+                    if answered or channel.closed:
+                        raise
+                    raise JetKVMNotSupportedError(
+                        "JetKVM firmware does not answer JSON-RPC on the signaling WebSocket"
+                    ) from err
+                for method, result in zip(TELEMETRY_RPC_METHODS, results):
+                    if isinstance(result, JetKVMRPCError):
+                        _LOGGER.debug("JetKVM telemetry: %s failed: %s", method, result)
+                        continue
+                    _apply(method, result)
+                if not answered:
+                    raise JetKVMNotSupportedError(
+                        "JetKVM firmware does not answer the telemetry JSON-RPC calls"
+                    )
+
+                if await channel.wait_closed(interval):
+                    raise JetKVMConnectionError("JetKVM signaling WebSocket closed")
+        finally:
+            remove_listener()
+
+    # -- native API (port 80) — WebRTC signaling -----------------------------
+
+    async def _async_add_webrtc_session(
+        self,
+        session_id: str,
+        ws: aiohttp.ClientWebSocketResponse,
+        on_remote_candidate: RemoteCandidateCallback | None,
+    ) -> None:
+        """Track a signaling socket kept open after its answer."""
+        # A reused session id replaces the old socket
+        await self.async_close_webrtc_session(session_id)
+        while len(self._webrtc_ws_sessions) >= _WEBRTC_MAX_SESSIONS:
+            oldest = min(
+                self._webrtc_ws_sessions,
+                key=lambda sid: (
+                    self._webrtc_ws_sessions[sid].alive,
+                    self._webrtc_ws_sessions[sid].last_activity,
+                ),
+            )
+            _LOGGER.debug(
+                "JetKVM WebRTC signaling: %d sessions open, evicting %s",
+                len(self._webrtc_ws_sessions), oldest,
+            )
+            await self.async_close_webrtc_session(oldest)
+
+        ws_session = _WebRTCWSSession(
+            ws=ws, reader_task=None, on_remote_candidate=on_remote_candidate
+        )
+
+        async def _send(batch: list[dict[str, Any]]) -> None:
+            # The device takes one candidate per message
+            for payload in batch:
+                await ws.send_json({"type": "new-ice-candidate", "data": payload})
+
+        async def _deliver(batch: list[dict[str, Any]]) -> None:
+            for candidate in batch:
+                maybe_awaitable = on_remote_candidate(candidate)
+                if maybe_awaitable is not None:
+                    await maybe_awaitable
+
+        ws_session.outbound = _CandidateBatch(_send, self._candidate_policy)
+        if on_remote_candidate is not None:
+            ws_session.inbound = _CandidateBatch(_deliver, self._candidate_policy)
+        self._webrtc_ws_sessions[session_id] = ws_session
+        ws_session.reader_task = asyncio.create_task(
+            self._async_ws_reader(session_id),
+            name=f"jetkvm-webrtc-{session_id}",
+        )
+        if self._reaper_task is None or self._reaper_task.done():
+            self._reaper_task = asyncio.create_task(
+                self._async_reap_webrtc_sessions(),
+                name=f"jetkvm-webrtc-reaper-{self._host}",
+            )
+
+    async def _async_reap_webrtc_sessions(self) -> None:
+        """Ping signaling sessions and close dead ones; stop once none are left.
+
+        After ICE completes a healthy session carries no signaling traffic,
+        so liveness comes from the device answering pings.  A socket that
+        stopped answering (half-open TCP, hung device) would otherwise keep
+        its reader task for the lifetime of the client.
+        """
+        while self._webrtc_ws_sessions:
+            await asyncio.sleep(_WEBRTC_REAP_INTERVAL)
+            now = time.monotonic()
+            for session_id, ws_session in list(self._webrtc_ws_sessions.items()):
+                if (
+                    not ws_session.alive
+                    or now - ws_session.last_activity > _WEBRTC_SESSION_IDLE_TIMEOUT
+                ):
+                    _LOGGER.debug(
+                        "JetKVM WebRTC signaling: closing dead session %s", session_id
+                    )
+                    await self.async_close_webrtc_session(session_id)
+                    continue
+                with contextlib.suppress(Exception):
+                    await ws_session.ws.send_str("ping")
 
     async def _async_ws_reader(self, session_id: str) -> None:
         """Read signaling events after answer and forward remote ICE candidates."""
@@ -424,7 +1786,7 @@ class JetKVMClient:
             return
 
         ws = ws_session.ws
-        callback = ws_session.on_remote_candidate
+        inbound = ws_session.inbound
 
         try:
             while not ws.closed:
@@ -436,6 +1798,7 @@ class JetKVMClient:
                         break
                     continue
 
+                ws_session.last_activity = time.monotonic()
                 if msg.data == "pong":
                     continue
 
@@ -444,14 +1807,19 @@ class JetKVMClient:
                     continue
 
                 candidate = payload.get("data")
-                if not isinstance(candidate, dict) or callback is None:
+                if not isinstance(candidate, dict) or inbound is None:
                     continue
 
-                maybe_awaitable = callback(candidate)
-                if maybe_awaitable is not None:
-                    await maybe_awaitable
+                inbound.add(candidate)
         except Exception as err:
             _LOGGER.debug("JetKVM WebRTC signaling reader stopped (%s): %s", session_id, err)
+        finally:
+            # Ended on its own (device closed the socket, bad message): drop
+            # the entry and release what it holds.  When the session was
+            # closed from outside, the entry is already gone.
+            if self._webrtc_ws_sessions.get(session_id) is ws_session:
+                del self._webrtc_ws_sessions[session_id]
+                await self._async_release_webrtc_session(ws_session)
 
     async def async_webrtc_offer(
         self,
@@ -465,20 +1833,106 @@ class JetKVMClient:
             POST /webrtc/session
             Body: {"sd": base64(JSON({"type":"offer","sdp":"..."}))}
 
+        Newer firmware uses WebSocket signaling instead.  The path that
+        worked is cached and used directly for later offers.
+
         Returns the SDP answer string.
         """
+        mode = self._signaling_mode
+        if mode is not None:
+            try:
+                if mode == SIGNALING_WS:
+                    return await self._async_webrtc_offer_ws(
+                        offer_sdp,
+                        session_id=session_id,
+                        on_remote_candidate=on_remote_candidate,
+                    )
+                return await self._async_webrtc_offer_http(offer_sdp)
+            except JetKVMConnectionError:
+                # Device unreachable: the other path would not work either
+                raise
+            except JetKVMError as err:
+                _LOGGER.debug(
+                    "JetKVM WebRTC session: cached %s signaling failed (%s), renegotiating",
+                    mode, err,
+                )
+                self._signaling_mode = None
+
+        if self._race_signaling:
+            return await self._async_race_webrtc_offer(
+                offer_sdp, session_id, on_remote_candidate
+            )
+
         try:
-            return await self._async_webrtc_offer_ws(
+            answer = await self._async_webrtc_offer_ws(
                 offer_sdp,
                 session_id=session_id,
                 on_remote_candidate=on_remote_candidate,
             )
+            self._set_signaling_mode(SIGNALING_WS)
+            return answer
         except JetKVMError as err:
             _LOGGER.debug(
                 "JetKVM WebRTC session: WS signaling failed (%s), trying legacy HTTP signaling",
                 err,
             )
-            return await self._async_webrtc_offer_http(offer_sdp)
+        answer = await self._async_webrtc_offer_http(offer_sdp)
+        self._set_signaling_mode(SIGNALING_HTTP)
+        return answer
+
+    def _set_signaling_mode(self, mode: str) -> None:
+        if mode != self._signaling_mode:
+            _LOGGER.debug("JetKVM WebRTC session: %s uses %s signaling", self._host, mode)
+        self._signaling_mode = mode
+
+    async def _async_race_webrtc_offer(
+        self,
+        offer_sdp: str,
+        session_id: str | None,
+        on_remote_candidate: RemoteCandidateCallback | None,
+    ) -> str:
+        """Race WS against legacy HTTP signaling; the first answer wins.
+
+        WS gets a head start so that on current firmware the device only
+        ever sees one offer.
+        """
+        ws_task = asyncio.create_task(
+            self._async_webrtc_offer_ws(
+                offer_sdp,
+                session_id=session_id,
+                on_remote_candidate=on_remote_candidate,
+            )
+        )
+        tasks = {ws_task}
+        try:
+            await asyncio.wait(tasks, timeout=_SIGNALING_HEAD_START)
+            if not (ws_task.done() and ws_task.exception() is None):
+                tasks.add(asyncio.create_task(self._async_webrtc_offer_http(offer_sdp)))
+
+            last_err: BaseException | None = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        self._set_signaling_mode(
+                            SIGNALING_WS if task is ws_task else SIGNALING_HTTP
+                        )
+                        return task.result()
+                    last_err = task.exception()
+                    _LOGGER.debug(
+                        "JetKVM WebRTC session: %s signaling lost the race: %s",
+                        SIGNALING_WS if task is ws_task else SIGNALING_HTTP, last_err,
+                    )
+            raise last_err or JetKVMError("WebRTC signaling did not return an SDP answer")
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError, Exception):
+                        await task
 
     @staticmethod
     def _candidate_to_dict(candidate: Any) -> dict[str, Any]:
@@ -498,16 +1952,16 @@ class JetKVMClient:
         return {"candidate": str(candidate)}
 
     async def async_webrtc_candidate(self, session_id: str, candidate: Any) -> None:
-        """Send an ICE candidate over WebSocket signaling when available."""
+        """Send an ICE candidate over WebSocket signaling when available.
+
+        Candidates are sent in short batches, without duplicates.
+        """
         ws_session = self._webrtc_ws_sessions.get(session_id)
-        if ws_session is None or ws_session.ws.closed:
+        if ws_session is None or ws_session.ws.closed or ws_session.outbound is None:
             return
 
-        try:
-            payload = self._candidate_to_dict(candidate)
-            await ws_session.ws.send_json({"type": "new-ice-candidate", "data": payload})
-        except Exception as err:
-            _LOGGER.debug("JetKVM WebRTC signaling: failed to send candidate: %s", err)
+        ws_session.last_activity = time.monotonic()
+        ws_session.outbound.add(self._candidate_to_dict(candidate))
 
     async def async_close_webrtc_session(self, session_id: str) -> None:
         """Close an active WebRTC signaling session if one exists."""
@@ -518,5 +1972,13 @@ class JetKVMClient:
             ws_session.reader_task.cancel()
             with contextlib.suppress(asyncio.CancelledError, Exception):
                 await ws_session.reader_task
+        await self._async_release_webrtc_session(ws_session)
+
+    @staticmethod
+    async def _async_release_webrtc_session(ws_session: _WebRTCWSSession) -> None:
+        """Stop the candidate batches of a removed session and close its socket."""
+        for batch in (ws_session.outbound, ws_session.inbound):
+            if batch is not None:
+                batch.cancel()
         with contextlib.suppress(Exception):
             await ws_session.ws.close()
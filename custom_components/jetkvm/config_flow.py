@@ -3,8 +3,37 @@ import voluptuous as vol
 from homeassistant import config_entries
 import logging
 
-from .const import DOMAIN
-from .client import JetKVMClient, JetKVMConnectionError, JetKVMAuthError
+from .const import (
+    DOMAIN,
+    CONF_ADAPTIVE_POLLING,
+    CONF_ICE_LAN_ONLY,
+    CONF_ICE_SUBNETS,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_PUSH_TELEMETRY,
+    CONF_RACE_SIGNALING,
+    CONF_SCAN_INTERVAL,
+    CONF_SNAPSHOTS,
+    CONF_WEBRTC_RELAY,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_ICE_LAN_ONLY,
+    DEFAULT_ICE_SUBNETS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_PUSH_TELEMETRY,
+    DEFAULT_RACE_SIGNALING,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SNAPSHOTS,
+    DEFAULT_WEBRTC_RELAY,
+    MAX_ALLOWED_SCAN_INTERVAL,
+    MIN_ALLOWED_SCAN_INTERVAL,
+)
+from .client import (
+    JetKVMAuthError,
+    JetKVMCandidatePolicy,
+    JetKVMClient,
+    JetKVMConnectionError,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,15 +45,60 @@ DATA_SCHEMA = vol.Schema(
 )
 
 
-def _options_schema(current_password: str) -> vol.Schema:
+_INTERVAL = vol.All(
+    vol.Coerce(int),
+    vol.Range(min=MIN_ALLOWED_SCAN_INTERVAL, max=MAX_ALLOWED_SCAN_INTERVAL),
+)
+
+
+def _options_schema(current: dict) -> vol.Schema:
     """Build the options form schema."""
     return vol.Schema(
         {
-            vol.Optional("password", default=current_password): str,
+            vol.Optional("password", default=current["password"]): str,
+            vol.Optional(
+                CONF_SCAN_INTERVAL, default=current[CONF_SCAN_INTERVAL]
+            ): _INTERVAL,
+            vol.Optional(
+                CONF_ADAPTIVE_POLLING, default=current[CONF_ADAPTIVE_POLLING]
+            ): bool,
+            vol.Optional(
+                CONF_MIN_SCAN_INTERVAL, default=current[CONF_MIN_SCAN_INTERVAL]
+            ): _INTERVAL,
+            vol.Optional(
+                CONF_MAX_SCAN_INTERVAL, default=current[CONF_MAX_SCAN_INTERVAL]
+            ): _INTERVAL,
+            vol.Optional(
+                CONF_PUSH_TELEMETRY, default=current[CONF_PUSH_TELEMETRY]
+            ): bool,
+            vol.Optional(
+                CONF_RACE_SIGNALING, default=current[CONF_RACE_SIGNALING]
+            ): bool,
+            vol.Optional(
+                CONF_WEBRTC_RELAY, default=current[CONF_WEBRTC_RELAY]
+            ): bool,
+            vol.Optional(
+                CONF_SNAPSHOTS, default=current[CONF_SNAPSHOTS]
+            ): bool,
+            vol.Optional(
+                CONF_ICE_LAN_ONLY, default=current[CONF_ICE_LAN_ONLY]
+            ): bool,
+            vol.Optional(
+                CONF_ICE_SUBNETS, default=current[CONF_ICE_SUBNETS]
+            ): str,
         }
     )
 
 
+def _valid_subnets(subnets: str) -> bool:
+    """Return True if the ICE subnet option parses."""
+    try:
+        JetKVMCandidatePolicy.from_options(False, subnets)
+    except ValueError:
+        return False
+    return True
+
+
 class JetKVMConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for JetKVM."""
 
@@ -110,9 +184,30 @@ class JetKVMOptionsFlow(config_entries.OptionsFlow):
         """Manage JetKVM options."""
         errors = {}
 
-        current_password = self._entry.options.get(
-            "password", self._entry.data.get("password", "")
-        )
+        options = self._entry.options
+        current = {
+            "password": options.get("password", self._entry.data.get("password", "")),
+            CONF_SCAN_INTERVAL: options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            CONF_ADAPTIVE_POLLING: options.get(
+                CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+            ),
+            CONF_MIN_SCAN_INTERVAL: options.get(
+                CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+            ),
+            CONF_MAX_SCAN_INTERVAL: options.get(
+                CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+            ),
+            CONF_PUSH_TELEMETRY: options.get(
+                CONF_PUSH_TELEMETRY, DEFAULT_PUSH_TELEMETRY
+            ),
+            CONF_RACE_SIGNALING: options.get(
+                CONF_RACE_SIGNALING, DEFAULT_RACE_SIGNALING
+            ),
+            CONF_WEBRTC_RELAY: options.get(CONF_WEBRTC_RELAY, DEFAULT_WEBRTC_RELAY),
+            CONF_SNAPSHOTS: options.get(CONF_SNAPSHOTS, DEFAULT_SNAPSHOTS),
+            CONF_ICE_LAN_ONLY: options.get(CONF_ICE_LAN_ONLY, DEFAULT_ICE_LAN_ONLY),
+            CONF_ICE_SUBNETS: options.get(CONF_ICE_SUBNETS, DEFAULT_ICE_SUBNETS),
+        }
 
         if user_input is not None:
             password = user_input.get("password", "")
@@ -120,7 +215,15 @@ class JetKVMOptionsFlow(config_entries.OptionsFlow):
             client = JetKVMClient(host=host, password=password)
 
             try:
-                if password:
+                if not (
+                    user_input[CONF_MIN_SCAN_INTERVAL]
+                    <= user_input[CONF_SCAN_INTERVAL]
+                    <= user_input[CONF_MAX_SCAN_INTERVAL]
+                ):
+                    errors["base"] = "invalid_interval"
+                elif not _valid_subnets(user_input.get(CONF_ICE_SUBNETS, "")):
+                    errors["base"] = "invalid_subnets"
+                elif password:
                     pw_ok = await client.async_check_password()
                     if not pw_ok:
                         _LOGGER.warning(
@@ -131,7 +234,9 @@ class JetKVMOptionsFlow(config_entries.OptionsFlow):
                         _LOGGER.debug("JetKVM options: password validated for %s", host)
 
                 if not errors:
-                    return self.async_create_entry(title="", data={"password": password})
+                    return self.async_create_entry(
+                        title="", data={**user_input, "password": password}
+                    )
 
             except JetKVMConnectionError as err:
                 _LOGGER.error("JetKVM options: connection failed: %s", err)
@@ -145,11 +250,11 @@ class JetKVMOptionsFlow(config_entries.OptionsFlow):
             finally:
                 await client.close()
 
-            current_password = password
+            current = {**current, **user_input}
 
         return self.async_show_form(
             step_id="init",
-            data_schema=_options_schema(current_password),
+            data_schema=_options_schema(current),
             errors=errors,
         )
 
@@ -4,3 +4,53 @@ from homeassistant.const import Platform
 SCAN_INTERVAL = timedelta(seconds=60)
 PLATFORMS = [Platform.SENSOR, Platform.CAMERA]
 DOMAIN = "jetkvm"
+
+# hass.data key for the port-8800 API session shared by all entries, and
+# the removal callback of its close-on-shutdown listener
+DATA_API_SESSION = f"{DOMAIN}_api_session"
+# hass.data key for the scheduler that polls every entry
+DATA_FLEET = f"{DOMAIN}_fleet"
+
+# .storage file (one per entry) holding the native session cookie, how
+# long before it expires it is refreshed in the background, and the wait
+# before trying again when the device could not be reached
+AUTH_STORAGE_KEY = f"{DOMAIN}.auth"
+AUTH_STORAGE_VERSION = 1
+AUTH_REFRESH_MARGIN = timedelta(hours=1)
+AUTH_REFRESH_RETRY = timedelta(seconds=60)
+
+# Options — polling
+CONF_SCAN_INTERVAL = "scan_interval"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+
+DEFAULT_SCAN_INTERVAL = int(SCAN_INTERVAL.total_seconds())
+DEFAULT_ADAPTIVE_POLLING = True
+DEFAULT_MIN_SCAN_INTERVAL = 15
+DEFAULT_MAX_SCAN_INTERVAL = 300
+MIN_ALLOWED_SCAN_INTERVAL = 5
+MAX_ALLOWED_SCAN_INTERVAL = 3600
+
+# Options — push telemetry over the native WebSocket (needs the password)
+CONF_PUSH_TELEMETRY = "push_telemetry"
+DEFAULT_PUSH_TELEMETRY = False
+
+# Options — start legacy HTTP signaling alongside WS until one answers
+CONF_RACE_SIGNALING = "race_signaling"
+DEFAULT_RACE_SIGNALING = False
+
+# Options — serve all viewers from one device session (needs aiortc)
+CONF_WEBRTC_RELAY = "webrtc_relay"
+DEFAULT_WEBRTC_RELAY = False
+
+# Camera snapshots decoded from the video stream (needs aiortc and Pillow)
+CONF_SNAPSHOTS = "snapshots"
+DEFAULT_SNAPSHOTS = False
+
+# Trickled ICE candidate policy: LAN-only drops relay, mDNS and link-local
+# candidates; subnets (comma-separated CIDRs) limit candidates to those
+CONF_ICE_LAN_ONLY = "ice_lan_only"
+DEFAULT_ICE_LAN_ONLY = False
+CONF_ICE_SUBNETS = "ice_subnets"
+DEFAULT_ICE_SUBNETS = ""
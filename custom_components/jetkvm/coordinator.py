@@ -1,72 +1,313 @@
 """DataUpdateCoordinator for JetKVM."""
+import asyncio
 import logging
+import time
+from collections import deque
 from datetime import datetime, timezone, timedelta
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
-from .const import DOMAIN, SCAN_INTERVAL
-from .client import JetKVMClient, JetKVMError
+from .const import (
+    DOMAIN,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    SCAN_INTERVAL,
+)
+from .client import (
+    DEVICE_INFO_PATH,
+    INVENTORY_PATH,
+    METRICS_PATH,
+    JetKVMAuthError,
+    JetKVMClient,
+    JetKVMError,
+    JetKVMNotFoundError,
+    JetKVMNotSupportedError,
+)
+from .polling import DIAGNOSTIC_CYCLES, AdaptiveInterval, PollCycle
 
 _LOGGER = logging.getLogger(__name__)
 
+# Refresh the slow-changing /inventory fields every N polls
+COLD_REFRESH_POLLS = 10
+
+# Push telemetry: JSON-RPC refresh period on the open WebSocket, and the
+# wait before reconnecting after it drops
+PUSH_RPC_INTERVAL = 10
+PUSH_RETRY_INTERVAL = 60
+
+# now - uptime jitters by request latency; smaller moves keep last_boot
+_LAST_BOOT_TOLERANCE = timedelta(seconds=5)
+
+# Endpoints whose request counters a poll cycle reports
+_POLL_PATHS = (METRICS_PATH, INVENTORY_PATH, DEVICE_INFO_PATH)
+
 
 class JetKVMCoordinator(DataUpdateCoordinator):
     """Coordinator to manage fetching data from JetKVM."""
 
-    def __init__(self, hass: HomeAssistant, client: JetKVMClient) -> None:
-        """Initialize the coordinator."""
-        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=SCAN_INTERVAL)
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: JetKVMClient,
+        scan_interval: timedelta = SCAN_INTERVAL,
+        adaptive: bool = True,
+        min_interval: timedelta = timedelta(seconds=DEFAULT_MIN_SCAN_INTERVAL),
+        max_interval: timedelta = timedelta(seconds=DEFAULT_MAX_SCAN_INTERVAL),
+        fleet_scheduled: bool = False,
+    ) -> None:
+        """Initialize the coordinator.
+
+        With ``fleet_scheduled`` the coordinator runs no timer of its own;
+        the fleet scheduler polls it every ``poll_interval``.
+        """
+        # always_update=False: a poll that returns equal data does not
+        # notify the entities.
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=None if fleet_scheduled else scan_interval,
+            always_update=False,
+        )
         self.client = client
+        self.poll_interval = scan_interval
+        self._fleet_scheduled = fleet_scheduled
         self.device_info: dict = {}
+        self._adaptive = (
+            AdaptiveInterval(scan_interval, min_interval, max_interval)
+            if adaptive
+            else None
+        )
+        # Two-tier fetching: /metrics every poll, /inventory every
+        # COLD_REFRESH_POLLS polls. Falls back to /device_info when the
+        # installed api-setup.sh predates the split endpoints.
+        self._tiered = True
+        self._cold: dict = {}
+        self._polls_until_cold = 0
+        self._last_uptime: float | None = None
+        # Push mode: fields streamed over the native WebSocket
+        self._push_live = False
+        self._native: dict = {}
+        self._last_poll = 0.0
+        self._cycles: deque[PollCycle] = deque(maxlen=DIAGNOSTIC_CYCLES)
+
+    @property
+    def poll_cycles(self) -> list[dict[str, Any]]:
+        """Return traces of the last DIAGNOSTIC_CYCLES polls, oldest first."""
+        return [cycle.as_dict() for cycle in self._cycles]
+
+    def _poll_counters(self) -> tuple[int, int]:
+        """Return the (retries, bytes received) of the poll endpoints so far."""
+        retries = received = 0
+        for path in _POLL_PATHS:
+            stats = self.client.endpoint_stats.get(path)
+            if stats is not None:
+                retries += stats.retries
+                received += stats.bytes_received
+        return retries, received
+
+    async def async_request_cold_refresh(self) -> None:
+        """Refresh identity, kernel and disk fields on the next poll."""
+        self._polls_until_cold = 0
+        await self.async_request_refresh()
+
+    async def _async_fetch(self) -> dict:
+        """Fetch hot fields, plus cold fields when they are due."""
+        if not self._tiered:
+            return await self.client.get_all_data()
 
-    async def _async_update_data(self) -> dict:
-        """Fetch data from the JetKVM device."""
         try:
-            data = await self.client.get_all_data()
+            if self._polls_until_cold <= 0 or not self._cold:
+                self._cold = await self.client.get_inventory()
+                self._polls_until_cold = COLD_REFRESH_POLLS
+            hot = await self.client.get_metrics()
 
-            # Store raw response for device registry info
-            self.device_info = data
+            # Uptime went backwards: the device rebooted, possibly into
+            # new firmware, so the cached cold fields may be stale.
+            uptime = hot.get("uptime_seconds")
+            if (
+                isinstance(uptime, (int, float))
+                and self._last_uptime is not None
+                and uptime < self._last_uptime
+                and self._polls_until_cold < COLD_REFRESH_POLLS
+            ):
+                self._cold = await self.client.get_inventory()
+                self._polls_until_cold = COLD_REFRESH_POLLS
+            if isinstance(uptime, (int, float)):
+                self._last_uptime = uptime
+        except JetKVMNotFoundError:
+            _LOGGER.info(
+                "JetKVM %s: API has no /metrics or /inventory endpoint, "
+                "fetching /device_info every poll. Re-run api-setup.sh on "
+                "the device to enable lighter polling.",
+                self.client.host,
+            )
+            self._tiered = False
+            return await self.client.get_all_data()
+
+        self._polls_until_cold -= 1
+        return {**self._cold, **hot}
 
-            # Build the dict the sensors read from
-            result = {}
+    @callback
+    def async_start_push(self, entry: ConfigEntry) -> None:
+        """Stream native telemetry for the lifetime of the config entry."""
+        entry.async_create_background_task(
+            self.hass,
+            self._async_push_loop(),
+            name=f"{DOMAIN} push telemetry {self.client.host}",
+        )
 
-            if "temperature" in data:
-                result["temperature"] = data["temperature"]
+    async def _async_push_loop(self) -> None:
+        """Keep the telemetry WebSocket open, reconnecting when it drops.
 
-            if "uptime_seconds" in data:
-                try:
-                    uptime = float(data["uptime_seconds"])
-                    result["uptime_seconds"] = uptime
-                    result["last_boot"] = datetime.now(timezone.utc) - timedelta(seconds=uptime)
-                except (ValueError, TypeError):
-                    pass
+        Firmware without JSON-RPC support will not gain it on reconnect,
+        so the loop stops for good and the coordinator keeps polling.
+        """
+        while True:
+            try:
+                await self.client.async_run_telemetry(
+                    self._async_handle_push, interval=PUSH_RPC_INTERVAL
+                )
+            except JetKVMNotSupportedError as err:
+                _LOGGER.info(
+                    "JetKVM %s: push telemetry unavailable, polling only: %s",
+                    self.client.host, err,
+                )
+                return
+            except JetKVMAuthError as err:
+                _LOGGER.warning(
+                    "JetKVM %s: push telemetry disabled: %s", self.client.host, err
+                )
+                return
+            except JetKVMError as err:
+                _LOGGER.debug(
+                    "JetKVM %s: push telemetry stopped, retrying in %ss: %s",
+                    self.client.host, PUSH_RETRY_INTERVAL, err,
+                )
+            finally:
+                self._push_live = False
+                self._native = {}
+            await asyncio.sleep(PUSH_RETRY_INTERVAL)
 
-            if "mem_used_pct" in data:
-                result["mem_used_pct"] = data["mem_used_pct"]
-            if "mem_available_kb" in data:
-                result["mem_available_kb"] = data["mem_available_kb"]
+    @callback
+    def _async_handle_push(self, fields: dict) -> None:
+        """Publish fields pushed by the device without waiting for a poll."""
+        if not self._push_live:
+            _LOGGER.debug("JetKVM %s: receiving push telemetry", self.client.host)
+            self._push_live = True
+        self._native = fields
+        if self.data is None:
+            return
+        # Only the pushed fields are new; the polled ones, and last_boot
+        # derived from the polled uptime, stay as the last poll left them.
+        self.async_set_updated_data({**self.data, **self._build_result(fields)})
 
-            if "disk_used_pct" in data:
-                result["disk_used_pct"] = data["disk_used_pct"]
-            if "disk_available_kb" in data:
-                result["disk_available_kb"] = data["disk_available_kb"]
+        # Pushes reschedule HA's own poll timer; the helper-only fields
+        # (temperature, memory, disk) still need a poll now and then.
+        if time.monotonic() - self._last_poll >= self.poll_interval.total_seconds():
+            self.hass.async_create_task(self.async_request_refresh())
 
-            if "load_average" in data:
-                result["load_average"] = data["load_average"]
+    def _set_interval(self, interval: timedelta) -> None:
+        """Apply the next poll interval, logging changes."""
+        if interval != self.poll_interval:
+            _LOGGER.debug(
+                "JetKVM %s: poll interval %s -> %s",
+                self.client.host, self.poll_interval, interval,
+            )
+            self.poll_interval = interval
+            if not self._fleet_scheduled:
+                self.update_interval = interval
 
-            if "network_state" in data:
-                result["network_state"] = data["network_state"]
+    def _stable_last_boot(self, last_boot: datetime) -> datetime:
+        """Keep the previous boot time unless it actually moved."""
+        previous = (self.data or {}).get("last_boot")
+        if previous is not None and abs(last_boot - previous) < _LAST_BOOT_TOLERANCE:
+            return previous
+        return last_boot
 
-            if "api_version" in data:
-                result["api_version"] = data["api_version"]
+    def _build_result(self, data: dict) -> dict:
+        """Build the dict the sensors read from."""
+        result = {}
+
+        if "temperature" in data:
+            result["temperature"] = data["temperature"]
+
+        if "uptime_seconds" in data:
+            try:
+                uptime = float(data["uptime_seconds"])
+                result["uptime_seconds"] = uptime
+                result["last_boot"] = self._stable_last_boot(
+                    datetime.now(timezone.utc) - timedelta(seconds=uptime)
+                )
+            except (ValueError, TypeError):
+                pass
+
+        if "mem_used_pct" in data:
+            result["mem_used_pct"] = data["mem_used_pct"]
+        if "mem_available_kb" in data:
+            result["mem_available_kb"] = data["mem_available_kb"]
+
+        if "disk_used_pct" in data:
+            result["disk_used_pct"] = data["disk_used_pct"]
+        if "disk_available_kb" in data:
+            result["disk_available_kb"] = data["disk_available_kb"]
+
+        if "load_average" in data:
+            result["load_average"] = data["load_average"]
+
+        if "network_state" in data:
+            result["network_state"] = data["network_state"]
+
+        if "api_version" in data:
+            result["api_version"] = data["api_version"]
+
+        return result
+
+    async def _async_update_data(self) -> dict:
+        """Fetch data from the JetKVM device."""
+        self._last_poll = time.monotonic()
+        cycle = PollCycle()
+        self._cycles.append(cycle)
+        retries_before, bytes_before = self._poll_counters()
+        try:
+            data = await self._async_fetch()
+            fetched = cycle.fetched()
+
+            if self._adaptive is not None:
+                self._set_interval(self._adaptive.on_success(data))
+
+            # Store raw response for device registry info
+            self.device_info = data
 
+            # Pushed fields are fresher than the polled ones
+            result = self._build_result({**data, **self._native})
+            cycle.parsed(fetched, result, self.data)
             return result
 
         except JetKVMError as err:
+            cycle.failed(err)
+            if self._adaptive is not None:
+                self._set_interval(self._adaptive.on_failure())
+            if self._push_live and self.data is not None:
+                # The helper API is down but the device is still pushing:
+                # keep the pushed fields, the helper ones go unavailable
+                _LOGGER.debug(
+                    "JetKVM %s: poll failed, keeping pushed data: %s",
+                    self.client.host, err,
+                )
+                return self._build_result(self._native)
             raise UpdateFailed(f"Error communicating with JetKVM: {err}") from err
         except Exception as err:
+            cycle.failed(err)
+            if self._adaptive is not None:
+                self._set_interval(self._adaptive.on_failure())
             raise UpdateFailed(f"Unexpected error: {err}") from err
+        finally:
+            retries_after, bytes_after = self._poll_counters()
+            cycle.finish(retries_after - retries_before, bytes_after - bytes_before)
@@ -0,0 +1,35 @@
+"""Diagnostics download for JetKVM config entries."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .client import JetKVMClient
+from .const import DOMAIN
+from .coordinator import JetKVMCoordinator
+
+TO_REDACT = {"password", "host", "serial_number", "mac_address", "ip_address", "hostname"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return request statistics, poll traces and device state for a config entry."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    client: JetKVMClient = data["client"]
+    coordinator: JetKVMCoordinator = data["coordinator"]
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "device_info": async_redact_data(coordinator.device_info, TO_REDACT),
+        "poll_interval": coordinator.poll_interval.total_seconds(),
+        "last_update_success": coordinator.last_update_success,
+        "poll_cycles": coordinator.poll_cycles,
+        "client": client.diagnostics(),
+    }
@@ -1,6 +1,6 @@
 """Sensor descriptions for JetKVM integration."""
 from dataclasses import dataclass
-from typing import List
+from typing import Callable, List
 
 from homeassistant.components.sensor import (
     SensorEntityDescription,
@@ -12,6 +12,16 @@ from homeassistant.const import (
     PERCENTAGE,
     UnitOfInformation,
     UnitOfTemperature,
+    UnitOfTime,
+)
+
+from .client import (
+    DEVICE_INFO_PATH,
+    ENDPOINT_WS_OFFER,
+    METRICS_PATH,
+    SIGNALING_HTTP,
+    WEBRTC_SESSION_PATH,
+    JetKVMClient,
 )
 
 
@@ -20,6 +30,32 @@ class JetKVMSensorDescription(SensorEntityDescription):
     """Describes a JetKVM sensor."""
 
 
+@dataclass(frozen=True, kw_only=True)
+class JetKVMClientSensorDescription(SensorEntityDescription):
+    """Describes a JetKVM sensor read from the client's request statistics."""
+
+    value_fn: Callable[[JetKVMClient], float | int | None]
+
+
+def _ms(seconds: float | None) -> float | None:
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+def _poll_latency(client: JetKVMClient) -> float | None:
+    p95 = client.latency_p95(METRICS_PATH)
+    if p95 is None:
+        p95 = client.latency_p95(DEVICE_INFO_PATH)
+    return _ms(p95)
+
+
+def _video_setup_time(client: JetKVMClient) -> float | None:
+    endpoint = (
+        WEBRTC_SESSION_PATH if client.signaling_mode == SIGNALING_HTTP else ENDPOINT_WS_OFFER
+    )
+    stats = client.endpoint_stats.get(endpoint)
+    return _ms(stats.last_latency) if stats is not None else None
+
+
 SENSOR_DESCRIPTIONS: List[JetKVMSensorDescription] = [
     # ---- Diagnostic sensors ----
     JetKVMSensorDescription(
@@ -106,3 +142,57 @@ SENSOR_DESCRIPTIONS: List[JetKVMSensorDescription] = [
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
 ]
+
+
+# Request statistics; disabled by default
+CLIENT_SENSOR_DESCRIPTIONS: List[JetKVMClientSensorDescription] = [
+    JetKVMClientSensorDescription(
+        key="poll_latency",
+        translation_key="poll_latency",
+        icon="mdi:timer-sand",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=_poll_latency,
+    ),
+    JetKVMClientSensorDescription(
+        key="video_setup_time",
+        translation_key="video_setup_time",
+        icon="mdi:video-check-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=_video_setup_time,
+    ),
+    JetKVMClientSensorDescription(
+        key="request_retries",
+        translation_key="request_retries",
+        icon="mdi:refresh",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda client: sum(s.retries for s in client.endpoint_stats.values()),
+    ),
+    JetKVMClientSensorDescription(
+        key="request_failures",
+        translation_key="request_failures",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda client: sum(s.failures for s in client.endpoint_stats.values()),
+    ),
+    JetKVMClientSensorDescription(
+        key="auth_logins",
+        translation_key="auth_logins",
+        icon="mdi:login",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda client: client.auth_stats.logins,
+    ),
+]
@@ -0,0 +1,132 @@
+"""Fleet scheduler — one staggered poll schedule for every JetKVM entry.
+
+Each coordinator would otherwise run its own Home Assistant timer.  With
+many devices on the same interval those timers line up (every entry set
+up during startup polls at the same moment), so the event loop and the
+network see bursts.  The scheduler owns all poll timers instead:
+
+- each device gets a phase offset inside its interval, spread with a
+  golden-ratio sequence (even for any number of devices) plus jitter;
+- the next poll is due one interval after the previous *due* time, so
+  phases do not drift together;
+- at most ``max_concurrent`` polls run at once; the rest wait their turn.
+
+Pollers only need a ``poll_interval`` (timedelta) and ``async_refresh()``.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import random
+import time
+from typing import Any, Callable, Protocol
+
+_LOGGER = logging.getLogger(__name__)
+
+FLEET_MAX_CONCURRENT_POLLS = 8
+# Random share of the gap between devices added to each phase offset
+_PHASE_JITTER = 0.1
+_GOLDEN_RATIO = 0.6180339887498949
+
+
+class FleetPoller(Protocol):
+    """What the scheduler needs from a coordinator."""
+
+    @property
+    def poll_interval(self) -> Any: ...
+
+    async def async_refresh(self) -> None: ...
+
+
+class JetKVMFleetScheduler:
+    """Trigger the polls of many pollers from one loop."""
+
+    def __init__(self, max_concurrent: int = FLEET_MAX_CONCURRENT_POLLS) -> None:
+        """Initialize the scheduler."""
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Monotonic due time of every poller not currently polling
+        self._due: dict[FleetPoller, float] = {}
+        self._polling: dict[FleetPoller, asyncio.Task[None]] = {}
+        self._added = 0
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def size(self) -> int:
+        """Return the number of scheduled pollers."""
+        return len(self._due) + len(self._polling)
+
+    def _phase(self, interval: float) -> float:
+        slot = (self._added * _GOLDEN_RATIO) % 1.0
+        self._added += 1
+        spacing = 1.0 / max(self.size + 1, 1)
+        slot += random.uniform(0, _PHASE_JITTER * spacing)
+        return (slot % 1.0) * interval
+
+    def async_add(self, poller: FleetPoller) -> Callable[[], None]:
+        """Schedule a poller; returns a callback that removes it again."""
+        interval = poller.poll_interval.total_seconds()
+        self._due[poller] = time.monotonic() + self._phase(interval)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(
+                self._async_run(), name="jetkvm-fleet-scheduler"
+            )
+        self._wake.set()
+
+        def _remove() -> None:
+            self._due.pop(poller, None)
+            task = self._polling.pop(poller, None)
+            if task is not None:
+                task.cancel()
+            self._wake.set()
+
+        return _remove
+
+    async def async_close(self) -> None:
+        """Stop the scheduler and any running polls."""
+        self._due.clear()
+        tasks = list(self._polling.values())
+        self._polling.clear()
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+
+    async def _async_run(self) -> None:
+        """Start every poll when it is due; exit once nothing is scheduled."""
+        while self._due or self._polling:
+            self._wake.clear()
+            if not self._due:
+                await self._wake.wait()
+                continue
+            poller, due = min(self._due.items(), key=lambda item: item[1])
+            delay = due - time.monotonic()
+            if delay > 0:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wake.wait(), delay)
+                continue
+            del self._due[poller]
+            self._polling[poller] = asyncio.create_task(
+                self._async_poll(poller, due), name="jetkvm-fleet-poll"
+            )
+
+    async def _async_poll(self, poller: FleetPoller, due: float) -> None:
+        try:
+            async with self._semaphore:
+                await poller.async_refresh()
+        except Exception:
+            _LOGGER.exception("JetKVM fleet: unexpected error while polling")
+        finally:
+            if self._polling.get(poller) is asyncio.current_task():
+                del self._polling[poller]
+                # Keep the phase; a poll that overran starts a fresh period
+                interval = poller.poll_interval.total_seconds()
+                now = time.monotonic()
+                next_due = due + interval
+                self._due[poller] = next_due if next_due > now else now + interval
+                self._wake.set()
@@ -0,0 +1,163 @@
+"""Poll bookkeeping for the coordinator that does not need Home Assistant.
+
+- ``AdaptiveInterval`` picks the next poll interval from temperature and
+  load trends;
+- ``PollCycle`` traces one ``_async_update_data`` run for the diagnostics
+  download: when it started, how long fetching and parsing took, what it
+  cost on the wire and which fields changed — or why it failed.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+# Adaptive polling thresholds
+_TEMP_RISE_C = 1.0          # per-poll temperature rise that counts as a trend
+_TEMP_ALERT_C = 70.0        # SoC temperature where we keep polling fast
+_LOAD_RISE = 0.5            # per-poll 1-minute load rise that counts as a trend
+_LOAD_ALERT = 2.0           # load average where we keep polling fast
+_TEMP_FLAT_C = 0.5          # changes below these count as "flat"
+_LOAD_FLAT = 0.2
+_FLAT_POLLS_BEFORE_BACKOFF = 3
+_BACKOFF_FACTOR = 2
+
+# Poll cycles kept for the diagnostics download
+DIAGNOSTIC_CYCLES = 20
+
+
+def _elapsed_ms(since: float) -> float:
+    return round((time.monotonic() - since) * 1000, 1)
+
+
+@dataclass
+class PollCycle:
+    """Timing trace of one poll."""
+
+    start: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started: float = field(default_factory=time.monotonic, repr=False)
+    fetch_ms: float | None = None
+    parse_ms: float | None = None
+    bytes_received: int = 0
+    retries: int = 0
+    changed: list[str] = field(default_factory=list)
+    error: str | None = None
+
+    def fetched(self) -> float:
+        """Record the end of fetching; returns the monotonic time it ended."""
+        self.fetch_ms = _elapsed_ms(self.started)
+        return time.monotonic()
+
+    def parsed(self, fetched: float, result: dict, previous: dict | None) -> None:
+        """Record the parse time and the fields that differ from ``previous``."""
+        self.parse_ms = _elapsed_ms(fetched)
+        previous = previous or {}
+        self.changed = sorted(
+            key for key in result.keys() | previous.keys()
+            if result.get(key) != previous.get(key)
+        )
+
+    def failed(self, err: BaseException) -> None:
+        """Record why the poll failed."""
+        self.error = f"{type(err).__name__}: {err}"
+
+    def finish(self, retries: int, bytes_received: int) -> None:
+        """Record the request counters; a cycle that never fetched times out here."""
+        if self.fetch_ms is None:
+            self.fetch_ms = _elapsed_ms(self.started)
+        self.retries = retries
+        self.bytes_received = bytes_received
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "start": self.start.isoformat(),
+            "fetch_ms": self.fetch_ms,
+            "parse_ms": self.parse_ms,
+            "bytes_received": self.bytes_received,
+            "retries": self.retries,
+            "changed": self.changed,
+            "error": self.error,
+        }
+
+
+class AdaptiveInterval:
+    """Pick the next poll interval from temperature/load trends.
+
+    Polls at ``min_interval`` while temperature or load is rising or near
+    an alert threshold, returns to ``base_interval`` on ordinary change,
+    and backs off exponentially towards ``max_interval`` when values are
+    flat or the device is unreachable.
+    """
+
+    def __init__(
+        self, base_interval: timedelta, min_interval: timedelta, max_interval: timedelta
+    ) -> None:
+        self.base = base_interval
+        self.min = min(min_interval, base_interval)
+        self.max = max(max_interval, base_interval)
+        self.current = base_interval
+        self._last_temp: float | None = None
+        self._last_load: float | None = None
+        self._flat_polls = 0
+
+    @staticmethod
+    def _as_float(value) -> float | None:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _backoff(self) -> timedelta:
+        return min(max(self.current, self.base) * _BACKOFF_FACTOR, self.max)
+
+    def on_success(self, data: dict) -> timedelta:
+        """Return the interval to use after a successful poll."""
+        temp = self._as_float(data.get("temperature"))
+        load = self._as_float(data.get("load_average"))
+        temp_delta = (
+            temp - self._last_temp
+            if temp is not None and self._last_temp is not None
+            else None
+        )
+        load_delta = (
+            load - self._last_load
+            if load is not None and self._last_load is not None
+            else None
+        )
+        if temp is not None:
+            self._last_temp = temp
+        if load is not None:
+            self._last_load = load
+
+        hot = (temp is not None and temp >= _TEMP_ALERT_C) or (
+            load is not None and load >= _LOAD_ALERT
+        )
+        rising = (temp_delta is not None and temp_delta >= _TEMP_RISE_C) or (
+            load_delta is not None and load_delta >= _LOAD_RISE
+        )
+        flat = (
+            temp_delta is not None
+            and abs(temp_delta) < _TEMP_FLAT_C
+            and (load_delta is None or abs(load_delta) < _LOAD_FLAT)
+        )
+
+        if hot or rising:
+            self._flat_polls = 0
+            self.current = self.min
+        elif flat:
+            self._flat_polls += 1
+            if self._flat_polls >= _FLAT_POLLS_BEFORE_BACKOFF:
+                self.current = self._backoff()
+            else:
+                self.current = max(self.current, self.base)
+        else:
+            self._flat_polls = 0
+            self.current = self.base
+        return self.current
+
+    def on_failure(self) -> timedelta:
+        """Return the interval to use after a failed poll."""
+        self._flat_polls = 0
+        self.current = self._backoff()
+        return self.current
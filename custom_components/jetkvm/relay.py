@@ -0,0 +1,259 @@
+"""Optional WebRTC relay — one device session shared by many viewers.
+
+Without the relay every Home Assistant viewer negotiates its own WebRTC
+session with the JetKVM, so the device encodes and uploads the stream
+once per viewer.  The relay opens a single upstream peer connection to
+the device and serves each viewer from it with aiortc's ``MediaRelay``.
+
+aiortc is not a requirement of the integration (Home Assistant does not
+ship it); the relay is only used when the option is enabled *and* aiortc
+can be imported.  aiortc decodes the upstream video and re-encodes it per
+viewer, so the relay trades CPU on the Home Assistant host for device
+encoder time and uplink bandwidth.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import Any
+
+from .client import JetKVMClient
+
+_LOGGER = logging.getLogger(__name__)
+
+try:
+    from aiortc import RTCPeerConnection, RTCSessionDescription
+    from aiortc.contrib.media import MediaRelay
+    from aiortc.sdp import candidate_from_sdp
+except ImportError:
+    RTCPeerConnection = None  # type: ignore[assignment,misc]
+    RTCSessionDescription = None  # type: ignore[assignment,misc]
+    MediaRelay = None  # type: ignore[assignment,misc]
+    candidate_from_sdp = None  # type: ignore[assignment]
+
+# Signaling session id of the upstream connection on the client
+RELAY_SESSION_ID = "relay-upstream"
+# Keep the upstream session this long after the last viewer leaves, so a
+# dashboard reload does not renegotiate with the device
+_UPSTREAM_IDLE_TIMEOUT = 30
+_UPSTREAM_TRACK_TIMEOUT = 10
+
+
+def relay_available() -> bool:
+    """Return True if aiortc is installed."""
+    return RTCPeerConnection is not None
+
+
+def _parse_candidate(data: dict[str, Any]) -> Any | None:
+    """Build an aiortc RTCIceCandidate from a JSON candidate dict."""
+    sdp = data.get("candidate") or ""
+    if sdp.startswith("candidate:"):
+        sdp = sdp[len("candidate:"):]
+    if not sdp:
+        return None
+    ice = candidate_from_sdp(sdp)
+    ice.sdpMid = data.get("sdpMid")
+    ice.sdpMLineIndex = data.get("sdpMLineIndex")
+    return ice
+
+
+def _candidate_data(candidate: Any) -> dict[str, Any]:
+    """Normalize an HA RTCIceCandidateInit (or dict) to JSON field names."""
+    if isinstance(candidate, dict):
+        return candidate
+    return {
+        "candidate": getattr(candidate, "candidate", None),
+        "sdpMid": getattr(candidate, "sdp_mid", getattr(candidate, "sdpMid", None)),
+        "sdpMLineIndex": getattr(
+            candidate, "sdp_m_line_index", getattr(candidate, "sdpMLineIndex", None)
+        ),
+    }
+
+
+class JetKVMRelay:
+    """Fan one upstream JetKVM video track out to many viewer connections."""
+
+    def __init__(self, client: JetKVMClient) -> None:
+        """Initialize the relay."""
+        self._client = client
+        self._upstream: Any | None = None
+        self._video: Any | None = None
+        self._media_relay: Any | None = None
+        self._viewers: dict[str, Any] = {}
+        self._lock = asyncio.Lock()
+        self._idle_close: asyncio.TimerHandle | None = None
+        self._idle_close_task: asyncio.Task[None] | None = None
+
+    @property
+    def viewer_count(self) -> int:
+        """Return the number of connected viewers."""
+        return len(self._viewers)
+
+    @property
+    def upstream_connected(self) -> bool:
+        """Return True while the device session is up."""
+        return self._upstream is not None and self._upstream.connectionState not in (
+            "failed",
+            "closed",
+        )
+
+    async def _async_ensure_upstream(self) -> Any:
+        """Return the upstream video track, negotiating with the device if needed."""
+        if self.upstream_connected and self._video is not None:
+            return self._video
+        await self._async_close_upstream()
+
+        pc = RTCPeerConnection()
+        track_ready: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+
+        @pc.on("track")
+        def _on_track(track: Any) -> None:
+            if track.kind == "video" and not track_ready.done():
+                track_ready.set_result(track)
+
+        async def _on_remote_candidate(candidate: dict[str, Any]) -> None:
+            ice = _parse_candidate(candidate)
+            if ice is not None:
+                await pc.addIceCandidate(ice)
+
+        pc.addTransceiver("video", direction="recvonly")
+        try:
+            await pc.setLocalDescription(await pc.createOffer())
+            answer_sdp = await self._client.async_webrtc_offer(
+                pc.localDescription.sdp,
+                session_id=RELAY_SESSION_ID,
+                on_remote_candidate=_on_remote_candidate,
+            )
+            await pc.setRemoteDescription(
+                RTCSessionDescription(sdp=answer_sdp, type="answer")
+            )
+            track = await asyncio.wait_for(track_ready, _UPSTREAM_TRACK_TIMEOUT)
+        except BaseException:
+            await self._client.async_close_webrtc_session(RELAY_SESSION_ID)
+            await pc.close()
+            raise
+
+        _LOGGER.debug("JetKVM relay %s: upstream session connected", self._client.host)
+        self._upstream = pc
+        self._video = track
+        self._media_relay = MediaRelay()
+        return track
+
+    async def _async_close_upstream(self) -> None:
+        pc, self._upstream = self._upstream, None
+        self._video = None
+        self._media_relay = None
+        if pc is None:
+            return
+        _LOGGER.debug("JetKVM relay %s: closing upstream session", self._client.host)
+        await self._client.async_close_webrtc_session(RELAY_SESSION_ID)
+        with contextlib.suppress(Exception):
+            await pc.close()
+
+    def _cancel_idle_close(self) -> None:
+        if self._idle_close is not None:
+            self._idle_close.cancel()
+            self._idle_close = None
+        if self._idle_close_task is not None:
+            self._idle_close_task.cancel()
+            self._idle_close_task = None
+
+    async def _async_close_if_idle(self) -> None:
+        """Close the upstream unless a viewer or grab claimed it meanwhile."""
+        async with self._lock:
+            self._idle_close_task = None
+            if not self._viewers:
+                await self._async_close_upstream()
+
+    def _schedule_idle_close(self) -> None:
+        self._cancel_idle_close()
+        loop = asyncio.get_running_loop()
+
+        def _close_if_idle() -> None:
+            self._idle_close = None
+            self._idle_close_task = loop.create_task(self._async_close_if_idle())
+
+        self._idle_close = loop.call_later(_UPSTREAM_IDLE_TIMEOUT, _close_if_idle)
+
+    async def async_add_viewer(self, session_id: str, offer_sdp: str) -> str:
+        """Answer a viewer's offer with a connection fed from the upstream track."""
+        async with self._lock:
+            self._cancel_idle_close()
+            track = await self._async_ensure_upstream()
+            media_relay = self._media_relay
+
+        pc = RTCPeerConnection()
+        self._viewers[session_id] = pc
+        try:
+            pc.addTrack(media_relay.subscribe(track))
+            await pc.setRemoteDescription(
+                RTCSessionDescription(sdp=offer_sdp, type="offer")
+            )
+            await pc.setLocalDescription(await pc.createAnswer())
+        except BaseException:
+            await self.async_remove_viewer(session_id)
+            raise
+
+        _LOGGER.debug(
+            "JetKVM relay %s: viewer %s joined (%d watching)",
+            self._client.host, session_id, len(self._viewers),
+        )
+        return pc.localDescription.sdp
+
+    async def async_grab_frame(self, timeout: float = _UPSTREAM_TRACK_TIMEOUT) -> Any:
+        """Return the next decoded video frame from the upstream session.
+
+        Uses the running upstream session when viewers are connected;
+        otherwise one is opened and kept for the idle timeout, so
+        back-to-back grabs share it.
+        """
+        async with self._lock:
+            self._cancel_idle_close()
+            track = await self._async_ensure_upstream()
+            media_relay = self._media_relay
+
+        subscription = media_relay.subscribe(track, buffered=False)
+        try:
+            return await asyncio.wait_for(subscription.recv(), timeout)
+        finally:
+            subscription.stop()
+            if not self._viewers and self._upstream is not None:
+                self._schedule_idle_close()
+
+    async def async_add_viewer_candidate(self, session_id: str, candidate: Any) -> None:
+        """Apply a trickled ICE candidate from a viewer."""
+        pc = self._viewers.get(session_id)
+        if pc is None:
+            return
+        try:
+            data = _candidate_data(candidate)
+            if not self._client.candidate_policy.allows(data):
+                return
+            ice = _parse_candidate(data)
+            if ice is not None:
+                await pc.addIceCandidate(ice)
+        except Exception as err:
+            _LOGGER.debug("JetKVM relay: ignoring viewer candidate: %s", err)
+
+    async def async_remove_viewer(self, session_id: str) -> None:
+        """Disconnect a viewer; the upstream closes once nobody is watching."""
+        pc = self._viewers.pop(session_id, None)
+        if pc is not None:
+            with contextlib.suppress(Exception):
+                await pc.close()
+        if not self._viewers and self._upstream is not None:
+            self._schedule_idle_close()
+
+    async def async_close(self) -> None:
+        """Disconnect every viewer and the upstream session."""
+        task = self._idle_close_task
+        self._cancel_idle_close()
+        if task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        for session_id in list(self._viewers):
+            pc = self._viewers.pop(session_id)
+            with contextlib.suppress(Exception):
+                await pc.close()
+        await self._async_close_upstream()
@@ -1,6 +1,6 @@
 """Sensor platform for JetKVM integration."""
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
@@ -9,12 +9,32 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .client import JetKVMClient
 from .const import DOMAIN
 from .coordinator import JetKVMCoordinator
-from .enum import SENSOR_DESCRIPTIONS, JetKVMSensorDescription
+from .enum import (
+    CLIENT_SENSOR_DESCRIPTIONS,
+    SENSOR_DESCRIPTIONS,
+    JetKVMClientSensorDescription,
+    JetKVMSensorDescription,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# How often the request-statistics sensors are read (no device I/O)
+SCAN_INTERVAL = timedelta(seconds=60)
+
+
+def _device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Return device info linking an entity to the JetKVM device."""
+    serial = entry.data.get("serial_number", "")
+    identifiers = set()
+    if serial:
+        identifiers.add((DOMAIN, serial))
+    else:
+        identifiers.add((DOMAIN, entry.entry_id))
+    return DeviceInfo(identifiers=identifiers)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -23,11 +43,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up JetKVM sensors from a config entry."""
     coordinator: JetKVMCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    client: JetKVMClient = hass.data[DOMAIN][entry.entry_id]["client"]
 
     async_add_entities(
         JetKVMSensor(coordinator, entry, description)
         for description in SENSOR_DESCRIPTIONS
     )
+    async_add_entities(
+        JetKVMClientSensor(client, entry, description)
+        for description in CLIENT_SENSOR_DESCRIPTIONS
+    )
 
 
 class JetKVMSensor(CoordinatorEntity[JetKVMCoordinator], SensorEntity):
@@ -47,12 +72,33 @@ class JetKVMSensor(CoordinatorEntity[JetKVMCoordinator], SensorEntity):
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._entry = entry
+        # (available, native_value) last written to the state machine
+        self._written_state: tuple[bool, float | str | datetime | None] | None = None
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+        """Handle updated data from the coordinator.
+
+        Only writes state when this sensor's value or availability changed,
+        so unchanged sensors do not hit the event bus and recorder.
+        """
+        state = (self.available, self.native_value)
+        if state == self._written_state:
+            return
+        self._written_state = state
         self.async_write_ha_state()
 
+    @property
+    def available(self) -> bool:
+        """Return False when the last update did not report this field.
+
+        While only push telemetry is live, the helper API fields are
+        missing and their sensors unavailable rather than stale.
+        """
+        return super().available and self.entity_description.key in (
+            self.coordinator.data or {}
+        )
+
     @property
     def native_value(self) -> float | str | datetime | None:
         """Return the sensor value."""
@@ -63,14 +109,40 @@ class JetKVMSensor(CoordinatorEntity[JetKVMCoordinator], SensorEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info to link this entity to the device registry."""
-        data = self._entry.data
-        serial = data.get("serial_number", "")
+        return _device_info(self._entry)
+
 
-        identifiers = set()
-        if serial:
-            identifiers.add((DOMAIN, serial))
-        else:
-            identifiers.add((DOMAIN, self._entry.entry_id))
+class JetKVMClientSensor(SensorEntity):
+    """Diagnostic sensor reading the client's request statistics.
 
-        return DeviceInfo(identifiers=identifiers)
+    Polled every SCAN_INTERVAL rather than driven by the coordinator: the
+    statistics change with every request, including polls that return
+    unchanged data and video sessions.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = True
+    entity_description: JetKVMClientSensorDescription
+
+    def __init__(
+        self,
+        client: JetKVMClient,
+        entry: ConfigEntry,
+        description: JetKVMClientSensorDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._client = client
+        self._entry = entry
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the sensor value."""
+        return self.entity_description.value_fn(self._client)
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info to link this entity to the device registry."""
+        return _device_info(self._entry)
 
@@ -0,0 +1,97 @@
+"""Camera snapshots from the JetKVM video stream.
+
+The device has no screenshot endpoint, so a frame is taken from a WebRTC
+session (through :class:`~.relay.JetKVMRelay`), converted once and cached
+for SNAPSHOT_TTL seconds.  Every size requested during that time is
+scaled from the same frame, so many dashboard cards asking for
+thumbnails cost one device session at most.
+
+Needs aiortc (frame decoding) and Pillow (scaling, JPEG encoding).
+"""
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import time
+from typing import Any
+
+from .relay import JetKVMRelay, relay_available
+
+_LOGGER = logging.getLogger(__name__)
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None  # type: ignore[assignment]
+
+SNAPSHOT_TTL = 10
+_JPEG_QUALITY = 80
+
+
+def snapshots_available() -> bool:
+    """Return True if aiortc and Pillow are installed."""
+    return relay_available() and Image is not None
+
+
+def _scaled_size(
+    size: tuple[int, int], width: int | None, height: int | None
+) -> tuple[int, int]:
+    """Fit ``size`` into the requested box, keeping the aspect ratio."""
+    src_w, src_h = size
+    scale = 1.0
+    if width:
+        scale = min(scale, width / src_w)
+    if height:
+        scale = min(scale, height / src_h)
+    return max(1, round(src_w * scale)), max(1, round(src_h * scale))
+
+
+def _encode_jpeg(image: Any, width: int | None, height: int | None) -> bytes:
+    size = _scaled_size(image.size, width, height)
+    if size != image.size:
+        image = image.resize(size, Image.BILINEAR)
+    buf = io.BytesIO()
+    image.convert("RGB").save(buf, format="JPEG", quality=_JPEG_QUALITY)
+    return buf.getvalue()
+
+
+class JetKVMSnapshotter:
+    """Cache the latest decoded frame and serve scaled JPEGs from it."""
+
+    def __init__(self, relay: JetKVMRelay, ttl: float = SNAPSHOT_TTL) -> None:
+        """Initialize the snapshotter."""
+        self._relay = relay
+        self._ttl = ttl
+        self._lock = asyncio.Lock()
+        self._image: Any | None = None
+        self._taken = 0.0
+        self._jpegs: dict[tuple[int | None, int | None], bytes] = {}
+
+    async def async_snapshot(
+        self, width: int | None = None, height: int | None = None
+    ) -> bytes:
+        """Return a JPEG no older than the TTL, scaled to fit width x height."""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            if self._image is None or time.monotonic() - self._taken > self._ttl:
+                frame = await self._relay.async_grab_frame()
+                self._image = await loop.run_in_executor(None, frame.to_image)
+                self._taken = time.monotonic()
+                self._jpegs = {}
+                _LOGGER.debug("JetKVM snapshot: new %dx%d frame", *self._image.size)
+
+            key = (width, height)
+            jpeg = self._jpegs.get(key)
+            if jpeg is None:
+                jpeg = await loop.run_in_executor(
+                    None, _encode_jpeg, self._image, width, height
+                )
+                self._jpegs[key] = jpeg
+            return jpeg
+
+    async def async_close(self) -> None:
+        """Drop the cached frame and close the snapshot session."""
+        self._image = None
+        self._jpegs = {}
+        await self._relay.async_close()
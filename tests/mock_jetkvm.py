@@ -36,7 +36,7 @@ async def cgi_temperature(request: web.Request) -> web.Response:
     return web.json_response({"temperature": temp})
 
 
-async def cgi_device_info(request: web.Request) -> web.Response:
+def build_device_info() -> dict:
     temp = get_temperature()
     mem_total = 262144
     mem_avail = random.randint(100000, 200000)
@@ -66,15 +66,41 @@ async def cgi_device_info(request: web.Request) -> web.Response:
         "disk_available_kb": disk_avail,
         "disk_used_pct": disk_used_pct,
     }
-    print(f"[API] /device_info -> temp={temp}")
+    return info
+
+
+# Field split used by the real /metrics and /inventory endpoints
+HOT_KEYS = (
+    "network_state", "temperature", "uptime_seconds", "load_average",
+    "mem_total_kb", "mem_available_kb", "mem_used_pct",
+)
+
+
+async def cgi_device_info(request: web.Request) -> web.Response:
+    info = build_device_info()
+    print(f"[API] /device_info -> temp={info['temperature']}")
     return web.json_response(info)
 
 
+async def cgi_metrics(request: web.Request) -> web.Response:
+    info = build_device_info()
+    print(f"[API] /metrics -> temp={info['temperature']}")
+    return web.json_response({k: info[k] for k in HOT_KEYS})
+
+
+async def cgi_inventory(request: web.Request) -> web.Response:
+    info = build_device_info()
+    print("[API] /inventory")
+    return web.json_response({k: v for k, v in info.items() if k not in HOT_KEYS})
+
+
 def main():
     app = web.Application()
     app.router.add_get("/health", cgi_health)
     app.router.add_get("/temperature", cgi_temperature)
     app.router.add_get("/device_info", cgi_device_info)
+    app.router.add_get("/metrics", cgi_metrics)
+    app.router.add_get("/inventory", cgi_inventory)
 
     print("=" * 55)
     print("  Mock JetKVM API Server")
@@ -85,6 +111,8 @@ def main():
     print(f"  http://127.0.0.1:{PORT}/health")
     print(f"  http://127.0.0.1:{PORT}/temperature")
     print(f"  http://127.0.0.1:{PORT}/device_info")
+    print(f"  http://127.0.0.1:{PORT}/metrics")
+    print(f"  http://127.0.0.1:{PORT}/inventory")
     print()
     print("=" * 55)
     print()
@@ -15,10 +15,16 @@ if sys.platform == "win32":
 # Add the repo root so we can import custom_components
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+import aiohttp
 from aiohttp import web
 
 # ---- inline mock handlers (same as mock_jetkvm.py) ----
-import random, time, json
+import base64, hashlib, random, time, json
+
+# Transports that served /device_info, to check keep-alive reuse
+_INFO_TRANSPORTS = set()
+# Status codes returned by /inventory, to check conditional requests
+_INVENTORY_STATUS = []
 
 def _temp():
     return round(45.0 + random.uniform(-7, 7), 1)
@@ -29,12 +35,130 @@ async def h_health(r):
 async def h_temp(r):
     return web.json_response({"temperature": _temp()})
 
+HOT_KEYS = (
+    "network_state", "temperature", "uptime_seconds", "load_average",
+    "mem_total_kb", "mem_available_kb", "mem_used_pct",
+)
+
+async def h_metrics(r):
+    info = await _info_dict()
+    return web.json_response({k: info[k] for k in HOT_KEYS})
+
+async def h_inventory(r):
+    info = await _info_dict()
+    body = json.dumps({k: v for k, v in info.items() if k not in HOT_KEYS})
+    etag = '"%s"' % hashlib.md5(body.encode()).hexdigest()[:16]
+    if r.headers.get("If-None-Match") == etag:
+        _INVENTORY_STATUS.append(304)
+        return web.Response(status=304, headers={"ETag": etag})
+    _INVENTORY_STATUS.append(200)
+    return web.Response(text=body, content_type="application/json", headers={"ETag": etag})
+
+# A device on a slow link: answers after half a second
+async def h_slow(r):
+    await asyncio.sleep(0.5)
+    return web.json_response({"status": "ok"})
+
 async def h_info(r):
+    _INFO_TRANSPORTS.add(id(r.transport))
+    return web.json_response(await _info_dict())
+
+def _rpc_reply(call):
+    if call["method"] == "getDeviceID":
+        return {"jsonrpc": "2.0", "id": call["id"], "result": "18cb28a5431d2479"}
+    if call["method"] == "getNetworkState":
+        return {"jsonrpc": "2.0", "id": call["id"],
+                "result": {"hostname": "jetkvm-mock", "ipv4": "127.0.0.1"}}
+    if call["method"] == "slow":
+        return {"jsonrpc": "2.0", "id": call["id"], "result": "slow"}
+    return {"jsonrpc": "2.0", "id": call["id"],
+            "error": {"code": -32601, "message": "Method not found"}}
+
+async def _rpc_single(ws, call):
+    if call["method"] == "slow":
+        await asyncio.sleep(0.2)
+    if call["method"] == "getNetworkState":
+        await ws.send_json({"jsonrpc": "2.0", "method": "networkState",
+                            "params": {"ipv4": "127.0.0.1"}})
+    await ws.send_json(_rpc_reply(call))
+
+async def h_rpc(r):
+    # JSON-RPC over WebSocket: batches answered in reverse order as one
+    # array, single calls answered concurrently
+    ws = web.WebSocketResponse()
+    await ws.prepare(r)
+    async for msg in ws:
+        payload = json.loads(msg.data)
+        if isinstance(payload, list):
+            await ws.send_json([_rpc_reply(c) for c in reversed(payload)])
+        else:
+            asyncio.create_task(_rpc_single(ws, payload))
+    return ws
+
+# Signaling sockets opened, and the one each offer arrived on
+_SIGNALING_SOCKETS = []
+_OFFER_SOCKETS = []
+
+async def h_signaling(r):
+    # Minimal WebRTC signaling: "ping" -> "pong", offer -> answer
+    ws = web.WebSocketResponse()
+    await ws.prepare(r)
+    _SIGNALING_SOCKETS.append(ws)
+    async for msg in ws:
+        if msg.data == "ping":
+            await ws.send_str("pong")
+            continue
+        if msg.data == "garble":
+            await ws.send_str("{not json")
+            continue
+        payload = json.loads(msg.data)
+        # JSON-RPC (single calls or batch arrays) is ignored, as by old firmware
+        if isinstance(payload, dict) and payload.get("type") == "offer":
+            _OFFER_SOCKETS.append(ws)
+            answer = json.dumps({"type": "answer", "sdp": "v=0 mock-answer"})
+            await ws.send_json({"type": "answer",
+                                "data": base64.b64encode(answer.encode()).decode()})
+    return ws
+
+# Signaling socket accepted and closed straight away
+_DROPPED_SOCKETS = []
+
+async def h_drop_signaling(r):
+    ws = web.WebSocketResponse()
+    await ws.prepare(r)
+    _DROPPED_SOCKETS.append(ws)
+    await ws.close()
+    return ws
+
+# Legacy firmware: no signaling WebSocket, HTTP offer/answer only
+_LEGACY_WS_ATTEMPTS = []
+
+async def h_no_signaling(r):
+    _LEGACY_WS_ATTEMPTS.append(1)
+    return web.Response(status=404)
+
+async def h_webrtc_session(r):
+    answer = json.dumps({"type": "answer", "sdp": "v=0 legacy-answer"})
+    return web.json_response({"sd": base64.b64encode(answer.encode()).decode()})
+
+# Native login: counts POSTs, issues a one-hour session cookie
+_LOGINS = []
+
+async def h_login(r):
+    _LOGINS.append(1)
+    body = await r.json()
+    if body.get("password") != "secret":
+        return web.json_response({"error": "invalid password"}, status=401)
+    resp = web.json_response({"message": "Login successful"})
+    resp.set_cookie("authToken", f"token-{len(_LOGINS)}", max_age=3600)
+    return resp
+
+async def _info_dict():
     mem_total = 262144
     mem_avail = 131072
     disk_total = 524288
     disk_used = 200000
-    return web.json_response({
+    return {
         "api_version": "1.0.0",
         "deviceModel": "JetKVM",
         "serial_number": "18cb28a5431d2479",
@@ -54,7 +178,7 @@ async def h_info(r):
         "disk_used_kb": disk_used,
         "disk_available_kb": disk_total - disk_used,
         "disk_used_pct": round(disk_used / disk_total * 100, 1),
-    })
+    }
 
 async def run_tests():
     # ---- start mock server on a random free port ----
@@ -62,6 +186,15 @@ async def run_tests():
     app.router.add_get("/health", h_health)
     app.router.add_get("/temperature", h_temp)
     app.router.add_get("/device_info", h_info)
+    app.router.add_get("/metrics", h_metrics)
+    app.router.add_get("/inventory", h_inventory)
+    app.router.add_get("/slow", h_slow)
+    app.router.add_get("/rpc", h_rpc)
+    app.router.add_get("/signaling", h_signaling)
+    app.router.add_get("/no-signaling", h_no_signaling)
+    app.router.add_get("/drop-signaling", h_drop_signaling)
+    app.router.add_post("/webrtc/session", h_webrtc_session)
+    app.router.add_post("/auth/login-local", h_login)
 
     runner = web.AppRunner(app)
     await runner.setup()
@@ -83,6 +216,7 @@ async def run_tests():
     spec.loader.exec_module(client_mod)
     JetKVMClient = client_mod.JetKVMClient
     JetKVMConnectionError = client_mod.JetKVMConnectionError
+    JetKVMNotFoundError = client_mod.JetKVMNotFoundError
 
     client = JetKVMClient(host="127.0.0.1", port=port)
 
@@ -141,13 +275,342 @@ async def run_tests():
     ok("has disk_available_kb key", "disk_available_kb" in data)
     ok("has api_version key", "api_version" in data)
 
-    # Test 5: validate_connection
+    # Test 5: hot / cold tiers
+    print("--- get_metrics / get_inventory ---")
+    hot = await client.get_metrics()
+    ok("metrics has temperature", "temperature" in hot)
+    ok("metrics has no identity", "serial_number" not in hot)
+    cold = await client.get_inventory()
+    ok("inventory has serial_number", "serial_number" in cold)
+    ok("inventory has disk_used_pct", "disk_used_pct" in cold)
+    ok("inventory has no temperature", "temperature" not in cold)
+    try:
+        await client._get_json("/missing")
+        ok("raises on 404", False, "no exception raised")
+    except JetKVMNotFoundError:
+        ok("raises JetKVMNotFoundError on 404", True)
+
+    # Test 6: conditional requests (ETag / If-None-Match)
+    print("--- conditional GET ---")
+    _INVENTORY_STATUS.clear()
+    again = await client.get_inventory()
+    ok("sends If-None-Match", _INVENTORY_STATUS == [304], f"got {_INVENTORY_STATUS}")
+    ok("304 returns the cached dict", again is cold)
+
+    # Test 7: validate_connection
     print("--- validate_connection ---")
     vc = await client.validate_connection()
     ok("returns dict", isinstance(vc, dict))
     ok("has deviceModel", vc.get("deviceModel") == "JetKVM")
 
-    # Test 6: connection to wrong port fails correctly
+    # Test 8: polls reuse one keep-alive connection
+    print("--- keep-alive ---")
+    _INFO_TRANSPORTS.clear()
+    for _ in range(3):
+        await client.get_device_info()
+    ok("reuses one connection", len(_INFO_TRANSPORTS) == 1, f"got {len(_INFO_TRANSPORTS)}")
+
+    # Test 9: clients can share one session without closing it
+    print("--- shared session ---")
+    shared = client_mod.create_api_session()
+    first = JetKVMClient(host="127.0.0.1", port=port, session=shared)
+    second = JetKVMClient(host="127.0.0.1", port=port, session=shared)
+    ok("first client works", await first.check_health() is True)
+    await first.close()
+    ok("shared session stays open", not shared.closed)
+    ok("second client works", await second.check_health() is True)
+    await second.close()
+    await shared.close()
+
+    # Test 10: JSON-RPC multiplexing on one WebSocket
+    print("--- JSON-RPC channel ---")
+    rpc_session = aiohttp.ClientSession()
+    notes = []
+    channel = client_mod._JSONRPCChannel(
+        await rpc_session.ws_connect(f"ws://127.0.0.1:{port}/rpc"),
+        on_notification=lambda method, params: notes.append(method),
+    )
+    slow, device_id = await asyncio.gather(
+        channel.call("slow"), channel.call("getDeviceID")
+    )
+    ok("pipelined calls matched by id", (slow, device_id) == ("slow", "18cb28a5431d2479"),
+       f"got {slow!r}, {device_id!r}")
+    results = await channel.batch(
+        [("getDeviceID", None), ("getNetworkState", None), ("bogus", None)]
+    )
+    ok("batch results in call order", results[0] == "18cb28a5431d2479"
+       and results[1].get("hostname") == "jetkvm-mock", f"got {results}")
+    ok("batch error per call", isinstance(results[2], client_mod.JetKVMRPCError))
+    await channel.call("getNetworkState")
+    ok("notification dispatched", notes == ["networkState"], f"got {notes}")
+    await channel.close()
+    ok("channel closed", channel.closed)
+    await rpc_session.close()
+
+    # Firmware that ignores JSON-RPC on an open socket is reported as such
+    defaults = (client_mod._JSONRPCChannel.call.__defaults__,
+                client_mod._JSONRPCChannel.batch.__defaults__)
+    client_mod._JSONRPCChannel.call.__defaults__ = (None, 0.1)
+    client_mod._JSONRPCChannel.batch.__defaults__ = (0.1,)
+    mute = JetKVMClient(host="127.0.0.1", port=port, password="secret")
+    await mute._get_native_session()
+    mute._authenticated = True
+    mute._native_ws_url = lambda: f"ws://127.0.0.1:{port}/signaling"
+    try:
+        await mute.async_run_telemetry(lambda fields: None, interval=0.1)
+        ok("silent firmware raises", False, "no exception raised")
+    except client_mod.JetKVMNotSupportedError:
+        ok("silent firmware reported as unsupported", True)
+    await mute.close()
+    _SIGNALING_SOCKETS.clear()
+    (client_mod._JSONRPCChannel.call.__defaults__,
+     client_mod._JSONRPCChannel.batch.__defaults__) = defaults
+
+    # A socket the device closes at once counts as a failed pre-warm
+    retry = client_mod._SIGNALING_PREWARM_RETRY
+    client_mod._SIGNALING_PREWARM_RETRY = 0.05
+    dropping = JetKVMClient(host="127.0.0.1", port=port, password="secret")
+    await dropping._get_native_session()
+    dropping._authenticated = True
+    dropping._native_ws_url = lambda: f"ws://127.0.0.1:{port}/drop-signaling"
+    dropping.async_start_prewarm()
+    await asyncio.wait_for(dropping._prewarm_task, 2)
+    ok("early close backs off and gives up",
+       len(_DROPPED_SOCKETS) == client_mod._SIGNALING_PREWARM_ATTEMPTS,
+       f"got {len(_DROPPED_SOCKETS)} connects")
+    await dropping.close()
+    client_mod._SIGNALING_PREWARM_RETRY = retry
+
+    # Test 11: offers go out on the pre-warmed signaling socket
+    print("--- pre-warmed signaling ---")
+    warm = JetKVMClient(host="127.0.0.1", port=port, password="secret")
+    await warm._get_native_session()
+    warm._authenticated = True   # skip the port-80 login
+    warm._native_ws_url = lambda: f"ws://127.0.0.1:{port}/signaling"
+    warm.async_start_prewarm()
+    for _ in range(50):
+        if warm._warm_ws is not None:
+            break
+        await asyncio.sleep(0.02)
+    ok("socket pre-connected", len(_SIGNALING_SOCKETS) == 1, f"got {len(_SIGNALING_SOCKETS)}")
+    answer = await warm.async_webrtc_offer("v=0 mock-offer")
+    ok("answer received", answer == "v=0 mock-answer", f"got {answer!r}")
+    ok("offer used warm socket", _OFFER_SOCKETS[:1] == _SIGNALING_SOCKETS[:1])
+    for _ in range(50):
+        if warm._warm_ws is not None:
+            break
+        await asyncio.sleep(0.02)
+    ok("replacement warmed", len(_SIGNALING_SOCKETS) == 2, f"got {len(_SIGNALING_SOCKETS)}")
+    ok("WS signaling cached", warm.signaling_mode == client_mod.SIGNALING_WS)
+    await warm.close()
+
+    # Test 12: legacy firmware — race finds HTTP signaling and caches it
+    print("--- signaling capability cache ---")
+    legacy = JetKVMClient(host="127.0.0.1", port=port, password="secret",
+                          race_signaling=True)
+    await legacy._get_native_session()
+    legacy._authenticated = True
+    legacy._native_url = f"http://127.0.0.1:{port}"
+    legacy._native_ws_url = lambda: f"ws://127.0.0.1:{port}/no-signaling"
+    answer = await legacy.async_webrtc_offer("v=0 mock-offer")
+    ok("legacy answer received", answer == "v=0 legacy-answer", f"got {answer!r}")
+    ok("HTTP signaling cached", legacy.signaling_mode == client_mod.SIGNALING_HTTP)
+    attempts = len(_LEGACY_WS_ATTEMPTS)
+    await legacy.async_webrtc_offer("v=0 mock-offer")
+    ok("WS skipped once cached", len(_LEGACY_WS_ATTEMPTS) == attempts,
+       f"got {len(_LEGACY_WS_ATTEMPTS) - attempts} extra")
+    await legacy.close()
+
+    # Test 13: session cookie export / restore across restarts
+    print("--- session cookie persistence ---")
+    first = JetKVMClient(host="127.0.0.1", port=port, password="secret")
+    first._native_url = f"http://127.0.0.1:{port}"
+    await first.async_refresh_auth()
+    state = first.export_auth()
+    ok("cookie exported", state is not None and state["cookies"].get("authToken"),
+       f"got {state}")
+    ok("expiry from Max-Age", state is not None
+       and 3500 < state["expires"] - time.time() <= 3600, f"got {state}")
+    await first.close()
+    second = JetKVMClient(host="127.0.0.1", port=port, password="secret")
+    second._native_url = f"http://127.0.0.1:{port}"
+    logins = len(_LOGINS)
+    ok("restores saved cookie", await second.async_restore_auth(state) is True)
+    await second._ensure_authenticated()
+    ok("no login after restore", len(_LOGINS) == logins, f"got {len(_LOGINS) - logins}")
+    ok("cookie sent again", second.export_auth()["cookies"] == state["cookies"])
+    expired = {**state, "expires": time.time() - 1}
+    ok("rejects expired cookie", await JetKVMClient(host="127.0.0.1").async_restore_auth(expired) is False)
+    await second.close()
+
+    # Test 14: concurrent logins are coalesced into one POST
+    print("--- single-flight login ---")
+    crowd = JetKVMClient(host="127.0.0.1", port=port, password="secret")
+    crowd._native_url = f"http://127.0.0.1:{port}"
+    logins = len(_LOGINS)
+    await asyncio.gather(*(crowd._ensure_authenticated() for _ in range(5)))
+    ok("one login POST", len(_LOGINS) - logins == 1, f"got {len(_LOGINS) - logins}")
+    ok("four callers coalesced", crowd.auth_stats.coalesced == 4,
+       f"got {crowd.auth_stats}")
+    login_stats = crowd.endpoint_stats[client_mod.AUTH_PATH]
+    ok("login timed", login_stats.requests == 1 and login_stats.last_latency is not None,
+       f"got {login_stats}")
+    await crowd.close()
+
+    # Test 15: signaling session table is bounded and reaped
+    print("--- signaling session reaper ---")
+    limits = (client_mod._WEBRTC_MAX_SESSIONS, client_mod._WEBRTC_SESSION_IDLE_TIMEOUT,
+              client_mod._WEBRTC_REAP_INTERVAL)
+    client_mod._WEBRTC_MAX_SESSIONS = 2
+    client_mod._WEBRTC_SESSION_IDLE_TIMEOUT = 0.3
+    client_mod._WEBRTC_REAP_INTERVAL = 0.05
+    table = JetKVMClient(host="127.0.0.1", port=port, password="secret")
+    await table._get_native_session()
+    table._authenticated = True
+    table._native_ws_url = lambda: f"ws://127.0.0.1:{port}/signaling"
+    await table.async_webrtc_offer("v=0 mock-offer", session_id="a")
+    await table.async_webrtc_offer("v=0 mock-offer", session_id="b")
+    await table.async_webrtc_candidate("a", {"candidate": "candidate:1 1 udp 1 10.0.0.1 9 typ host"})
+    await table.async_webrtc_offer("v=0 mock-offer", session_id="c")
+    ok("least recently used evicted", sorted(table._webrtc_ws_sessions) == ["a", "c"],
+       f"got {sorted(table._webrtc_ws_sessions)}")
+    rows = table.diagnostics()["webrtc_sessions"]
+    ok("session table oldest first", [row["session_id"] for row in rows] == ["a", "c"]
+       and rows[0]["age_s"] >= rows[1]["age_s"] and all(row["socket_open"] for row in rows),
+       f"got {rows}")
+    await _OFFER_SOCKETS[-1].close()
+    for _ in range(50):
+        if "c" not in table._webrtc_ws_sessions:
+            break
+        await asyncio.sleep(0.01)
+    ok("device close drops session", "c" not in table._webrtc_ws_sessions)
+    await table.async_webrtc_offer("v=0 mock-offer", session_id="d")
+    garbled = table._webrtc_ws_sessions["d"]
+    await garbled.ws.send_str("garble")
+    await asyncio.wait_for(garbled.reader_task, 1)
+    ok("failed reader closes its socket", "d" not in table._webrtc_ws_sessions
+       and garbled.ws.closed, f"closed={garbled.ws.closed}")
+    await asyncio.sleep(0.5)
+    ok("session answering pings kept", list(table._webrtc_ws_sessions) == ["a"],
+       f"got {list(table._webrtc_ws_sessions)}")
+    silent = table._webrtc_ws_sessions["a"]
+
+    async def _swallow(data):
+        pass
+
+    silent.ws.send_str = _swallow   # pings never reach the device
+    await asyncio.sleep(0.5)
+    ok("session without pongs reaped", table.webrtc_session_count == 0,
+       f"got {table.webrtc_session_count}")
+    ok("reaper stopped", table._reaper_task.done())
+    await table.close()
+    (client_mod._WEBRTC_MAX_SESSIONS, client_mod._WEBRTC_SESSION_IDLE_TIMEOUT,
+     client_mod._WEBRTC_REAP_INTERVAL) = limits
+
+    # Test 16: circuit breaker fails fast for an unreachable device
+    print("--- circuit breaker ---")
+    import socket
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        dead_port = sock.getsockname()[1]
+    quick = client_mod.JetKVMRetryPolicy(attempts=5, delay=0.1)
+    dead = JetKVMClient(host="127.0.0.1", port=dead_port, api_retry=quick)
+    try:
+        await dead.get_metrics()
+        ok("dead device raises", False, "no exception raised")
+    except JetKVMConnectionError:
+        ok("probe after second failure stops retries",
+           dead.endpoint_stats["/metrics"].retries == 1,
+           f"got {dead.endpoint_stats['/metrics']}")
+    ok("breaker opened", dead.breaker_state == client_mod.BREAKER_OPEN)
+    started = time.monotonic()
+    try:
+        await dead.get_inventory()
+    except JetKVMConnectionError as err:
+        ok("open breaker fails at once", time.monotonic() - started < 0.05
+           and "unreachable" in str(err), f"got {err}")
+    dead._breaker._retry_at = 0
+    try:
+        await dead.get_metrics()
+    except JetKVMConnectionError:
+        ok("failed probe doubles delay", dead._breaker.delay == 2 * client_mod._BREAKER_OPEN_DELAY,
+           f"got {dead._breaker.delay}")
+    dead._port, dead._base_url = port, f"http://127.0.0.1:{port}"
+    dead._breaker._retry_at = 0
+    metrics = await dead.get_metrics()
+    ok("half-open probe recovers", "temperature" in metrics
+       and dead.breaker_state == client_mod.BREAKER_CLOSED, f"state {dead.breaker_state}")
+    await dead.close()
+    single = JetKVMClient(host="127.0.0.1", port=dead_port, api_retry=quick)
+    single._single_shot = True
+    probes = []
+
+    async def _counting_probe():
+        probes.append(1)
+        return False
+
+    single._async_probe = _counting_probe
+    try:
+        await single.get_metrics()
+    except JetKVMConnectionError:
+        ok("single-shot mode never probes", not probes
+           and single.endpoint_stats["/metrics"].retries == 4,
+           f"{len(probes)} probes, {single.endpoint_stats['/metrics']}")
+    await single.close()
+
+    # Test 17: retry policy — latency-aware read timeouts and a time budget
+    print("--- retry policy ---")
+    fast = JetKVMClient(host="127.0.0.1", port=port)
+    for _ in range(5):
+        await fast.get_metrics()
+    p95 = fast.latency_p95("/metrics")
+    ok("p95 observed", p95 is not None and p95 < 0.5, f"got {p95}")
+    ok("LAN device gets the shortest timeout",
+       client_mod.API_RETRY_POLICY.adaptive_read_timeout(p95)
+       == client_mod.API_RETRY_POLICY.min_read_timeout)
+    stats = fast.endpoint_stats["/metrics"]
+    ok("calls and latencies counted", stats.requests == 5 and sum(stats.histogram) == 5,
+       f"got {stats}")
+    diag = fast.diagnostics()["endpoints"]["/metrics"]
+    ok("diagnostics in ms", diag["requests"] == 5 and diag["p95_ms"] is not None
+       and sum(diag["histogram"].values()) == 5, f"got {diag}")
+    ok("bytes received counted", diag["bytes_received"] > 0, f"got {diag}")
+    await fast.close()
+    growing = client_mod.JetKVMRetryPolicy(
+        attempts=3, delay=0, read_timeout=0.2, max_read_timeout=2.0
+    )
+    slow = JetKVMClient(host="127.0.0.1", port=port, api_retry=growing)
+    data = await slow._get_json("/slow")
+    ok("timeout grows after a timed-out attempt", data.get("status") == "ok", f"got {data}")
+    ok("retries counted", slow.endpoint_stats["/slow"].retries == 2,
+       f"got {slow.endpoint_stats['/slow']}")
+    await slow.close()
+    budgeted = client_mod.JetKVMRetryPolicy(
+        attempts=10, delay=0, budget=1.0, read_timeout=0.3, max_read_timeout=0.3
+    )
+    capped = JetKVMClient(host="127.0.0.1", port=port, api_retry=budgeted)
+    started = time.monotonic()
+    try:
+        await capped._get_json("/slow")
+        ok("budget enforced", False, "no exception raised")
+    except JetKVMConnectionError:
+        ok("budget enforced", time.monotonic() - started < 1.2,
+           f"took {time.monotonic() - started:.1f}s")
+    await capped.close()
+    spent = client_mod.JetKVMRetryPolicy(budget=0.0)
+    late = JetKVMClient(host="127.0.0.1", port=port, password="secret", webrtc_retry=spent)
+    late._native_url = f"http://127.0.0.1:{port}"
+    await late._get_native_session()
+    late._authenticated = True
+    try:
+        await late._async_webrtc_offer_http("v=0 mock-offer")
+        ok("spent budget raises", False, "no exception raised")
+    except JetKVMConnectionError as err:
+        ok("spent budget is not an auth failure",
+           not isinstance(err, client_mod.JetKVMAuthError), f"got {err!r}")
+    await late.close()
+
+    # Test 18: connection to wrong port fails correctly
     print("--- connection error handling ---")
     bad_client = JetKVMClient(host="127.0.0.1", port=1)
     try:
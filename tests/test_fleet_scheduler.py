@@ -0,0 +1,79 @@
+"""Tests for the fleet poll scheduler.
+
+Usage:
+    python tests/test_fleet_scheduler.py
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+import time
+from datetime import timedelta
+
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+FLEET_PATH = os.path.join(ROOT, "custom_components", "jetkvm", "fleet.py")
+
+
+def _load_fleet_module():
+    spec = importlib.util.spec_from_file_location("jetkvm_fleet", FLEET_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+class _Poller:
+    running = 0
+    peak = 0
+
+    def __init__(self, interval: float) -> None:
+        self.poll_interval = timedelta(seconds=interval)
+        self.polls: list[float] = []
+
+    async def async_refresh(self) -> None:
+        _Poller.running += 1
+        _Poller.peak = max(_Poller.peak, _Poller.running)
+        self.polls.append(time.monotonic())
+        await asyncio.sleep(0.03)
+        _Poller.running -= 1
+
+
+async def _run(module) -> None:
+    fleet = module.JetKVMFleetScheduler(max_concurrent=2)
+    pollers = [_Poller(0.4) for _ in range(6)]
+    start = time.monotonic()
+    removers = [fleet.async_add(poller) for poller in pollers]
+    await asyncio.sleep(1.3)
+
+    counts = [len(poller.polls) for poller in pollers]
+    assert all(3 <= count <= 4 for count in counts), counts
+    assert _Poller.peak <= 2, _Poller.peak
+
+    # First polls are spread over the interval, not bunched at the start
+    firsts = sorted(poller.polls[0] - start for poller in pollers)
+    assert firsts[-1] - firsts[0] > 0.2, firsts
+
+    # Phase is kept: polls stay one interval apart
+    gaps = [b - a for a, b in zip(pollers[0].polls, pollers[0].polls[1:])]
+    assert all(0.3 < gap < 0.5 for gap in gaps), gaps
+
+    removers[0]()
+    before = len(pollers[0].polls)
+    await asyncio.sleep(0.5)
+    assert len(pollers[0].polls) == before
+    assert fleet.size == 5
+
+    await fleet.async_close()
+    assert fleet.size == 0
+
+
+def main() -> None:
+    module = _load_fleet_module()
+    asyncio.run(_run(module))
+    print("PASS: test_fleet_scheduler")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Tests for the coordinator's adaptive interval and poll traces.
+
+Usage:
+    python tests/test_polling.py
+"""
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+from datetime import timedelta
+
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+POLLING_PATH = os.path.join(ROOT, "custom_components", "jetkvm", "polling.py")
+
+
+def _load_polling_module():
+    spec = importlib.util.spec_from_file_location("jetkvm_polling", POLLING_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    # dataclasses resolve string annotations through sys.modules
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _interval(module):
+    return module.AdaptiveInterval(
+        timedelta(seconds=30), timedelta(seconds=15), timedelta(seconds=300)
+    )
+
+
+def _test_adaptive_interval(module) -> None:
+    # Rising load shortens the interval, ordinary change returns to base
+    adaptive = _interval(module)
+    assert adaptive.on_success({"temperature": 45.0, "load_average": 0.5}) == timedelta(seconds=30)
+    assert adaptive.on_success({"temperature": 45.0, "load_average": 1.2}) == timedelta(seconds=15)
+    assert adaptive.on_success({"temperature": 45.0, "load_average": 0.9}) == timedelta(seconds=30)
+
+    # Hot SoC or high load clamps to the minimum, even without a trend
+    hot = _interval(module)
+    assert hot.on_success({"temperature": 75.0, "load_average": 0.1}) == timedelta(seconds=15)
+    busy = _interval(module)
+    assert busy.on_success({"temperature": 40.0, "load_average": 2.5}) == timedelta(seconds=15)
+
+    # Flat readings back off exponentially, capped at the maximum
+    flat = _interval(module)
+    seen = [
+        flat.on_success({"temperature": 45.0 + (i % 2) * 0.1, "load_average": 0.3}).total_seconds()
+        for i in range(9)
+    ]
+    assert seen == [30, 30, 30, 60, 120, 240, 300, 300, 300], seen
+
+    # Failures back off too; the next rising reading polls fast again
+    failing = _interval(module)
+    seen = [failing.on_failure().total_seconds() for _ in range(5)]
+    assert seen == [60, 120, 240, 300, 300], seen
+    failing.on_success({"temperature": 45.0})
+    assert failing.on_success({"temperature": 47.0}) == timedelta(seconds=15)
+
+
+def _test_poll_cycle(module) -> None:
+    cycle = module.PollCycle()
+    fetched = cycle.fetched()
+    previous = {"temperature": 40.0, "load_average": 0.3, "api_version": "2"}
+    cycle.parsed(fetched, {"temperature": 41.0, "load_average": 0.3}, previous)
+    cycle.finish(retries=1, bytes_received=512)
+    trace = cycle.as_dict()
+    assert trace["changed"] == ["api_version", "temperature"], trace
+    assert trace["fetch_ms"] is not None and trace["parse_ms"] is not None, trace
+    assert trace["retries"] == 1 and trace["bytes_received"] == 512, trace
+    assert trace["error"] is None, trace
+
+    failed = module.PollCycle()
+    try:
+        raise ConnectionError("Cannot connect to JetKVM API")
+    except ConnectionError as err:
+        failed.failed(err)
+    failed.finish(retries=2, bytes_received=0)
+    trace = failed.as_dict()
+    assert trace["error"] == "ConnectionError: Cannot connect to JetKVM API", trace
+    assert trace["fetch_ms"] is not None and trace["parse_ms"] is None, trace
+
+
+def main() -> None:
+    module = _load_polling_module()
+    _test_adaptive_interval(module)
+    _test_poll_cycle(module)
+    print("PASS: test_polling")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ Usage:
 """
 from __future__ import annotations
 
+import asyncio
 import importlib.util
 import os
 
@@ -41,10 +42,72 @@ def test_candidate_to_dict_object(module) -> None:
     assert out["sdpMLineIndex"] == 0
 
 
+def _cand(text: str) -> dict:
+    return {"candidate": text, "sdpMid": "0", "sdpMLineIndex": 0}
+
+
+HOST = _cand("candidate:1 1 UDP 2122252543 203.0.113.7 5000 typ host")
+SRFLX = _cand("candidate:2 1 UDP 1686052607 203.0.113.7 5000 typ srflx raddr 0.0.0.0 rport 0")
+OTHER = _cand("candidate:3 1 UDP 2122252543 192.168.1.2 5001 typ host")
+
+
+def test_candidate_key_ignores_type(module) -> None:
+    assert module._candidate_key(HOST) == module._candidate_key(SRFLX)
+    assert module._candidate_key(HOST) != module._candidate_key(OTHER)
+    assert module._candidate_key({"candidate": ""}) is None
+
+
+def test_candidate_batch_dedupes(module) -> None:
+    batches: list[list[dict]] = []
+
+    async def _flush(batch: list[dict]) -> None:
+        batches.append(batch)
+
+    async def _run() -> None:
+        batch = module._CandidateBatch(_flush, delay=0.01)
+        batch.add(SRFLX)
+        batch.add(HOST)
+        batch.add(OTHER)
+        await asyncio.sleep(0.05)
+        batch.add(HOST)
+        batch.add(_cand(""))
+        await asyncio.sleep(0.05)
+        assert batch.dropped == 2
+
+    asyncio.run(_run())
+    # srflx replaced by the higher-priority host; resent host dropped
+    assert batches == [[HOST, OTHER], [_cand("")]]
+
+
+def test_candidate_policy(module) -> None:
+    mdns = _cand("candidate:4 1 UDP 2122252543 0b7c-4d.local 5002 typ host")
+    link_local = _cand("candidate:5 1 UDP 2122252543 fe80::1 5003 typ host")
+    relay = _cand("candidate:6 1 UDP 41885439 198.51.100.9 3478 typ relay raddr 0.0.0.0 rport 0")
+    everything = module.JetKVMCandidatePolicy()
+    assert all(everything.allows(c) for c in (HOST, mdns, link_local, relay))
+
+    lan = module.JetKVMCandidatePolicy(lan_only=True)
+    assert lan.allows(HOST) and lan.allows(_cand(""))
+    assert not any(lan.allows(c) for c in (mdns, link_local, relay))
+
+    subnets = module.JetKVMCandidatePolicy.from_options(False, "192.168.1.0/24, fd00::/64")
+    assert subnets.allows(OTHER)
+    assert not subnets.allows(HOST) and not subnets.allows(mdns)
+    try:
+        module.JetKVMCandidatePolicy.from_options(False, "192.168.1.0/33")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("bad subnet accepted")
+
+
 def main() -> None:
     module = _load_client_module()
     test_candidate_to_dict_passthrough(module)
     test_candidate_to_dict_object(module)
+    test_candidate_key_ignores_type(module)
+    test_candidate_batch_dedupes(module)
+    test_candidate_policy(module)
     print("PASS: test_webrtc_candidate_utils")
 
 